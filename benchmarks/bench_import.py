@@ -0,0 +1,61 @@
+"""Import time of a typical quirks module.
+
+Run with `python benchmarks/bench_import.py`.
+"""
+
+import subprocess
+import sys
+
+QUIRK_IMPORTS = (
+    "from tuya_device_handlers import TUYA_QUIRKS_REGISTRY;"
+    "from tuya_device_handlers.builder import TuyaDeviceQuirk;"
+    "from tuya_device_handlers.device_wrapper.common import"
+    " DPCodeBooleanWrapper"
+)
+RUNS = 20
+
+
+def _measure() -> list[tuple[str, int, int]]:
+    """Return the (module, self, cumulative) import times, in µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", QUIRK_IMPORTS],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, module = line.removeprefix(
+            "import time:"
+        ).split("|")
+        if self_us.strip().isdigit():
+            timings.append((module.rstrip(), int(self_us), int(cumulative_us)))
+    return timings
+
+
+def main() -> None:
+    """Print the median import time, and the slowest modules."""
+    totals: list[int] = []
+    timings: list[tuple[str, int, int]] = []
+    for _ in range(RUNS):
+        timings = _measure()
+        totals.append(
+            sum(
+                cumulative
+                for module, _, cumulative in timings
+                if module.startswith(" tuya_device_handlers")
+            )
+        )
+    totals.sort()
+    print(f"median: {totals[len(totals) // 2] / 1000:.2f} ms ({RUNS} runs)")
+    print("slowest modules (self time, last run):")
+    for module, self_us, cumulative_us in sorted(
+        timings, key=lambda timing: timing[1], reverse=True
+    )[:15]:
+        print(f"  {self_us:>7} µs {cumulative_us:>7} µs {module.strip()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Memory benchmark of type information and definition dataclasses.
+
+Compares the per-instance size of the slotted dataclasses with an
+equivalent plain dataclass (the previous layout).
+
+Run with `python benchmarks/bench_memory.py`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import dataclasses
+import gc
+import tracemalloc
+from typing import Any
+
+from tuya_device_handlers.builder.base_quirk import (
+    DatapointDefinition,
+    TuyaSensorDefinition,
+)
+from tuya_device_handlers.const import DPType
+from tuya_device_handlers.type_information import (
+    EnumTypeInformation,
+    IntegerTypeInformation,
+)
+
+INSTANCES = 10_000
+
+
+def _plain_dataclass(cls: type[Any]) -> type[Any]:
+    """Create an equivalent dataclass, without slots."""
+    return dataclasses.make_dataclass(
+        f"Plain{cls.__name__}",
+        [(field.name, field.type, field) for field in dataclasses.fields(cls)],
+        kw_only=True,
+    )
+
+
+def _bytes_per_instance(
+    cls: type[Any], factory: Callable[[type[Any], int], Any]
+) -> float:
+    """Measure the memory allocated per instance."""
+    gc.collect()
+    tracemalloc.start()
+    instances = [factory(cls, index) for index in range(INSTANCES)]
+    current, _peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Exclude the list holding the instances
+    return (current - len(instances) * 8) / INSTANCES
+
+
+def _none_generator(device: Any) -> None:
+    return None
+
+
+CASES: dict[type[Any], Callable[[type[Any], int], Any]] = {
+    IntegerTypeInformation: lambda cls, index: cls(
+        dpcode="cur_power",
+        type_data="{}",
+        min=0,
+        max=index,
+        scale=1,
+        step=1,
+        unit="W",
+        report_type=None,
+    ),
+    EnumTypeInformation: lambda cls, index: cls(
+        dpcode="mode", type_data="{}", range=("auto", "manual")
+    ),
+    DatapointDefinition: lambda cls, index: cls(
+        dpid=index, dpcode="switch", dptype=DPType.BOOLEAN
+    ),
+    TuyaSensorDefinition: lambda cls, index: cls(
+        key="power", dp_type=_none_generator
+    ),
+}
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"{'class':<25}{'before':>10}{'after':>10}  (bytes per instance)")
+    for cls, factory in CASES.items():
+        before = _bytes_per_instance(_plain_dataclass(cls), factory)
+        after = _bytes_per_instance(cls, factory)
+        print(f"{cls.__name__:<25}{before:>10.1f}{after:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark of StatusReader against per-wrapper reads.
+
+Reads all the wrappers of a device with 50 entities, either by calling
+`read_device_status` on every wrapper, or with a single `read_all` pass.
+
+Run with `python benchmarks/bench_read_all.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+from types import SimpleNamespace
+from typing import Any
+
+from tuya_device_handlers.device_wrapper import DeviceWrapper, StatusReader
+from tuya_device_handlers.device_wrapper.binary_sensor import (
+    DPCodeBitmapBitWrapper,
+)
+from tuya_device_handlers.device_wrapper.common import (
+    DPCodeBooleanWrapper,
+    DPCodeEnumWrapper,
+    DPCodeIntegerWrapper,
+)
+from tuya_device_handlers.device_wrapper.sensor import (
+    ElectricityCurrentJsonWrapper,
+    ElectricityCurrentRawWrapper,
+    ElectricityPowerJsonWrapper,
+    ElectricityPowerRawWrapper,
+    ElectricityVoltageJsonWrapper,
+    ElectricityVoltageRawWrapper,
+)
+from tuya_device_handlers.type_information import (
+    BitmapTypeInformation,
+    BooleanTypeInformation,
+    EnumTypeInformation,
+    IntegerTypeInformation,
+    JsonTypeInformation,
+    RawTypeInformation,
+)
+
+NUMBER = 20_000
+RAW_ELECTRICITY = "AQ8JKgAD6AACLQAAAAAAAAAAAGQ="
+JSON_ELECTRICITY = '{"electricCurrent": 1.5, "power": 0.3, "voltage": 230.1}'
+
+
+def _create_wrappers() -> tuple[dict[str, Any], dict[str, DeviceWrapper[Any]]]:
+    """Create the status and the 50 wrappers of the device."""
+    status: dict[str, Any] = {}
+    wrappers: dict[str, DeviceWrapper[Any]] = {}
+    for index in range(10):
+        dpcode = f"switch_{index}"
+        status[dpcode] = index % 2 == 0
+        wrappers[dpcode] = DPCodeBooleanWrapper(
+            dpcode,
+            BooleanTypeInformation(dpcode=dpcode, type_data="{}"),
+        )
+    for index in range(10):
+        dpcode = f"value_{index}"
+        status[dpcode] = index * 10
+        wrappers[dpcode] = DPCodeIntegerWrapper(
+            dpcode,
+            IntegerTypeInformation(
+                dpcode=dpcode,
+                type_data="{}",
+                min=0,
+                max=1000,
+                scale=1,
+                step=1,
+                unit=None,
+                report_type=None,
+            ),
+        )
+    for index in range(10):
+        dpcode = f"mode_{index}"
+        status[dpcode] = "auto"
+        wrappers[dpcode] = DPCodeEnumWrapper(
+            dpcode,
+            EnumTypeInformation(
+                dpcode=dpcode, type_data="{}", range=("auto", "manual")
+            ),
+        )
+    fault = BitmapTypeInformation(
+        dpcode="fault",
+        type_data="{}",
+        label=tuple(f"fault_{i}" for i in range(8)),
+    )
+    status["fault"] = 0b10100101
+    for index in range(8):
+        wrappers[f"fault_{index}"] = DPCodeBitmapBitWrapper(
+            "fault", fault, index
+        )
+    for phase in ("a", "b", "c"):
+        dpcode = f"phase_{phase}"
+        status[dpcode] = RAW_ELECTRICITY
+        raw = RawTypeInformation(dpcode=dpcode, type_data="{}")
+        wrappers[f"{dpcode}_current"] = ElectricityCurrentRawWrapper(
+            dpcode, raw
+        )
+        wrappers[f"{dpcode}_power"] = ElectricityPowerRawWrapper(dpcode, raw)
+        wrappers[f"{dpcode}_voltage"] = ElectricityVoltageRawWrapper(
+            dpcode, raw
+        )
+    json = JsonTypeInformation(dpcode="total", type_data="{}")
+    status["total"] = JSON_ELECTRICITY
+    wrappers["total_current"] = ElectricityCurrentJsonWrapper("total", json)
+    wrappers["total_power"] = ElectricityPowerJsonWrapper("total", json)
+    wrappers["total_voltage"] = ElectricityVoltageJsonWrapper("total", json)
+    assert len(wrappers) == 50
+    return status, wrappers
+
+
+def main() -> None:
+    """Run the benchmark."""
+    status, wrappers = _create_wrappers()
+    device = SimpleNamespace(id="device_id", product_id="pid", status=status)
+    reader = StatusReader(wrappers)
+
+    def _per_wrapper() -> dict[str, Any]:
+        return {
+            key: wrapper.read_device_status(device)
+            for key, wrapper in wrappers.items()
+        }
+
+    assert reader.read_all(device) == _per_wrapper()
+    for name, function in (
+        ("read_device_status", _per_wrapper),
+        ("read_all", lambda: reader.read_all(device)),
+    ):
+        duration = min(timeit.repeat(function, number=NUMBER, repeat=5))
+        print(f"{name:>20}: {duration / NUMBER * 1e6:.2f} µs per device")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Lookup benchmark of the quirks registry with wildcard rules.
+
+Registers 10k prefix rules in a single category, and compares the lookup
+cost of exact, prefix and unmatched product ids, with and without the
+resolution cache.
+
+Run with `python benchmarks/bench_registry.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+from types import SimpleNamespace
+
+from tuya_device_handlers.builder import TuyaDeviceQuirk
+from tuya_device_handlers.registry import QuirksRegistry
+
+RULES = 10_000
+LOOKUPS = 100_000
+
+
+def main() -> None:
+    """Run the benchmark."""
+    registry = QuirksRegistry()
+    quirk = TuyaDeviceQuirk()
+    registry.register_many(
+        ("cz", f"prefix{index:05d}*", quirk) for index in range(RULES)
+    )
+    registry.register_many(
+        ("cz", f"exact{index:05d}", quirk) for index in range(RULES)
+    )
+
+    devices = {
+        "exact": SimpleNamespace(
+            id="device_id", category="cz", product_id="exact05000"
+        ),
+        "prefix": SimpleNamespace(
+            id="device_id", category="cz", product_id="prefix05000abcdef"
+        ),
+        "unmatched": SimpleNamespace(
+            id="device_id", category="cz", product_id="unknown0123456789"
+        ),
+    }
+    # Compile the matcher
+    registry.get_quirk_for_device(devices["prefix"])
+
+    for name, device in devices.items():
+        uncached = timeit.timeit(
+            lambda device=device: (
+                registry.clear_cache(),
+                registry.get_quirk_for_device(device),
+            ),
+            number=LOOKUPS,
+        )
+        cached = timeit.timeit(
+            lambda device=device: registry.get_quirk_for_device(device),
+            number=LOOKUPS,
+        )
+        print(
+            f"{name:>10}: {uncached / LOOKUPS * 1e9:8.1f} ns/lookup"
+            f" (cached: {cached / LOOKUPS * 1e9:6.1f} ns/lookup)"
+        )
+
+
+if __name__ == "__main__":
+    main()
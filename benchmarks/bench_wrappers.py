@@ -0,0 +1,134 @@
+"""Micro-benchmark of the specialized wrapper readers.
+
+Compares `read_device_status` of each wrapper type, with and without the
+specialized reader compiled by `initialize`.
+
+Run with `python benchmarks/bench_wrappers.py`.
+"""
+
+from __future__ import annotations
+
+import timeit
+from types import SimpleNamespace
+from typing import Any
+
+from tuya_device_handlers.device_wrapper.binary_sensor import (
+    DPCodeBitmapBitWrapper,
+)
+from tuya_device_handlers.device_wrapper.common import (
+    DPCodeBooleanWrapper,
+    DPCodeEnumWrapper,
+    DPCodeIntegerWrapper,
+    DPCodeJsonWrapper,
+    DPCodeRawWrapper,
+    DPCodeWrapper,
+)
+from tuya_device_handlers.device_wrapper.sensor import (
+    ElectricityCurrentJsonWrapper,
+    ElectricityPowerRawWrapper,
+    WindDirectionEnumWrapper,
+)
+from tuya_device_handlers.type_information import (
+    BitmapTypeInformation,
+    BooleanTypeInformation,
+    EnumTypeInformation,
+    IntegerTypeInformation,
+    JsonTypeInformation,
+    RawTypeInformation,
+)
+
+NUMBER = 200_000
+
+STATUS: dict[str, Any] = {
+    "bitmap": 0b0101,
+    "boolean": True,
+    "enum": "manual",
+    "integer": 235,
+    "json": '{"electricCurrent": 1.5, "power": 0.3, "voltage": 230.1}',
+    "raw": "AQ8JKgAD6AACLQAAAAAAAAAAAGQ=",
+    "wind": "south_west",
+}
+
+
+def _create_wrappers() -> list[DPCodeWrapper]:
+    """Create one wrapper per wrapper type."""
+    integer = IntegerTypeInformation(
+        dpcode="integer",
+        type_data="{}",
+        min=0,
+        max=1000,
+        scale=1,
+        step=1,
+        report_type=None,
+    )
+    json = JsonTypeInformation(dpcode="json", type_data="{}")
+    raw = RawTypeInformation(dpcode="raw", type_data="{}")
+    return [
+        DPCodeBitmapBitWrapper(
+            "bitmap",
+            BitmapTypeInformation(
+                dpcode="bitmap",
+                type_data="{}",
+                label=("a", "b", "c"),
+            ),
+            2,
+        ),
+        DPCodeBooleanWrapper(
+            "boolean",
+            BooleanTypeInformation(dpcode="boolean", type_data="{}"),
+        ),
+        DPCodeEnumWrapper(
+            "enum",
+            EnumTypeInformation(
+                dpcode="enum",
+                type_data="{}",
+                range=("auto", "manual", "eco"),
+            ),
+        ),
+        WindDirectionEnumWrapper(
+            "wind",
+            EnumTypeInformation(
+                dpcode="wind",
+                type_data="{}",
+                range=tuple(WindDirectionEnumWrapper._WIND_DIRECTIONS),
+            ),
+        ),
+        DPCodeIntegerWrapper("integer", integer),
+        DPCodeJsonWrapper("json", json),
+        ElectricityCurrentJsonWrapper("json", json),
+        DPCodeRawWrapper("raw", raw),
+        ElectricityPowerRawWrapper("raw", raw),
+    ]
+
+
+def main() -> None:
+    """Run the benchmark."""
+    device = SimpleNamespace(id="device_id", product_id="pid", status=STATUS)
+    print(f"{'wrapper':>30} {'generic':>10} {'specialized':>12}")
+    for wrapper in _create_wrappers():
+        durations = []
+        for specialize in (False, True):
+            wrapper.specialize_reader = specialize
+            wrapper.initialize(device)
+            durations.append(
+                min(
+                    timeit.repeat(
+                        lambda wrapper=wrapper: wrapper.read_device_status(
+                            device
+                        ),
+                        number=NUMBER,
+                        repeat=5,
+                    )
+                )
+                / NUMBER
+                * 1e9
+            )
+        generic, specialized = durations
+        print(
+            f"{type(wrapper).__name__:>30} {generic:>7.0f} ns"
+            f" {specialized:>9.0f} ns"
+        )
+
+
+if __name__ == "__main__":
+    main()
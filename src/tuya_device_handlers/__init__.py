@@ -2,10 +2,17 @@
 
 from __future__ import annotations
 
-from .registry import QuirksRegistry
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .registry import TUYA_QUIRKS_REGISTRY
 
 __all__ = [
     "TUYA_QUIRKS_REGISTRY",
 ]
 
-TUYA_QUIRKS_REGISTRY = QuirksRegistry()
+__getattr__, __dir__ = lazy_attributes(
+    __name__, {"TUYA_QUIRKS_REGISTRY": ".registry"}
+)
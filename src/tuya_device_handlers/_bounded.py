@@ -0,0 +1,28 @@
+"""Bounded mappings."""
+
+from __future__ import annotations
+
+import contextlib
+
+
+class BoundedDict[KeyT, ValueT](dict[KeyT, ValueT]):
+    """Dictionary of at most `maxsize` entries, evicting the oldest first.
+
+    Entries are evicted when a new key is set (`d[key] = value`), in
+    insertion order: delete then set a key to make it the most recent.
+    """
+
+    __slots__ = ("maxsize",)
+
+    def __init__(self, maxsize: int) -> None:
+        """Init BoundedDict."""
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __setitem__(self, key: KeyT, value: ValueT) -> None:
+        """Set an entry, evicting the oldest one if full."""
+        if key not in self and len(self) >= self.maxsize:
+            # Lock-free readers may share the dictionary, and race to evict
+            with contextlib.suppress(KeyError, RuntimeError, StopIteration):
+                del self[next(iter(self))]
+        super().__setitem__(key, value)
@@ -0,0 +1,35 @@
+"""Lazy package attributes."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import importlib
+import sys
+from typing import Any
+
+
+def lazy_attributes(
+    package: str, attributes: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Create the module `__getattr__` and `__dir__` of a package.
+
+    `attributes` maps each attribute name to the (relative) module defining
+    it, which is only imported on first access.
+    """
+    namespace = vars(sys.modules[package])
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        """Import the attribute on first access."""
+        if (module := attributes.get(name)) is None:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            )
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        """List the module attributes, including the lazy ones."""
+        return sorted({*namespace, *attributes})
+
+    return __getattr__, __dir__
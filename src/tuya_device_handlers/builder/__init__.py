@@ -2,16 +2,24 @@
 
 from __future__ import annotations
 
-from .base_quirk import (
-    TuyaClimateDefinition,
-    TuyaCoverDefinition,
-    TuyaDeviceQuirk,
-    TuyaSelectDefinition,
-    TuyaSensorDefinition,
-    TuyaSwitchDefinition,
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base_quirk import (
+        TuyaClimateDefinition,
+        TuyaCoverDefinition,
+        TuyaDeviceQuirk,
+        TuyaSelectDefinition,
+        TuyaSensorDefinition,
+        TuyaSwitchDefinition,
+    )
+    from .profile import DeviceProfile, ResolvedDefinition
 
 __all__ = [
+    "DeviceProfile",
+    "ResolvedDefinition",
     "TuyaClimateDefinition",
     "TuyaCoverDefinition",
     "TuyaDeviceQuirk",
@@ -19,3 +27,17 @@ __all__ = [
     "TuyaSensorDefinition",
     "TuyaSwitchDefinition",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "DeviceProfile": ".profile",
+        "ResolvedDefinition": ".profile",
+        "TuyaClimateDefinition": ".base_quirk",
+        "TuyaCoverDefinition": ".base_quirk",
+        "TuyaDeviceQuirk": ".base_quirk",
+        "TuyaSelectDefinition": ".base_quirk",
+        "TuyaSensorDefinition": ".base_quirk",
+        "TuyaSwitchDefinition": ".base_quirk",
+    },
+)
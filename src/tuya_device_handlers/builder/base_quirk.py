@@ -4,24 +4,28 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from dataclasses import dataclass
-import inspect
 import pathlib
-from typing import TYPE_CHECKING, Any, Self
+import sys
+from typing import TYPE_CHECKING, Any, ClassVar, Self
 
+from tuya_device_handlers._bounded import BoundedDict
 from tuya_device_handlers.const import DPType
-from tuya_device_handlers.device_wrapper import DeviceWrapper
-from tuya_device_handlers.helpers import (
-    TuyaClimateHVACMode,
-    TuyaCoverDeviceClass,
-    TuyaEntityCategory,
-    TuyaSensorDeviceClass,
-    TuyaSensorStateClass,
-    TuyaSwitchDeviceClass,
-)
+from tuya_device_handlers.spec import get_spec_fingerprint
+
+from .profile import DeviceProfile
 
 if TYPE_CHECKING:
     from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
+    from tuya_device_handlers.device_wrapper import DeviceWrapper
+    from tuya_device_handlers.helpers import (
+        TuyaClimateHVACMode,
+        TuyaCoverDeviceClass,
+        TuyaEntityCategory,
+        TuyaSensorDeviceClass,
+        TuyaSensorStateClass,
+        TuyaSwitchDeviceClass,
+    )
     from tuya_device_handlers.registry import QuirksRegistry
 
 
@@ -29,15 +33,21 @@ type DeviceWrapperGenerator = Callable[
     [CustomerDevice], DeviceWrapper[Any] | None
 ]
 
+PROFILE_CACHE_SIZE = 64
+"""Maximum number of device profiles kept per quirk."""
+
 
 def _none_type_generator(device: CustomerDevice) -> None:
     return None
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class BaseTuyaDefinition:
     """Definition for a Tuya entity."""
 
+    WRAPPER_FIELDS: ClassVar[tuple[str, ...]] = ()
+    """Names of the DeviceWrapperGenerator fields."""
+
     key: str
 
     device_class: str | None = None
@@ -51,20 +61,32 @@ class BaseTuyaDefinition:
     translation_states: dict[str, str] | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TuyaClimateDefinition(BaseTuyaDefinition):
     """Definition for a climate entity."""
 
+    WRAPPER_FIELDS = (
+        "current_temperature_dp_type",
+        "target_temperature_dp_type",
+    )
+
     switch_only_hvac_mode: TuyaClimateHVACMode
 
     current_temperature_dp_type: DeviceWrapperGenerator
     target_temperature_dp_type: DeviceWrapperGenerator
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TuyaCoverDefinition(BaseTuyaDefinition):
     """Definition for a cover entity."""
 
+    WRAPPER_FIELDS = (
+        "get_state_dp_type",
+        "set_state_dp_type",
+        "get_position_dp_type",
+        "set_position_dp_type",
+    )
+
     device_class: TuyaCoverDeviceClass | None = None
 
     get_state_dp_type: DeviceWrapperGenerator
@@ -73,32 +95,38 @@ class TuyaCoverDefinition(BaseTuyaDefinition):
     set_position_dp_type: DeviceWrapperGenerator
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TuyaSelectDefinition(BaseTuyaDefinition):
     """Definition for a select entity."""
 
+    WRAPPER_FIELDS = ("dp_type",)
+
     dp_type: DeviceWrapperGenerator
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TuyaSensorDefinition(BaseTuyaDefinition):
     """Definition for a sensor entity."""
 
+    WRAPPER_FIELDS = ("dp_type",)
+
     dp_type: DeviceWrapperGenerator
     device_class: TuyaSensorDeviceClass | None = None
     state_class: TuyaSensorStateClass | None = None
     suggested_unit: str | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TuyaSwitchDefinition(BaseTuyaDefinition):
     """Definition for a switch entity."""
 
+    WRAPPER_FIELDS = ("dp_type",)
+
     dp_type: DeviceWrapperGenerator
     device_class: TuyaSwitchDeviceClass | None = None
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class DatapointDefinition:
     """Definition for a Tuya datapoint."""
 
@@ -125,12 +153,12 @@ class TuyaDeviceQuirk:
         self.sensor_definitions: list[TuyaSensorDefinition] = []
         self.switch_definitions: list[TuyaSwitchDefinition] = []
 
-        current_frame = inspect.currentframe()
-        if TYPE_CHECKING:
-            assert current_frame is not None
-        caller = current_frame.f_back
-        if TYPE_CHECKING:
-            assert caller is not None
+        # Keyed by spec fingerprint
+        self._profiles: BoundedDict[str, DeviceProfile] = BoundedDict(
+            PROFILE_CACHE_SIZE
+        )
+
+        caller = sys._getframe(1)
         self.quirk_file = pathlib.Path(caller.f_code.co_filename)
         self.quirk_file_line = caller.f_lineno
 
@@ -141,8 +169,22 @@ class TuyaDeviceQuirk:
 
     def register(self, registry: QuirksRegistry) -> None:
         """Register the quirk in the registry."""
-        for category, product_id in self._applies_to:
-            registry.register(category, product_id, self)
+        registry.register_many(
+            (category, product_id, self)
+            for category, product_id in self._applies_to
+        )
+
+    def compile(self, device: CustomerDevice) -> DeviceProfile:
+        """Resolve all definitions for the device.
+
+        Resolution is cached per spec fingerprint, so that further devices
+        of the same product only allocate their own wrapper instances.
+        """
+        fingerprint = get_spec_fingerprint(device)
+        if (profile := self._profiles.get(fingerprint)) is None:
+            profile = DeviceProfile.resolve(self, device, fingerprint)
+            self._profiles[fingerprint] = profile
+        return profile.instantiate()
 
     def add_dpid_bitmap(
         self, *, dpid: int, dpcode: str, label_range: list[str]
@@ -199,6 +241,7 @@ class TuyaDeviceQuirk:
         target_temperature_dp_type: DeviceWrapperGenerator = _none_type_generator,
     ) -> Self:
         """Add climate definition."""
+        self._profiles.clear()
         self.climate_definitions.append(
             TuyaClimateDefinition(
                 key=key,
@@ -224,6 +267,7 @@ class TuyaDeviceQuirk:
     ) -> Self:
         """Add cover definition."""
 
+        self._profiles.clear()
         self.cover_definitions.append(
             TuyaCoverDefinition(
                 key=key,
@@ -252,6 +296,7 @@ class TuyaDeviceQuirk:
         """Add select definition."""
         if dp_type is None:
             raise NotImplementedError
+        self._profiles.clear()
         self.select_definitions.append(
             TuyaSelectDefinition(
                 key=key,
@@ -281,6 +326,7 @@ class TuyaDeviceQuirk:
         """Add sensor definition."""
         if dp_type is None:
             raise NotImplementedError
+        self._profiles.clear()
         self.sensor_definitions.append(
             TuyaSensorDefinition(
                 key=key,
@@ -311,6 +357,7 @@ class TuyaDeviceQuirk:
         """Add switch definition."""
         if dp_type is None:
             raise NotImplementedError
+        self._profiles.clear()
         self.switch_definitions.append(
             TuyaSwitchDefinition(
                 key=key,
@@ -0,0 +1,258 @@
+"""Declarative (JSON) quirks.
+
+A quirks file contains a list of quirks, each quirk being a list of builder
+steps, mirroring the `TuyaDeviceQuirk` builder API:
+
+```json
+[
+  [
+    {"applies_to": {"category": "cz", "product_id": "abcdef"}},
+    {"add_dpid_boolean": {"dpid": 1, "dpcode": "switch"}},
+    {
+      "add_switch": {
+        "key": "switch",
+        "dp_type": {"wrapper": "DPCodeBooleanWrapper", "dpcode": "switch"},
+        "entity_category": "config"
+      }
+    }
+  ]
+]
+```
+
+Wrapper generators reference a wrapper class by name, with the arguments of
+its `find_dpcode` method.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import functools
+import json
+import logging
+import marshal
+import os
+import pathlib
+import tempfile
+from typing import TYPE_CHECKING, Any
+
+from tuya_device_handlers.device_wrapper import binary_sensor, common, sensor
+from tuya_device_handlers.device_wrapper.common import DPCodeWrapper
+from tuya_device_handlers.devices import get_file_signature
+from tuya_device_handlers.helpers import (
+    TuyaClimateHVACMode,
+    TuyaCoverDeviceClass,
+    TuyaEntityCategory,
+    TuyaSensorDeviceClass,
+    TuyaSensorStateClass,
+    TuyaSwitchDeviceClass,
+)
+
+from .base_quirk import TuyaDeviceQuirk
+
+if TYPE_CHECKING:
+    from tuya_device_handlers.registry import FileSignature, QuirksRegistry
+
+    from .base_quirk import DeviceWrapperGenerator
+
+_LOGGER = logging.getLogger(__name__)
+
+type QuirkData = list[dict[str, dict[str, Any]]]
+
+DECLARATIVE_CACHE_VERSION = 2
+"""Version of the compiled cache format."""
+
+_STEPS = frozenset(
+    {
+        "applies_to",
+        "add_dpid_bitmap",
+        "add_dpid_boolean",
+        "add_dpid_enum",
+        "add_dpid_integer",
+        "add_climate",
+        "add_cover",
+        "add_select",
+        "add_sensor",
+        "add_switch",
+    }
+)
+_WRAPPER_ARGUMENTS = frozenset(
+    {
+        "current_temperature_dp_type",
+        "target_temperature_dp_type",
+        "get_state_dp_type",
+        "set_state_dp_type",
+        "get_position_dp_type",
+        "set_position_dp_type",
+        "dp_type",
+    }
+)
+_ENUM_ARGUMENTS: dict[tuple[str, str], Callable[[str], Any]] = {
+    ("add_climate", "switch_only_hvac_mode"): TuyaClimateHVACMode,
+    ("add_cover", "device_class"): TuyaCoverDeviceClass,
+    ("add_sensor", "device_class"): TuyaSensorDeviceClass,
+    ("add_sensor", "state_class"): TuyaSensorStateClass,
+    ("add_switch", "device_class"): TuyaSwitchDeviceClass,
+}
+
+
+@functools.cache
+def _get_wrapper_classes() -> dict[str, type[DPCodeWrapper]]:
+    """Get the wrapper classes which can be referenced by name."""
+    return {
+        name: value
+        for module in (common, sensor, binary_sensor)
+        for name, value in vars(module).items()
+        if isinstance(value, type)
+        and issubclass(value, DPCodeWrapper)
+        and hasattr(value, "find_dpcode")
+    }
+
+
+def _create_generator(reference: dict[str, Any]) -> DeviceWrapperGenerator:
+    """Create a wrapper generator from a wrapper reference."""
+    arguments = dict(reference)
+    try:
+        wrapper_class = _get_wrapper_classes()[arguments.pop("wrapper")]
+    except KeyError as err:
+        raise ValueError(f"Unknown wrapper reference {reference}") from err
+    dpcodes = arguments.pop("dpcode")
+    if isinstance(dpcodes, list):
+        dpcodes = tuple(dpcodes)
+    return functools.partial(
+        wrapper_class.find_dpcode,  # type: ignore[attr-defined]
+        dpcodes=dpcodes,
+        **arguments,
+    )
+
+
+def create_quirks(
+    data: list[QuirkData], quirk_file: pathlib.Path
+) -> list[TuyaDeviceQuirk]:
+    """Create quirks from declarative data."""
+    quirks: list[TuyaDeviceQuirk] = []
+    for quirk_data in data:
+        quirk = TuyaDeviceQuirk()
+        quirk.quirk_file = quirk_file
+        quirk.quirk_file_line = 0
+        for step in quirk_data:
+            ((method, arguments),) = step.items()
+            if method not in _STEPS:
+                raise ValueError(f"Unknown quirk step {method}")
+            arguments = dict(arguments)
+            for name, value in arguments.items():
+                if name == "entity_category" and value is not None:
+                    arguments[name] = TuyaEntityCategory(value)
+                elif (
+                    enum_class := _ENUM_ARGUMENTS.get((method, name))
+                ) is not None and value is not None:
+                    arguments[name] = enum_class(value)
+                elif name in _WRAPPER_ARGUMENTS:
+                    arguments[name] = _create_generator(value)
+            getattr(quirk, method)(**arguments)
+        quirks.append(quirk)
+    return quirks
+
+
+def _load_compiled(
+    cache_file: pathlib.Path,
+) -> dict[str, tuple[FileSignature, list[QuirkData]]]:
+    """Load the compiled quirks data, keyed by quirks file."""
+    try:
+        version, files = marshal.loads(cache_file.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if version != DECLARATIVE_CACHE_VERSION:
+        return {}
+    return files  # type: ignore[no-any-return]
+
+
+def _write_compiled(
+    cache_file: pathlib.Path,
+    files: dict[str, tuple[FileSignature, list[QuirkData]]],
+) -> None:
+    """Write the compiled quirks data atomically."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=cache_file.parent,
+        prefix=f".{cache_file.name}.",
+        delete_on_close=False,
+    ) as temp_file:
+        temp_file.write(marshal.dumps((DECLARATIVE_CACHE_VERSION, files)))
+        temp_file.close()
+        os.replace(temp_file.name, cache_file)
+
+
+def load_quirks_data(
+    path: pathlib.Path, cache_file: pathlib.Path | None = None
+) -> dict[pathlib.Path, tuple[FileSignature, list[QuirkData]]]:
+    """Load the declarative quirks files (`*.json`) of a directory.
+
+    If `cache_file` is set, the parsed files are compiled into a single
+    binary blob, so that unchanged files are loaded with a single read.
+    Returns the (mtime_ns, size, digest) signature and data, keyed by quirks
+    file.
+    """
+    compiled = {} if cache_file is None else _load_compiled(cache_file)
+    files: dict[str, tuple[FileSignature, list[QuirkData]]] = {}
+    for quirks_file in sorted(path.glob("*.json")):
+        entry = compiled.get(str(quirks_file))
+        signature = get_file_signature(
+            quirks_file, None if entry is None else entry[0]
+        )
+        # A touched file is hashed again, but only parsed if its content
+        # changed
+        if entry is None or signature[2] != entry[0][2]:
+            try:
+                entry = (signature, json.loads(quirks_file.read_bytes()))
+            except ValueError:
+                _LOGGER.exception("Invalid declarative quirk %s", quirks_file)
+                continue
+        elif signature != entry[0]:
+            entry = (signature, entry[1])
+        files[str(quirks_file)] = entry
+
+    if cache_file is not None and files != compiled:
+        try:
+            _write_compiled(cache_file, files)
+        except OSError:
+            _LOGGER.debug("Unable to write quirks cache %s", cache_file)
+    return {
+        pathlib.Path(quirks_file): entry for quirks_file, entry in files.items()
+    }
+
+
+def register_declarative_quirks(
+    registry: QuirksRegistry,
+    path: pathlib.Path,
+    cache_file: pathlib.Path | None = None,
+) -> tuple[set[pathlib.Path], bool]:
+    """Register the declarative quirks of a directory, in `registry`.
+
+    Quirks are only re-created for files whose content changed since the
+    last call. Returns the quirks files, and True if any file was
+    (re-)loaded.
+    """
+    found_files: set[pathlib.Path] = set()
+    loaded = False
+    for quirks_file, (signature, data) in load_quirks_data(
+        path, cache_file
+    ).items():
+        found_files.add(quirks_file)
+        previous = registry.get_file_signature(quirks_file)
+        if previous is not None and signature[2] == previous[2]:
+            if signature != previous:
+                registry.set_file_signature(quirks_file, signature)
+            continue
+        # Replaced in a single snapshot, lookups never miss the quirks
+        with registry.batch_writes():
+            registry.purge_quirk_file(quirks_file)
+            try:
+                quirks = create_quirks(data, quirks_file)
+            except Exception:
+                _LOGGER.exception("Invalid declarative quirk %s", quirks_file)
+                continue
+            for quirk in quirks:
+                quirk.register(registry)
+        registry.set_file_signature(quirks_file, signature)
+        loaded = True
+    return found_files, loaded
@@ -0,0 +1,122 @@
+"""Compiled device profile."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+import copy
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Self
+
+if TYPE_CHECKING:
+    from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+    from tuya_device_handlers.device_wrapper import DeviceWrapper
+
+    from .base_quirk import (
+        BaseTuyaDefinition,
+        TuyaClimateDefinition,
+        TuyaCoverDefinition,
+        TuyaDeviceQuirk,
+        TuyaSelectDefinition,
+        TuyaSensorDefinition,
+        TuyaSwitchDefinition,
+    )
+
+
+@dataclass(frozen=True, kw_only=True)
+class ResolvedDefinition[DefinitionT: BaseTuyaDefinition]:
+    """Entity definition with its device wrappers resolved."""
+
+    definition: DefinitionT
+    wrappers: Mapping[str, DeviceWrapper[Any] | None]
+    """Resolved wrappers, keyed by generator field (e.g. `dp_type`).
+
+    Read-only, as resolved definitions are shared between devices.
+    """
+
+    @classmethod
+    def resolve(cls, definition: DefinitionT, device: CustomerDevice) -> Self:
+        """Resolve all wrapper generators of the definition."""
+        return cls(
+            definition=definition,
+            wrappers=MappingProxyType(
+                {
+                    field: getattr(definition, field)(device)
+                    for field in definition.WRAPPER_FIELDS
+                }
+            ),
+        )
+
+    def instantiate(self) -> Self:
+        """Return a copy with fresh wrapper instances."""
+        return type(self)(
+            definition=self.definition,
+            wrappers=MappingProxyType(
+                {
+                    field: copy.copy(wrapper)
+                    for field, wrapper in self.wrappers.items()
+                }
+            ),
+        )
+
+
+def _resolve_all[DefinitionT: BaseTuyaDefinition](
+    definitions: Iterable[DefinitionT], device: CustomerDevice
+) -> tuple[ResolvedDefinition[DefinitionT], ...]:
+    return tuple(
+        ResolvedDefinition.resolve(definition, device)
+        for definition in definitions
+    )
+
+
+def _instantiate_all[DefinitionT: BaseTuyaDefinition](
+    resolved: tuple[ResolvedDefinition[DefinitionT], ...],
+) -> tuple[ResolvedDefinition[DefinitionT], ...]:
+    return tuple(item.instantiate() for item in resolved)
+
+
+@dataclass(frozen=True, kw_only=True)
+class DeviceProfile:
+    """Quirk definitions resolved for a device spec, grouped by platform.
+
+    Wrapper generators are expected to only depend on the device spec
+    (`device.function` / `device.status_range`), so that a profile can be
+    shared between all devices with the same spec fingerprint.
+    """
+
+    fingerprint: str
+    climate: tuple[ResolvedDefinition[TuyaClimateDefinition], ...]
+    cover: tuple[ResolvedDefinition[TuyaCoverDefinition], ...]
+    select: tuple[ResolvedDefinition[TuyaSelectDefinition], ...]
+    sensor: tuple[ResolvedDefinition[TuyaSensorDefinition], ...]
+    switch: tuple[ResolvedDefinition[TuyaSwitchDefinition], ...]
+
+    @classmethod
+    def resolve(
+        cls, quirk: TuyaDeviceQuirk, device: CustomerDevice, fingerprint: str
+    ) -> Self:
+        """Resolve all quirk definitions against the device."""
+        return cls(
+            fingerprint=fingerprint,
+            climate=_resolve_all(quirk.climate_definitions, device),
+            cover=_resolve_all(quirk.cover_definitions, device),
+            select=_resolve_all(quirk.select_definitions, device),
+            sensor=_resolve_all(quirk.sensor_definitions, device),
+            switch=_resolve_all(quirk.switch_definitions, device),
+        )
+
+    def instantiate(self) -> Self:
+        """Return a copy with fresh wrapper instances, for a single device.
+
+        Wrappers can hold per-device state (e.g. `DeltaIntegerWrapper`),
+        so each device gets its own shallow copies.
+        """
+        return type(self)(
+            fingerprint=self.fingerprint,
+            climate=_instantiate_all(self.climate),
+            cover=_instantiate_all(self.cover),
+            select=_instantiate_all(self.select),
+            sensor=_instantiate_all(self.sensor),
+            switch=_instantiate_all(self.switch),
+        )
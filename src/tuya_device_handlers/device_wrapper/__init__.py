@@ -1,11 +1,59 @@
 """Tuya device wrapper."""
 
-from .base import DeviceWrapper
-from .const import DEVICE_WARNINGS
-from .exception import SetValueOutOfRangeError
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .base import DeviceWrapper
+    from .cache import DecodeCache
+    from .const import (
+        BITMAP_DECODE_CACHE,
+        DEVICE_WARNINGS,
+        ELECTRICITY_DECODE_CACHE,
+        JSON_DECODE_CACHE,
+    )
+    from .exception import SetValueOutOfRangeError
+    from .reader import StatusReader, read_all
+    from .router import UpdateRouter
+    from .status import StatusChange, StatusSnapshot, diff_status
+    from .warning_registry import DeviceWarningRegistry
 
 __all__ = [
+    "BITMAP_DECODE_CACHE",
     "DEVICE_WARNINGS",
+    "ELECTRICITY_DECODE_CACHE",
+    "JSON_DECODE_CACHE",
+    "DecodeCache",
+    "DeviceWarningRegistry",
     "DeviceWrapper",
     "SetValueOutOfRangeError",
+    "StatusChange",
+    "StatusReader",
+    "StatusSnapshot",
+    "UpdateRouter",
+    "diff_status",
+    "read_all",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "BITMAP_DECODE_CACHE": ".const",
+        "DEVICE_WARNINGS": ".const",
+        "ELECTRICITY_DECODE_CACHE": ".const",
+        "JSON_DECODE_CACHE": ".const",
+        "DecodeCache": ".cache",
+        "DeviceWarningRegistry": ".warning_registry",
+        "DeviceWrapper": ".base",
+        "SetValueOutOfRangeError": ".exception",
+        "StatusChange": ".status",
+        "StatusReader": ".reader",
+        "StatusSnapshot": ".status",
+        "UpdateRouter": ".router",
+        "diff_status": ".status",
+        "read_all": ".reader",
+    },
+)
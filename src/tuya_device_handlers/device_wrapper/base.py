@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-from ..helpers.homeassistant import TuyaSensorStateClass
-
 if TYPE_CHECKING:
     from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
+    from ..helpers.homeassistant import TuyaSensorStateClass
+
 
 class DeviceWrapper[T]:
     """Base device wrapper."""
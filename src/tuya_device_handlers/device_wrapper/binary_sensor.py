@@ -2,18 +2,29 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Self
+from typing import TYPE_CHECKING, Any, Self
 
 from ..type_information import BitmapTypeInformation
 from .base import DeviceWrapper
 from .common import DPCodeBitmapWrapper
+from .const import BITMAP_DECODE_CACHE
 
 if TYPE_CHECKING:
     from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
+    from ..spec import DeviceSpecIndex
+    from ..type_information import BitmapDecode
+    from .common import RawValueReader
+
 
 class DPCodeBitmapBitWrapper(DPCodeBitmapWrapper, DeviceWrapper[bool]):
-    """Simple wrapper for a specific bit in bitmap values."""
+    """Simple wrapper for a specific bit in bitmap values.
+
+    Updates are skipped unless the bit flipped. The bitmap is decoded once
+    per change, and the decode is shared by the bit wrappers of the DP.
+    """
+
+    _last_raw_value: Any = None
 
     def __init__(
         self, dpcode: str, type_information: BitmapTypeInformation, mask: int
@@ -22,16 +33,59 @@ class DPCodeBitmapBitWrapper(DPCodeBitmapWrapper, DeviceWrapper[bool]):
         super().__init__(dpcode, type_information)
         self._mask = mask
 
-    def read_device_status(self, device: CustomerDevice) -> bool | None:
+    def initialize(self, device: CustomerDevice) -> None:
+        """Initialize the wrapper with device data."""
+        super().initialize(device)
+        self._last_raw_value = device.status.get(self.dpcode)
+
+    def skip_update(
+        self,
+        device: CustomerDevice,
+        updated_status_properties: list[str] | None,
+        dp_timestamps: dict[str, int] | None = None,
+    ) -> bool:
+        """Skip updates which do not flip the bit of this wrapper."""
+        if super().skip_update(
+            device, updated_status_properties, dp_timestamps
+        ):
+            return True
+        raw_value = device.status.get(self.dpcode)
+        previous, self._last_raw_value = self._last_raw_value, raw_value
+        if not isinstance(raw_value, int):
+            return bool(raw_value == previous)
+        # Wrappers of the same DP have seen the same changes, so the key
+        # includes the previous value
+        decoded = BITMAP_DECODE_CACHE.get_or_decode(
+            device.id, self.dpcode, (previous, raw_value), self._decode_change
+        )
+        return not decoded.changed_mask >> self._mask & 1
+
+    def _decode_change(self, change: tuple[Any, int]) -> BitmapDecode:
+        """Decode a (previous, current) bitmap change."""
+        previous, raw_value = change
+        return self.type_information.decode(
+            raw_value, previous if isinstance(previous, int) else None
+        )
+
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> bool | None:
         """Read the device value for the dpcode."""
-        if (raw_value := super().read_device_status(device)) is None:
-            return None
-        return (raw_value & (1 << self._mask)) != 0
+        return bool(raw_value & (1 << self._mask))
+
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        mask = 1 << self._mask
+
+        def read_bit(device: CustomerDevice, raw_value: Any) -> Any:
+            return bool(raw_value & mask)
+
+        return read_bit
 
     @classmethod
     def find_dpcode(  # type: ignore[override]
         cls,
-        device: CustomerDevice,
+        device: CustomerDevice | DeviceSpecIndex,
         dpcodes: str | tuple[str, ...] | None,
         *,
         bitmap_key: str,
@@ -41,10 +95,6 @@ class DPCodeBitmapBitWrapper(DPCodeBitmapWrapper, DeviceWrapper[bool]):
             type_information := BitmapTypeInformation.find_dpcode(
                 device, dpcodes
             )
-        ) and bitmap_key in type_information.label:
-            return cls(
-                type_information.dpcode,
-                type_information,
-                type_information.label.index(bitmap_key),
-            )
+        ) and (bit := type_information.get_bit(bitmap_key)) is not None:
+            return cls(type_information.dpcode, type_information, bit)
         return None
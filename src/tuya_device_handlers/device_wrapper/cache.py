@@ -0,0 +1,64 @@
+"""Tuya device wrapper."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from .._bounded import BoundedDict
+
+
+class DecodeCache[T]:
+    """Cache of decoded DP values, shared between wrappers.
+
+    Keeps the last decoded value for each (device ID, DP code), which is
+    reused for as long as the raw value is unchanged.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Init DecodeCache."""
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        # Keyed by (device ID, DP code): (raw value, decoded value)
+        self._entries: BoundedDict[tuple[str, str], tuple[Any, T]] = (
+            BoundedDict(maxsize)
+        )
+
+    def __len__(self) -> int:
+        """Return the number of cached values."""
+        return len(self._entries)
+
+    def get_or_decode(
+        self,
+        device_id: str,
+        dpcode: str,
+        raw_value: Any,
+        decoder: Callable[[Any], T],
+    ) -> T:
+        """Return the decoded value, decoding it if the raw value changed."""
+        key = (device_id, dpcode)
+        if (entry := self._entries.get(key)) is not None and (
+            entry[0] is raw_value or entry[0] == raw_value
+        ):
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        decoded = decoder(raw_value)
+        if entry is not None:
+            # Re-insert as most recent
+            del self._entries[key]
+        self._entries[key] = (raw_value, decoded)
+        return decoded
+
+    def forget_device(self, device_id: str) -> None:
+        """Remove all cached values of a device."""
+        for key in [key for key in self._entries if key[0] == device_id]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Remove all cached values, and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
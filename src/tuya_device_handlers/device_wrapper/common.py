@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
-import base64
+import binascii
+from collections.abc import Callable
+import copy
 import json
 import logging
 from typing import TYPE_CHECKING, Any, Self
@@ -18,28 +20,23 @@ from ..type_information import (
     TypeInformation,
 )
 from .base import DeviceWrapper
-from .const import DEVICE_WARNINGS
+from .const import DEVICE_WARNINGS, JSON_DECODE_CACHE
 from .exception import SetValueOutOfRangeError
 
 if TYPE_CHECKING:
     from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
+    from ..spec import DeviceSpecIndex
+
 
 _LOGGER = logging.getLogger(__name__)
 
+type RawValueReader = Callable[[CustomerDevice, Any], Any]
 
-def _should_log_warning(device_id: str, warning_key: str) -> bool:
-    """Check if a warning has already been logged for a device and add it if not.
 
-    Returns: True if the warning should be logged, False if it was already logged.
-    """
-    if (device_warnings := DEVICE_WARNINGS.get(device_id)) is None:
-        device_warnings = set()
-        DEVICE_WARNINGS[device_id] = device_warnings
-    if warning_key in device_warnings:
-        return False
-    DEVICE_WARNINGS[device_id].add(warning_key)
-    return True
+def _get_defining_class(cls: type, name: str) -> type:
+    """Return the class of the MRO defining an attribute."""
+    return next(klass for klass in cls.__mro__ if name in vars(klass))
 
 
 class DPCodeWrapper(DeviceWrapper[Any]):
@@ -49,10 +46,46 @@ class DPCodeWrapper(DeviceWrapper[Any]):
     access read conversion routines.
     """
 
+    specialize_reader: bool = True
+    """Compile a specialized reader on `initialize`, disable for debugging."""
+
+    raw_value_reader: RawValueReader | None = None
+    """Specialized `read_raw_value`, compiled by `initialize`."""
+
     def __init__(self, dpcode: str) -> None:
         """Init DPCodeWrapper."""
         self.dpcode = dpcode
 
+    def __copy__(self) -> Self:
+        """Return a copy of the wrapper, e.g. for another device.
+
+        The specialized reader is bound to this wrapper, so the copy compiles
+        its own on `initialize`. Subclasses copy their mutable state.
+        """
+        clone = object.__new__(type(self))
+        clone.__dict__.update(self.__dict__)
+        clone.__dict__.pop("raw_value_reader", None)
+        return clone
+
+    def initialize(self, device: CustomerDevice) -> None:
+        """Initialize the wrapper with device data.
+
+        Compiles a specialized `read_raw_value`, with the type information
+        folded into constants, unless `specialize_reader` is disabled.
+        """
+        self.raw_value_reader = None
+        cls = type(self)
+        # Subclasses overriding read_raw_value must also override
+        # _compile_reader, else the reader would not be equivalent
+        if self.specialize_reader and _get_defining_class(
+            cls, "read_raw_value"
+        ) is _get_defining_class(cls, "_compile_reader"):
+            self.raw_value_reader = self._compile_reader()
+
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`, if worthwhile."""
+        return None
+
     def skip_update(
         self,
         device: CustomerDevice,
@@ -70,12 +103,22 @@ class DPCodeWrapper(DeviceWrapper[Any]):
         )
 
     def read_device_status(self, device: CustomerDevice) -> Any | None:
-        """Read and process raw value against this type information.
+        """Read and process raw value against this type information."""
+        if (raw_value := device.status.get(self.dpcode)) is None:
+            return None
+        if (reader := self.raw_value_reader) is not None:
+            return reader(device, raw_value)
+        return self.read_raw_value(device, raw_value)
+
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> Any | None:
+        """Process a raw value of the dpcode, which is never None.
 
         Base implementation does no validation, subclasses may override to provide
         specific validation.
         """
-        return device.status.get(self.dpcode)
+        return raw_value
 
     def _convert_value_to_raw_value(
         self, device: CustomerDevice, value: Any
@@ -118,7 +161,7 @@ class DPCodeTypeInformationWrapper[TypeInformationT: TypeInformation](
     @classmethod
     def find_dpcode(
         cls,
-        device: CustomerDevice,
+        device: CustomerDevice | DeviceSpecIndex,
         dpcodes: str | tuple[str, ...] | None,
         *,
         prefer_function: bool = False,
@@ -139,14 +182,19 @@ class DPCodeBitmapWrapper(DPCodeTypeInformationWrapper[BitmapTypeInformation]):
 
     _DPTYPE = BitmapTypeInformation
 
-    def read_device_status(self, device: CustomerDevice) -> int | None:
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> int | None:
         """Read and process raw value against this type information."""
-        if (raw_value := device.status.get(self.dpcode)) is None:
-            return None
         if TYPE_CHECKING:
             assert isinstance(raw_value, int)
         return raw_value
 
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`, if worthwhile."""
+        # Returning the raw value is already the fastest path
+        return None
+
 
 class DPCodeBooleanWrapper(
     DPCodeTypeInformationWrapper[BooleanTypeInformation]
@@ -155,14 +203,14 @@ class DPCodeBooleanWrapper(
 
     _DPTYPE = BooleanTypeInformation
 
-    def read_device_status(self, device: CustomerDevice) -> bool | None:
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> bool | None:
         """Read and process raw value against this type information."""
-        if (raw_value := device.status.get(self.dpcode)) is None:
-            return None
         # Validate input against defined range
         if raw_value not in (True, False):
-            if _should_log_warning(
-                device.id, f"boolean_out_range|{self.dpcode}|{raw_value}"
+            if DEVICE_WARNINGS.should_log(
+                device.id, ("boolean_out_range", self.dpcode, raw_value)
             ):
                 _LOGGER.warning(
                     "Found invalid boolean value `%s` for datapoint `%s` in product "
@@ -176,6 +224,18 @@ class DPCodeBooleanWrapper(
             return None
         return raw_value  # type: ignore[no-any-return]
 
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        read_raw_value = self.read_raw_value
+
+        def read_boolean(device: CustomerDevice, raw_value: Any) -> Any:
+            if raw_value is True or raw_value is False:
+                return raw_value
+            # Invalid values are logged by the generic path
+            return read_raw_value(device, raw_value)
+
+        return read_boolean
+
     def _convert_value_to_raw_value(
         self, device: CustomerDevice, value: bool
     ) -> bool | None:
@@ -198,16 +258,23 @@ class DPCodeEnumWrapper(DPCodeTypeInformationWrapper[EnumTypeInformation]):
     ) -> None:
         """Init DPCodeEnumWrapper."""
         super().__init__(dpcode, type_information)
-        self.options = type_information.range
+        # Copied, as the type information is shared between devices
+        self.options = list(type_information.range)
+
+    def __copy__(self) -> Self:
+        """Return a copy of the wrapper, with its own options."""
+        clone = super().__copy__()
+        clone.options = list(self.options)
+        return clone
 
-    def read_device_status(self, device: CustomerDevice) -> str | None:
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> str | None:
         """Read and process raw value against this type information."""
-        if (raw_value := device.status.get(self.dpcode)) is None:
-            return None
         # Validate input against defined range
-        if raw_value not in self.type_information.range:
-            if _should_log_warning(
-                device.id, f"enum_out_range|{self.dpcode}|{raw_value}"
+        if self.type_information.get_ordinal(raw_value) is None:
+            if DEVICE_WARNINGS.should_log(
+                device.id, ("enum_out_range", self.dpcode, raw_value)
             ):
                 _LOGGER.warning(
                     "Found invalid enum value `%s` for datapoint `%s` in product "
@@ -221,11 +288,46 @@ class DPCodeEnumWrapper(DPCodeTypeInformationWrapper[EnumTypeInformation]):
             return None
         return raw_value  # type: ignore[no-any-return]
 
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        options = self.type_information.range_index
+        read_raw_value = self.read_raw_value
+
+        def read_enum(device: CustomerDevice, raw_value: Any) -> Any:
+            if type(raw_value) is str and raw_value in options:
+                return raw_value
+            # Invalid values are logged by the generic path
+            return read_raw_value(device, raw_value)
+
+        return read_enum
+
+    def read_ordinal(self, device: CustomerDevice) -> int | None:
+        """Read the ordinal of the device value in the options.
+
+        Returns None if the value is missing or out of range.
+        """
+        if (raw_value := device.status.get(self.dpcode)) is None:
+            return None
+        return self.type_information.get_ordinal(raw_value)
+
+    def get_ordinal_update_commands(
+        self, device: CustomerDevice, ordinal: int
+    ) -> list[dict[str, Any]]:
+        """Get the update commands for the option at an ordinal."""
+        if not 0 <= ordinal < len(self.type_information.range):
+            raise SetValueOutOfRangeError(
+                f"Enum ordinal `{ordinal}` out of range:"
+                f" {self.type_information.range}"
+            )
+        return [
+            {"code": self.dpcode, "value": self.type_information.range[ordinal]}
+        ]
+
     def _convert_value_to_raw_value(
         self, device: CustomerDevice, value: str
     ) -> str | None:
         """Convert a Home Assistant value back to a raw device value."""
-        if value in self.type_information.range:
+        if self.type_information.get_ordinal(value) is not None:
             return value
         # Guarded by select option validation
         # Safety net in case of future changes
@@ -253,16 +355,16 @@ class DPCodeIntegerWrapper(
             type_information.step
         )
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read and process raw value against this type information."""
-        if (raw_value := device.status.get(self.dpcode)) is None:
-            return None
         # Validate input against defined range
         if not isinstance(raw_value, int) or not (
             self.type_information.min <= raw_value <= self.type_information.max
         ):
-            if _should_log_warning(
-                device.id, f"integer_out_range|{self.dpcode}|{raw_value}"
+            if DEVICE_WARNINGS.should_log(
+                device.id, ("integer_out_range", self.dpcode, raw_value)
             ):
                 _LOGGER.warning(
                     "Found invalid integer value `%s` for datapoint `%s` in product "
@@ -278,6 +380,21 @@ class DPCodeIntegerWrapper(
             return None
         return self.type_information.scale_value(raw_value)
 
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        minimum = self.type_information.min
+        maximum = self.type_information.max
+        divisor = 10**self.type_information.scale
+        read_raw_value = self.read_raw_value
+
+        def read_integer(device: CustomerDevice, raw_value: Any) -> Any:
+            if type(raw_value) is int and minimum <= raw_value <= maximum:
+                return raw_value / divisor
+            # Invalid values are logged by the generic path
+            return read_raw_value(device, raw_value)
+
+        return read_integer
+
     def _convert_value_to_raw_value(
         self, device: CustomerDevice, value: float
     ) -> int:
@@ -298,13 +415,42 @@ class DPCodeJsonWrapper(DPCodeTypeInformationWrapper[JsonTypeInformation]):
 
     _DPTYPE = JsonTypeInformation
 
-    def read_device_status(
-        self, device: CustomerDevice
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
     ) -> dict[str, Any] | None:
         """Read and process raw value against this type information."""
-        if (raw_value := device.status.get(self.dpcode)) is None:
-            return None
-        return json.loads(raw_value)  # type: ignore[no-any-return]
+        return copy.deepcopy(self._read_shared_value(device, raw_value))
+
+    def _read_shared_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> dict[str, Any] | None:
+        """Read the decoded value, shared with other wrappers of the same DP.
+
+        The returned value must not be modified.
+        """
+        return JSON_DECODE_CACHE.get_or_decode(  # type: ignore[no-any-return]
+            device.id, self.dpcode, raw_value, json.loads
+        )
+
+    def _compile_reader(self) -> RawValueReader:
+        """Compile a reader equivalent to `read_raw_value`."""
+        read_shared_json = self._compile_shared_reader()
+        deepcopy = copy.deepcopy
+
+        def read_json(device: CustomerDevice, raw_value: Any) -> Any:
+            return deepcopy(read_shared_json(device, raw_value))
+
+        return read_json
+
+    def _compile_shared_reader(self) -> RawValueReader:
+        """Compile a reader equivalent to `_read_shared_value`."""
+        dpcode = self.dpcode
+        get_or_decode = JSON_DECODE_CACHE.get_or_decode
+
+        def read_shared_json(device: CustomerDevice, raw_value: Any) -> Any:
+            return get_or_decode(device.id, dpcode, raw_value, json.loads)
+
+        return read_shared_json
 
 
 class DPCodeRawWrapper(DPCodeTypeInformationWrapper[RawTypeInformation]):
@@ -312,11 +458,20 @@ class DPCodeRawWrapper(DPCodeTypeInformationWrapper[RawTypeInformation]):
 
     _DPTYPE = RawTypeInformation
 
-    def read_device_status(self, device: CustomerDevice) -> bytes | None:
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> bytes | None:
         """Read and process raw value against this type information."""
-        if (raw_value := device.status.get(self.dpcode)) is None:
-            return None
-        return base64.b64decode(raw_value)
+        return binascii.a2b_base64(raw_value)
+
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        a2b_base64 = binascii.a2b_base64
+
+        def read_raw(device: CustomerDevice, raw_value: Any) -> Any:
+            return a2b_base64(raw_value)
+
+        return read_raw
 
 
 class DPCodeStringWrapper(DPCodeTypeInformationWrapper[StringTypeInformation]):
@@ -1,5 +1,26 @@
 """Tuya device wrapper."""
 
-# Dictionary to track logged warnings to avoid spamming logs
-# Keyed by device ID
-DEVICE_WARNINGS: dict[str, set[str]] = {}
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from .cache import DecodeCache
+from .warning_registry import DeviceWarningRegistry
+
+if TYPE_CHECKING:
+    from ..raw_data_model import ElectricityData
+    from ..type_information import BitmapDecode
+
+# Registry to track logged warnings to avoid spamming logs
+DEVICE_WARNINGS = DeviceWarningRegistry()
+
+# Decoded JSON values, shared by all wrappers reading the same DP
+JSON_DECODE_CACHE: DecodeCache[Any] = DecodeCache(maxsize=4096)
+
+# Decoded bitmap changes, shared by all bit wrappers reading the same DP
+BITMAP_DECODE_CACHE: DecodeCache[BitmapDecode] = DecodeCache(maxsize=4096)
+
+# Decoded electricity RAW frames, shared by all wrappers reading the same DP
+ELECTRICITY_DECODE_CACHE: DecodeCache[ElectricityData | None] = DecodeCache(
+    maxsize=4096
+)
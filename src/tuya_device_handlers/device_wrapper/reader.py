@@ -0,0 +1,74 @@
+"""Tuya device wrapper."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+from .common import DPCodeWrapper
+
+if TYPE_CHECKING:
+    from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+    from .base import DeviceWrapper
+
+
+class StatusReader[KeyT]:
+    """Read the values of many wrappers of a device in a single pass.
+
+    DPCode wrappers are grouped by their DP code, so that each DP code is
+    read from the device status once, and its raw value is handed to the
+    (specialized) `read_raw_value` of every wrapper of the group. Decodes
+    shared between wrappers (JSON, electricity RAW) go through the decode
+    caches, so each distinct raw value is only decoded once.
+
+    Wrappers that override `read_device_status` (e.g. `DeltaIntegerWrapper`)
+    are read individually.
+    """
+
+    def __init__(self, wrappers: Mapping[KeyT, DeviceWrapper[Any]]) -> None:
+        """Init StatusReader."""
+        self._keys = tuple(wrappers)
+        self._wrappers_by_dpcode: dict[
+            str, list[tuple[KeyT, DPCodeWrapper]]
+        ] = {}
+        self._other_wrappers: list[tuple[KeyT, DeviceWrapper[Any]]] = []
+        for key, wrapper in wrappers.items():
+            if (
+                isinstance(wrapper, DPCodeWrapper)
+                and type(wrapper).read_device_status
+                is DPCodeWrapper.read_device_status
+            ):
+                self._wrappers_by_dpcode.setdefault(wrapper.dpcode, []).append(
+                    (key, wrapper)
+                )
+            else:
+                self._other_wrappers.append((key, wrapper))
+
+    def read_all(self, device: CustomerDevice) -> dict[KeyT, Any]:
+        """Return the value of every wrapper, keyed like the wrappers.
+
+        This is equivalent to calling `read_device_status` on every wrapper.
+        """
+        values: dict[KeyT, Any] = dict.fromkeys(self._keys)
+        status = device.status
+        for dpcode, wrappers in self._wrappers_by_dpcode.items():
+            if (raw_value := status.get(dpcode)) is None:
+                continue
+            for key, wrapper in wrappers:
+                values[key] = (
+                    wrapper.raw_value_reader or wrapper.read_raw_value
+                )(device, raw_value)
+        for key, other_wrapper in self._other_wrappers:
+            values[key] = other_wrapper.read_device_status(device)
+        return values
+
+
+def read_all[KeyT](
+    device: CustomerDevice, wrappers: Mapping[KeyT, DeviceWrapper[Any]]
+) -> dict[KeyT, Any]:
+    """Return the value of every wrapper, keyed like the wrappers.
+
+    Use a `StatusReader` to read the same wrappers repeatedly.
+    """
+    return StatusReader(wrappers).read_all(device)
@@ -0,0 +1,104 @@
+"""Tuya device wrapper."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
+
+from .base import DeviceWrapper
+from .common import DPCodeWrapper
+from .status import StatusSnapshot
+
+if TYPE_CHECKING:
+    from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+
+class UpdateRouter:
+    """Route device updates to the wrappers depending on the updated DP codes.
+
+    DPCode wrappers are indexed by their DP code, so that an update only
+    visits the wrappers of the updated DP codes. Overridden `skip_update`
+    methods (e.g. `DeltaIntegerWrapper`) are still called for these wrappers,
+    and are expected to skip updates that do not include their DP code.
+
+    Other wrappers that override `skip_update` are checked on every update.
+
+    Updates without `updated_status_properties` (full refreshes) are
+    compared against a snapshot of the device status, taken by `initialize`
+    or the previous full refresh and kept up to date by later updates, and
+    routed to the wrappers of the changed DP codes only.
+    """
+
+    def __init__(self, wrappers: Iterable[DeviceWrapper[Any]]) -> None:
+        """Init UpdateRouter."""
+        self.status_snapshot = StatusSnapshot()
+        # Keyed by DP code: (wrapper, has custom skip_update)
+        self._wrappers_by_dpcode: dict[
+            str, list[tuple[DPCodeWrapper, bool]]
+        ] = {}
+        self._unrouted_wrappers: list[DeviceWrapper[Any]] = []
+        for wrapper in wrappers:
+            self.add_wrapper(wrapper)
+
+    def add_wrapper(self, wrapper: DeviceWrapper[Any]) -> None:
+        """Add a wrapper to the router."""
+        if isinstance(wrapper, DPCodeWrapper):
+            self._wrappers_by_dpcode.setdefault(wrapper.dpcode, []).append(
+                (
+                    wrapper,
+                    type(wrapper).skip_update is not DPCodeWrapper.skip_update,
+                )
+            )
+        elif type(wrapper).skip_update is not DeviceWrapper.skip_update:
+            self._unrouted_wrappers.append(wrapper)
+
+    def initialize(self, device: CustomerDevice) -> None:
+        """Initialize the router with device data.
+
+        Takes a snapshot of the device status, so that the first full refresh
+        only routes the DP codes that changed since.
+        """
+        self.status_snapshot.take(device)
+
+    def get_updated_wrappers(
+        self,
+        device: CustomerDevice,
+        updated_status_properties: list[str] | None,
+        dp_timestamps: dict[str, int] | None = None,
+    ) -> list[DeviceWrapper[Any]]:
+        """Return the wrappers that must not skip this update.
+
+        This is equivalent to calling `skip_update` on every wrapper, and
+        keeping those that returned False.
+
+        If `updated_status_properties` is None (full refresh), it is replaced
+        by the DP codes changed since the snapshot (all DP codes without a
+        snapshot), so unlike `skip_update`, the wrappers of unchanged DP codes
+        are skipped.
+        """
+        updated_wrappers: list[DeviceWrapper[Any]] = []
+        if updated_status_properties is None:
+            updated_status_properties = list(self.status_snapshot.diff(device))
+        else:
+            self.status_snapshot.update(device, updated_status_properties)
+        if updated_status_properties:
+            visited: set[str] = set()
+            for dpcode in updated_status_properties:
+                if (
+                    wrappers := self._wrappers_by_dpcode.get(dpcode)
+                ) is None or dpcode in visited:
+                    continue
+                visited.add(dpcode)
+                for wrapper, custom_skip_update in wrappers:
+                    if not custom_skip_update or not wrapper.skip_update(
+                        device, updated_status_properties, dp_timestamps
+                    ):
+                        updated_wrappers.append(wrapper)
+
+        for unrouted_wrapper in self._unrouted_wrappers:
+            if not unrouted_wrapper.skip_update(
+                device, updated_status_properties, dp_timestamps
+            ):
+                updated_wrappers.append(unrouted_wrapper)
+
+        return updated_wrappers
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import binascii
 import logging
-from typing import TYPE_CHECKING
+import operator
+from typing import TYPE_CHECKING, Any
 
 from ..helpers.homeassistant import TuyaSensorStateClass
 from ..raw_data_model import ElectricityData
@@ -14,10 +16,13 @@ from .common import (
     DPCodeJsonWrapper,
     DPCodeRawWrapper,
 )
+from .const import ELECTRICITY_DECODE_CACHE
 
 if TYPE_CHECKING:
     from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
+    from .common import RawValueReader
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -43,12 +48,30 @@ class WindDirectionEnumWrapper(DPCodeEnumWrapper, DeviceWrapper[str]):
         "north_north_west": 337.5,
     }
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:  # type: ignore[override]
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read the device value for the dpcode."""
-        if (status := super().read_device_status(device)) is None:
+        if (status := super().read_raw_value(device, raw_value)) is None:
             return None
         return self._WIND_DIRECTIONS.get(status)
 
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        directions = {
+            option: self._WIND_DIRECTIONS.get(option)
+            for option in self.type_information.range
+        }
+        read_raw_value = self.read_raw_value
+
+        def read_wind_direction(device: CustomerDevice, raw_value: Any) -> Any:
+            if type(raw_value) is str and raw_value in directions:
+                return directions[raw_value]
+            # Invalid values are logged by the generic path
+            return read_raw_value(device, raw_value)
+
+        return read_wind_direction
+
 
 class DeltaIntegerWrapper(DPCodeIntegerWrapper):
     """Wrapper for integer values with delta report accumulation.
@@ -100,81 +123,226 @@ class DeltaIntegerWrapper(DPCodeIntegerWrapper):
         return self._accumulated_value
 
 
+def _compile_json_key_reader(
+    read_json: RawValueReader, key: str
+) -> RawValueReader:
+    """Compile a reader of a key of a decoded JSON value."""
+
+    def read_json_key(device: CustomerDevice, raw_value: Any) -> Any:
+        if (status := read_json(device, raw_value)) is None:
+            return None
+        return status.get(key)
+
+    return read_json_key
+
+
 class ElectricityCurrentJsonWrapper(DPCodeJsonWrapper, DeviceWrapper[float]):
     """Custom DPCode Wrapper for extracting electricity current from JSON."""
 
     native_unit = "A"
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:  # type: ignore[override]
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read the device value for the dpcode."""
-        if (status := super().read_device_status(device)) is None:
+        if (status := self._read_shared_value(device, raw_value)) is None:
             return None
         return status.get("electricCurrent")
 
+    def _compile_reader(self) -> RawValueReader:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return _compile_json_key_reader(
+            self._compile_shared_reader(), "electricCurrent"
+        )
+
 
 class ElectricityPowerJsonWrapper(DPCodeJsonWrapper, DeviceWrapper[float]):
     """Custom DPCode Wrapper for extracting electricity power from JSON."""
 
     native_unit = "kW"
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:  # type: ignore[override]
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read the device value for the dpcode."""
-        if (status := super().read_device_status(device)) is None:
+        if (status := self._read_shared_value(device, raw_value)) is None:
             return None
         return status.get("power")
 
+    def _compile_reader(self) -> RawValueReader:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return _compile_json_key_reader(self._compile_shared_reader(), "power")
+
 
 class ElectricityVoltageJsonWrapper(DPCodeJsonWrapper, DeviceWrapper[float]):
     """Custom DPCode Wrapper for extracting electricity voltage from JSON."""
 
     native_unit = "V"
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:  # type: ignore[override]
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read the device value for the dpcode."""
-        if (status := super().read_device_status(device)) is None:
+        if (status := self._read_shared_value(device, raw_value)) is None:
             return None
         return status.get("voltage")
 
+    def _compile_reader(self) -> RawValueReader:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return _compile_json_key_reader(
+            self._compile_shared_reader(), "voltage"
+        )
+
+
+def _decode_electricity_data(raw_value: str) -> ElectricityData | None:
+    """Decode a base64 electricity RAW value."""
+    return ElectricityData.from_bytes(binascii.a2b_base64(raw_value))
+
+
+class ElectricityRawWrapper(DPCodeRawWrapper):
+    """Base DPCode Wrapper for electricity RAW values.
+
+    The RAW value is decoded once per status change, and the decoded frame
+    is shared by all electricity wrappers reading the same DP.
+    """
+
+    def _read_electricity_data(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> ElectricityData | None:
+        """Read the decoded electricity frame for the dpcode."""
+        return ELECTRICITY_DECODE_CACHE.get_or_decode(
+            device.id, self.dpcode, raw_value, _decode_electricity_data
+        )
+
+    def _compile_electricity_reader(self, name: str) -> RawValueReader:
+        """Compile a reader of an attribute of the decoded frame."""
+        dpcode = self.dpcode
+        get_or_decode = ELECTRICITY_DECODE_CACHE.get_or_decode
+        get_value = operator.attrgetter(name)
+
+        def read_electricity(device: CustomerDevice, raw_value: Any) -> Any:
+            if (
+                value := get_or_decode(
+                    device.id, dpcode, raw_value, _decode_electricity_data
+                )
+            ) is None:
+                return None
+            return get_value(value)
+
+        return read_electricity
 
-class ElectricityCurrentRawWrapper(DPCodeRawWrapper, DeviceWrapper[float]):
+
+class ElectricityCurrentRawWrapper(ElectricityRawWrapper, DeviceWrapper[float]):
     """Custom DPCode Wrapper for extracting electricity current from base64."""
 
     native_unit = "mA"
     suggested_unit = "A"
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:  # type: ignore[override]
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read the device value for the dpcode."""
-        if (raw_value := super().read_device_status(device)) is None or (
-            value := ElectricityData.from_bytes(raw_value)
-        ) is None:
+        if (value := self._read_electricity_data(device, raw_value)) is None:
             return None
         return value.current
 
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return self._compile_electricity_reader("current")
+
 
-class ElectricityPowerRawWrapper(DPCodeRawWrapper, DeviceWrapper[float]):
+class ElectricityPowerRawWrapper(ElectricityRawWrapper, DeviceWrapper[float]):
     """Custom DPCode Wrapper for extracting electricity power from base64."""
 
     native_unit = "W"
     suggested_unit = "kW"
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:  # type: ignore[override]
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read the device value for the dpcode."""
-        if (raw_value := super().read_device_status(device)) is None or (
-            value := ElectricityData.from_bytes(raw_value)
-        ) is None:
+        if (value := self._read_electricity_data(device, raw_value)) is None:
             return None
         return value.power
 
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return self._compile_electricity_reader("power")
+
 
-class ElectricityVoltageRawWrapper(DPCodeRawWrapper, DeviceWrapper[float]):
+class ElectricityVoltageRawWrapper(ElectricityRawWrapper, DeviceWrapper[float]):
     """Custom DPCode Wrapper for extracting electricity voltage from base64."""
 
     native_unit = "V"
 
-    def read_device_status(self, device: CustomerDevice) -> float | None:  # type: ignore[override]
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
         """Read the device value for the dpcode."""
-        if (raw_value := super().read_device_status(device)) is None or (
-            value := ElectricityData.from_bytes(raw_value)
-        ) is None:
+        if (value := self._read_electricity_data(device, raw_value)) is None:
             return None
         return value.voltage
+
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return self._compile_electricity_reader("voltage")
+
+
+class ElectricityReactivePowerRawWrapper(
+    ElectricityRawWrapper, DeviceWrapper[float]
+):
+    """Custom DPCode Wrapper for extracting reactive power from base64."""
+
+    native_unit = "var"
+    suggested_unit = "kvar"
+
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
+        """Read the device value for the dpcode."""
+        if (value := self._read_electricity_data(device, raw_value)) is None:
+            return None
+        return value.reactive_power
+
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return self._compile_electricity_reader("reactive_power")
+
+
+class ElectricityApparentPowerRawWrapper(
+    ElectricityRawWrapper, DeviceWrapper[float]
+):
+    """Custom DPCode Wrapper for extracting apparent power from base64."""
+
+    native_unit = "VA"
+    suggested_unit = "kVA"
+
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
+        """Read the device value for the dpcode."""
+        if (value := self._read_electricity_data(device, raw_value)) is None:
+            return None
+        return value.apparent_power
+
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return self._compile_electricity_reader("apparent_power")
+
+
+class ElectricityPowerFactorRawWrapper(
+    ElectricityRawWrapper, DeviceWrapper[float]
+):
+    """Custom DPCode Wrapper for extracting power factor from base64."""
+
+    def read_raw_value(  # type: ignore[override]
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
+        """Read the device value for the dpcode."""
+        if (value := self._read_electricity_data(device, raw_value)) is None:
+            return None
+        return value.power_factor
+
+    def _compile_reader(self) -> RawValueReader | None:
+        """Compile a reader equivalent to `read_raw_value`."""
+        return self._compile_electricity_reader("power_factor")
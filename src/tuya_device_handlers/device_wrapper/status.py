@@ -0,0 +1,89 @@
+"""Tuya device wrapper."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+_MISSING = object()
+
+
+class StatusChange(NamedTuple):
+    """Old and new value of a DP code, None if missing."""
+
+    old: Any
+    new: Any
+
+
+def diff_status(
+    previous: Mapping[str, Any], current: Mapping[str, Any]
+) -> dict[str, StatusChange]:
+    """Return the DP codes whose value changed, with their old/new values."""
+    changes: dict[str, StatusChange] = {}
+    # Compared in C, the common case of a refresh without changes
+    if previous == current:
+        return changes
+    added = 0
+    for dpcode, value in current.items():
+        if (old := previous.get(dpcode, _MISSING)) is _MISSING:
+            changes[dpcode] = StatusChange(None, value)
+            added += 1
+        elif old is not value and old != value:
+            changes[dpcode] = StatusChange(old, value)
+    # Only look for removed DP codes if some are missing
+    if len(current) - added != len(previous):
+        for dpcode in previous.keys() - current.keys():
+            changes[dpcode] = StatusChange(previous[dpcode], None)
+    return changes
+
+
+class StatusSnapshot:
+    """Snapshot of the status of devices.
+
+    Used to compute the changed DP codes of updates that arrive without
+    `updated_status_properties`, such as full refreshes after a reconnect.
+    """
+
+    def __init__(self) -> None:
+        """Init StatusSnapshot."""
+        # Keyed by device ID: status copy
+        self._statuses: dict[str, dict[str, Any]] = {}
+
+    def __contains__(self, device_id: object) -> bool:
+        """Return True if the device has a snapshot."""
+        return device_id in self._statuses
+
+    def take(self, device: CustomerDevice) -> None:
+        """Take a snapshot of the device status."""
+        self._statuses[device.id] = dict(device.status)
+
+    def diff(self, device: CustomerDevice) -> dict[str, StatusChange]:
+        """Return the changes since the last snapshot, and take a new one.
+
+        All DP codes are reported as changed if the device has no snapshot.
+        """
+        current = dict(device.status)
+        previous = self._statuses.get(device.id, {})
+        self._statuses[device.id] = current
+        return diff_status(previous, current)
+
+    def update(self, device: CustomerDevice, dpcodes: Iterable[str]) -> None:
+        """Update the snapshot of a device for the given DP codes.
+
+        Does nothing if the device has no snapshot yet.
+        """
+        if (snapshot := self._statuses.get(device.id)) is None:
+            return
+        status = device.status
+        for dpcode in dpcodes:
+            if (value := status.get(dpcode, _MISSING)) is _MISSING:
+                snapshot.pop(dpcode, None)
+            else:
+                snapshot[dpcode] = value
+
+    def forget_device(self, device_id: str) -> None:
+        """Remove the snapshot of a device."""
+        self._statuses.pop(device_id, None)
@@ -0,0 +1,111 @@
+"""Tuya device wrapper."""
+
+from __future__ import annotations
+
+from collections.abc import KeysView
+import time
+from typing import Any
+
+type WarningKey = tuple[Any, ...]
+
+
+class DeviceWarningRegistry:
+    """Registry of logged warnings, to avoid spamming logs.
+
+    Keeps at most `max_warnings_per_device` warnings for each device,
+    evicting the least recently seen warning when the limit is reached.
+
+    New warnings are also rate limited per device and warning kind (the
+    first two items of the key, e.g. `("enum_out_range", dpcode)`): at most
+    `max_logs_per_kind` are logged every `log_interval` seconds, so that a
+    device cycling through many invalid values does not log every update.
+    """
+
+    def __init__(
+        self,
+        max_warnings_per_device: int = 32,
+        *,
+        max_logs_per_kind: int = 10,
+        log_interval: float = 3600.0,
+    ) -> None:
+        """Init DeviceWarningRegistry."""
+        self.max_warnings_per_device = max_warnings_per_device
+        self.max_logs_per_kind = max_logs_per_kind
+        self.log_interval = log_interval
+        # Keyed by device ID, ordered from least to most recently seen
+        self._warnings: dict[str, dict[WarningKey, None]] = {}
+        # Keyed by device ID
+        self._suppressed: dict[str, int] = {}
+        # Keyed by device ID, then warning kind: (window start, logged count)
+        self._log_windows: dict[str, dict[WarningKey, tuple[float, int]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of devices with warnings."""
+        return len(self._warnings)
+
+    def __contains__(self, device_id: object) -> bool:
+        """Return True if the device has warnings."""
+        return device_id in self._warnings
+
+    def should_log(self, device_id: str, warning_key: WarningKey) -> bool:
+        """Check if a warning has already been logged for a device and add it if not.
+
+        Returns: True if the warning should be logged, False if it was already logged.
+        """
+        try:
+            hash(warning_key)
+        except TypeError:
+            # Unhashable raw value
+            warning_key = tuple(repr(item) for item in warning_key)
+
+        if (device_warnings := self._warnings.get(device_id)) is None:
+            device_warnings = self._warnings[device_id] = {}
+        elif warning_key in device_warnings:
+            # Move to most recently seen
+            del device_warnings[warning_key]
+            device_warnings[warning_key] = None
+            self._suppressed[device_id] = self._suppressed.get(device_id, 0) + 1
+            return False
+        elif len(device_warnings) >= self.max_warnings_per_device:
+            # Evict the least recently seen warning
+            del device_warnings[next(iter(device_warnings))]
+
+        device_warnings[warning_key] = None
+        return self._within_rate_limit(device_id, warning_key[:2])
+
+    def _within_rate_limit(self, device_id: str, kind: WarningKey) -> bool:
+        """Count a new warning of a kind, return False if over the limit."""
+        now = time.monotonic()
+        windows = self._log_windows.setdefault(device_id, {})
+        window_start, count = windows.get(kind, (now, 0))
+        if now - window_start >= self.log_interval:
+            window_start, count = now, 0
+        if count >= self.max_logs_per_kind:
+            self._suppressed[device_id] = self._suppressed.get(device_id, 0) + 1
+            return False
+        windows[kind] = (window_start, count + 1)
+        return True
+
+    def get(self, device_id: str) -> KeysView[WarningKey] | None:
+        """Return the warnings logged for a device."""
+        if (device_warnings := self._warnings.get(device_id)) is None:
+            return None
+        return device_warnings.keys()
+
+    def suppressed_count(self, device_id: str | None = None) -> int:
+        """Return the number of suppressed warnings, for a device or overall."""
+        if device_id is None:
+            return sum(self._suppressed.values())
+        return self._suppressed.get(device_id, 0)
+
+    def forget_device(self, device_id: str) -> None:
+        """Remove all warnings of a device, e.g. when it is removed."""
+        self._warnings.pop(device_id, None)
+        self._suppressed.pop(device_id, None)
+        self._log_windows.pop(device_id, None)
+
+    def clear(self) -> None:
+        """Remove all warnings."""
+        self._warnings.clear()
+        self._suppressed.clear()
+        self._log_windows.clear()
@@ -2,37 +2,416 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+import functools
 import importlib
 import importlib.util
 import logging
+import os
 import pathlib
 import pkgutil
 import sys
-from typing import TYPE_CHECKING
+import types
+from typing import TYPE_CHECKING, Any
+import weakref
 
 from tuya_device_handlers import TUYA_QUIRKS_REGISTRY
+from tuya_device_handlers.registry import WILDCARD, QuirksRegistry
+
+if TYPE_CHECKING:
+    from tuya_device_handlers.registry import FileSignature
 
 _LOGGER = logging.getLogger(__name__)
 
+_MAGIC = importlib.util.MAGIC_NUMBER.hex()
+
+DECLARATIVE_CACHE_FILE = "declarative_quirks.marshal"
+"""Name of the compiled declarative quirks, in the bytecode cache directory."""
+
+MANIFEST_PATH = pathlib.Path(__file__).with_name("manifest.json")
+"""Manifest mapping (category, product_id) to the quirks module."""
+
+QUIRKS_MODULES_CHUNK_SIZE = 8
+"""Number of built-in quirks modules imported per executor job."""
+
+# Keyed by registry: names of the quirks modules loaded into it
+_LOADED_MODULES: weakref.WeakKeyDictionary[QuirksRegistry, set[str]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_quirks_modules() -> list[str]:
+    """List the quirks modules, without importing them.
+
+    Private modules (e.g. `__main__`) are not quirks modules.
+    """
+    return sorted(
+        modname
+        for _importer, modname, _ispkg in pkgutil.walk_packages(
+            path=__path__,
+            prefix=__name__ + ".",
+        )
+        if not modname.rpartition(".")[2].startswith("_")
+    )
+
+
+def _get_pending_quirks_modules(registry: QuirksRegistry) -> list[str]:
+    """List the quirks modules not loaded into `registry` yet."""
+    loaded_modnames = _LOADED_MODULES.get(registry, set())
+    return [
+        modname
+        for modname in _get_quirks_modules()
+        if modname not in loaded_modnames
+    ]
+
+
+def _import_quirks_modules(
+    modnames: list[str], registry: QuirksRegistry = TUYA_QUIRKS_REGISTRY
+) -> None:
+    """Load quirks modules into `registry`, once per registry.
+
+    Quirks modules register into `TUYA_QUIRKS_REGISTRY` when executed, so
+    their registrations are collected, then added to `registry` in a single
+    snapshot, without replacing custom quirks. Only the default registry imports them into
+    `sys.modules`, other registries execute them again.
+    """
+    loaded_modnames = _LOADED_MODULES.setdefault(registry, set())
+    module_registry = QuirksRegistry()
+    error: BaseException | None = None
+    with (
+        module_registry.batch_writes(),
+        module_registry.redirect_registrations(),
+    ):
+        try:
+            for modname in modnames:
+                if modname in loaded_modnames:
+                    continue
+                _LOGGER.debug("Loading quirks module %r", modname)
+                if registry is TUYA_QUIRKS_REGISTRY:
+                    importlib.import_module(modname)
+                else:
+                    spec = importlib.util.find_spec(modname)
+                    if spec is None or spec.loader is None:
+                        raise ImportError(f"No module named {modname!r}")
+                    module = importlib.util.module_from_spec(spec)
+                    spec.loader.exec_module(module)
+                loaded_modnames.add(modname)
+        except BaseException as err:
+            # The modules loaded before the error are still registered
+            error = err
+    registry.register_many(module_registry.iter_quirks(), keep_custom=True)
+    if error is not None:
+        raise error
+
+
+def _load_manifest() -> dict[str, Any] | None:
+    """Load the quirks manifest."""
+    import json  # noqa: PLC0415
+
+    try:
+        manifest: dict[str, Any] = json.loads(MANIFEST_PATH.read_text())
+    except (OSError, ValueError):
+        _LOGGER.debug("Unable to load quirks manifest %s", MANIFEST_PATH)
+        return None
+    return manifest
+
+
+def generate_manifest() -> dict[str, Any]:
+    """Generate the quirks manifest, by importing all quirks modules."""
+    modnames = _get_quirks_modules()
+    _import_quirks_modules(modnames)
+    modules_by_file = {
+        pathlib.Path(file): modname
+        for modname in modnames
+        if (file := sys.modules[modname].__file__)
+    }
+    quirks: dict[str, dict[str, str]] = {}
+    for category, product_id, quirk in TUYA_QUIRKS_REGISTRY.iter_quirks():
+        if (modname := modules_by_file.get(quirk.quirk_file)) is not None:
+            quirks.setdefault(category, {})[product_id] = modname
+    return {"modules": modnames, "quirks": quirks}
 
-def register_tuya_quirks(custom_quirks_path: str | None = None) -> None:
-    """Register all available quirks.
 
-    - remove custom quirks from `custom_quirks_path`
-    - add quirks from `devices` subfolder
-    - add custom quirks from `custom_quirks_path`
+def write_manifest() -> None:
+    """Regenerate the quirks manifest file."""
+    import json  # noqa: PLC0415
+
+    MANIFEST_PATH.write_text(
+        json.dumps(generate_manifest(), indent=2, sort_keys=True) + "\n"
+    )
+
+
+def _load_quirks_module(
+    modname: str,
+    category: str,
+    product_id: str,
+    modnames: list[str],
+    registry: QuirksRegistry,
+) -> None:
+    """Import a quirks module on first lookup of a device type."""
+    try:
+        _import_quirks_modules([modname], registry)
+    except ImportError:
+        _LOGGER.debug("Unable to import quirks module %r", modname)
+    if (category, product_id) not in registry:
+        _LOGGER.warning(
+            "Quirks manifest is stale, loading all quirks modules"
+            " (please regenerate it with `python -m %s`)",
+            __name__,
+        )
+        _import_quirks_modules(modnames, registry)
+
+
+def _register_builtin_quirks(registry: QuirksRegistry) -> None:
+    """Register the quirks from the `devices` subfolder.
+
+    Quirks modules listed in the manifest are only imported on first lookup.
+    If the manifest does not match the quirks modules, all are imported.
     """
+    modnames = _get_quirks_modules()
+    if (manifest := _load_manifest()) is None or manifest.get(
+        "modules"
+    ) != modnames:
+        _LOGGER.debug("Quirks manifest is stale, loading all quirks modules")
+        _import_quirks_modules(modnames, registry)
+        return
 
-    if custom_quirks_path is not None:
-        TUYA_QUIRKS_REGISTRY.purge_custom_quirks(custom_quirks_path)
+    # Wildcard rules are not looked up by key
+    loaded_modnames = _LOADED_MODULES.get(registry, set())
+    eager_modnames: set[str] = set()
+    with registry.batch_writes():
+        for category, category_modules in manifest["quirks"].items():
+            for product_id, modname in category_modules.items():
+                if modname in loaded_modnames:
+                    continue
+                if product_id.endswith(WILDCARD):
+                    eager_modnames.add(modname)
+                    continue
+                registry.register_lazy(
+                    category,
+                    product_id,
+                    functools.partial(
+                        _load_quirks_module,
+                        modname,
+                        category,
+                        product_id,
+                        modnames,
+                    ),
+                )
+    if eager_modnames:
+        _import_quirks_modules(sorted(eager_modnames), registry)
 
-    # Import all quirks in the `tuya_device_handlers` package first
-    for _importer, modname, _ispkg in pkgutil.walk_packages(
-        path=__path__,
-        prefix=__name__ + ".",
+
+def get_file_signature(
+    quirk_file: pathlib.Path, previous: FileSignature | None
+) -> FileSignature:
+    """Get the signature of a quirk file.
+
+    The content is only hashed if the mtime or size changed, the digest
+    decides whether the file changed.
+    """
+    import hashlib  # noqa: PLC0415
+
+    stat = quirk_file.stat()
+    if previous is not None and previous[:2] == (
+        stat.st_mtime_ns,
+        stat.st_size,
     ):
-        _LOGGER.debug("Loading quirks module %r", modname)
-        importlib.import_module(modname)
+        return previous
+    digest = hashlib.blake2b(quirk_file.read_bytes(), digest_size=16)
+    return (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+
+
+def _discover_custom_quirks(path: pathlib.Path) -> list[pkgutil.ModuleInfo]:
+    """List the custom quirks modules."""
+    # Treat the custom quirk path (e.g. `/config/tuya_quirks/`) itself as a module
+    return list(pkgutil.walk_packages(path=[str(path)]))
+
+
+def _get_cached_code(
+    cache_dir: pathlib.Path, modname: str, origin: str, digest: str
+) -> types.CodeType:
+    """Get the code of a custom quirks module, from the bytecode cache.
+
+    Cache entries are keyed by source hash, Python magic number and
+    optimization level, and are compiled (then written atomically) on cache
+    miss.
+    """
+    import glob  # noqa: PLC0415
+    import marshal  # noqa: PLC0415
+    import tempfile  # noqa: PLC0415
+
+    cache_tag = f"{_MAGIC}-opt{sys.flags.optimize}"
+    cache_file = cache_dir / f"{modname}.{digest}.{cache_tag}.bin"
+    try:
+        code = marshal.loads(cache_file.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, EOFError, ValueError, TypeError):
+        _LOGGER.debug("Invalid bytecode cache %s", cache_file)
+    else:
+        if isinstance(code, types.CodeType):
+            return code
+
+    code = compile(
+        pathlib.Path(origin).read_bytes(), origin, "exec", dont_inherit=True
+    )
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        # The temporary file is removed on exit if it could not be replaced
+        with tempfile.NamedTemporaryFile(
+            dir=cache_dir, prefix=f".{modname}.", delete_on_close=False
+        ) as temp_file:
+            temp_file.write(marshal.dumps(code))
+            temp_file.close()
+            os.replace(temp_file.name, cache_file)
+        # Remove the entries of previous versions, not those of submodules
+        stale_pattern = (
+            f"{glob.escape(modname)}.{'[0-9a-f]' * len(digest)}.*.bin"
+        )
+        for stale_file in cache_dir.glob(stale_pattern):
+            if stale_file != cache_file:
+                stale_file.unlink(missing_ok=True)
+    except OSError:
+        _LOGGER.debug("Unable to write bytecode cache %s", cache_file)
+    return code
+
+
+def _load_custom_quirk_module(
+    registry: QuirksRegistry,
+    module_info: pkgutil.ModuleInfo,
+    cache_dir: pathlib.Path | None = None,
+) -> tuple[pathlib.Path | None, bool]:
+    """Load a custom quirks module, if it changed since the last load.
+
+    Returns the module file, and True if the module was (re-)executed.
+    """
+    importer, modname, _ispkg = module_info
+    quirk_file: pathlib.Path | None = None
+    try:
+        spec = importer.find_spec(modname)  # type: ignore[call-arg]
+        if TYPE_CHECKING:
+            assert spec is not None
+            assert spec.loader is not None
+            assert spec.origin is not None
+
+        quirk_file = pathlib.Path(spec.origin)
+        previous = registry.get_file_signature(quirk_file)
+        signature = get_file_signature(quirk_file, previous)
+        # A touched file is hashed again, but only executed if its content
+        # changed
+        if (
+            previous is not None
+            and signature[2] == previous[2]
+            and modname in sys.modules
+        ):
+            _LOGGER.debug("Custom quirk module %r is unchanged", modname)
+            if signature != previous:
+                registry.set_file_signature(quirk_file, signature)
+            return quirk_file, False
+
+        _LOGGER.debug("Loading custom quirk module %r", modname)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[modname] = module
+        module_registry = QuirksRegistry()
+        try:
+            with (
+                module_registry.batch_writes(),
+                module_registry.redirect_registrations(),
+            ):
+                if cache_dir is None:
+                    spec.loader.exec_module(module)
+                else:
+                    exec(
+                        _get_cached_code(
+                            cache_dir, modname, spec.origin, signature[2]
+                        ),
+                        module.__dict__,
+                    )
+        finally:
+            # Replaced in a single snapshot, lookups never miss the quirks
+            with registry.batch_writes():
+                registry.purge_quirk_file(quirk_file)
+                registry.register_many(module_registry.iter_quirks())
+    except Exception:
+        _LOGGER.exception(
+            "Unexpected exception importing custom quirk %r", modname
+        )
+        return quirk_file, False
+    registry.set_file_signature(quirk_file, signature)
+    return quirk_file, True
+
+
+def _purge_deleted_custom_quirks(
+    registry: QuirksRegistry,
+    path: pathlib.Path,
+    found_files: set[pathlib.Path | None],
+) -> None:
+    """Remove the quirks of deleted custom quirks files."""
+    registry.purge_quirk_files(
+        quirk_file
+        for quirk_file in registry.get_quirk_files(str(path))
+        if quirk_file not in found_files
+    )
+
+
+def _load_declarative_quirks(
+    registry: QuirksRegistry,
+    path: pathlib.Path,
+    cache_dir: pathlib.Path | None,
+) -> tuple[set[pathlib.Path], bool]:
+    """Load the declarative (JSON) custom quirks that changed."""
+    from tuya_device_handlers.builder.declarative import (  # noqa: PLC0415
+        register_declarative_quirks,
+    )
+
+    return register_declarative_quirks(
+        registry,
+        path,
+        None if cache_dir is None else cache_dir / DECLARATIVE_CACHE_FILE,
+    )
+
+
+def _load_custom_quirks(
+    registry: QuirksRegistry,
+    path: pathlib.Path,
+    cache_dir: pathlib.Path | None,
+) -> bool:
+    """Load the custom quirks modules that changed since the last load.
+
+    Returns True if any module was (re-)executed.
+    """
+    json_files, loaded = _load_declarative_quirks(registry, path, cache_dir)
+    found_files: set[pathlib.Path | None] = set(json_files)
+    for module_info in _discover_custom_quirks(path):
+        quirk_file, module_loaded = _load_custom_quirk_module(
+            registry, module_info, cache_dir
+        )
+        found_files.add(quirk_file)
+        loaded |= module_loaded
+    _purge_deleted_custom_quirks(registry, path, found_files)
+    return loaded
+
+
+def register_tuya_quirks(
+    custom_quirks_path: str | None = None,
+    registry: QuirksRegistry = TUYA_QUIRKS_REGISTRY,
+    cache_dir: str | None = None,
+) -> None:
+    """Register all available quirks in `registry`.
+
+    - add quirks from `devices` subfolder (lazily, based on the manifest)
+    - add or reload custom quirks from `custom_quirks_path`, if their file
+      changed since the last call, and remove quirks of deleted files
+
+    Custom quirks are Python modules, or declarative JSON files (see
+    `tuya_device_handlers.builder.declarative`).
+
+    If `cache_dir` is set, the compiled custom quirks are cached there, and
+    reused on subsequent starts.
+    """
+
+    _register_builtin_quirks(registry)
 
     if custom_quirks_path is None:
         return
@@ -40,27 +419,79 @@ def register_tuya_quirks(custom_quirks_path: str | None = None) -> None:
     path = pathlib.Path(custom_quirks_path)
     _LOGGER.debug("Loading custom quirks from %r", path)
 
-    loaded = False
+    if _load_custom_quirks(
+        registry, path, None if cache_dir is None else pathlib.Path(cache_dir)
+    ):
+        _LOGGER.warning(
+            "Loaded custom quirks. Please contribute them to https://github.com/TBD"
+        )
 
-    # Treat the custom quirk path (e.g. `/config/tuya_quirks/`) itself as a module
-    for importer, modname, _ispkg in pkgutil.walk_packages(path=[str(path)]):
-        _LOGGER.debug("Loading custom quirk module %r", modname)
 
-        try:
-            spec = importer.find_spec(modname)  # type: ignore[call-arg]
-            if TYPE_CHECKING:
-                assert spec is not None
-                assert spec.loader is not None
-
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[modname] = module
-            spec.loader.exec_module(module)
-        except Exception:
-            _LOGGER.exception(
-                "Unexpected exception importing custom quirk %r", modname
-            )
-        else:
-            loaded = True
+async def async_register_tuya_quirks(
+    custom_quirks_path: str | None = None,
+    registry: QuirksRegistry = TUYA_QUIRKS_REGISTRY,
+    progress_callback: Callable[[int, int], None] | None = None,
+    cache_dir: str | None = None,
+) -> None:
+    """Register all available quirks in `registry`, from an event loop.
+
+    Same as `register_tuya_quirks`, but discovery and quirks modules run in
+    the default executor, so the event loop is never blocked. Built-in
+    quirks modules are imported in chunks (instead of on first lookup, which
+    would import them from the event loop), then custom quirks modules one
+    by one: lookups can proceed meanwhile.
+
+    `progress_callback` is called with (loaded, total) jobs, each built-in
+    chunk and custom quirks module being a job.
+    """
+    import asyncio  # noqa: PLC0415
+
+    loop = asyncio.get_running_loop()
+    modnames = await loop.run_in_executor(
+        None, _get_pending_quirks_modules, registry
+    )
+    chunks = [
+        modnames[index : index + QUIRKS_MODULES_CHUNK_SIZE]
+        for index in range(0, len(modnames), QUIRKS_MODULES_CHUNK_SIZE)
+    ]
+    path = (
+        None if custom_quirks_path is None else pathlib.Path(custom_quirks_path)
+    )
+    modules = (
+        []
+        if path is None
+        else await loop.run_in_executor(None, _discover_custom_quirks, path)
+    )
+    total = len(chunks) + len(modules)
+
+    for index, chunk in enumerate(chunks, 1):
+        await loop.run_in_executor(
+            None, _import_quirks_modules, chunk, registry
+        )
+        if progress_callback is not None:
+            progress_callback(index, total)
+
+    if path is None:
+        return
+
+    _LOGGER.debug("Loading custom quirks from %r", path)
+
+    cache_path = None if cache_dir is None else pathlib.Path(cache_dir)
+    json_files, loaded = await loop.run_in_executor(
+        None, _load_declarative_quirks, registry, path, cache_path
+    )
+    found_files: set[pathlib.Path | None] = set(json_files)
+    for index, module_info in enumerate(modules, len(chunks) + 1):
+        quirk_file, module_loaded = await loop.run_in_executor(
+            None, _load_custom_quirk_module, registry, module_info, cache_path
+        )
+        found_files.add(quirk_file)
+        loaded |= module_loaded
+        if progress_callback is not None:
+            progress_callback(index, total)
+    await loop.run_in_executor(
+        None, _purge_deleted_custom_quirks, registry, path, found_files
+    )
 
     if loaded:
         _LOGGER.warning(
@@ -0,0 +1,9 @@
+"""Regenerate the quirks manifest."""
+
+from __future__ import annotations
+
+from . import MANIFEST_PATH, write_manifest
+
+if __name__ == "__main__":
+    write_manifest()
+    print(f"Wrote {MANIFEST_PATH}")
@@ -2,15 +2,20 @@
 
 from __future__ import annotations
 
-from .homeassistant import (
-    TuyaClimateHVACMode,
-    TuyaCoverDeviceClass,
-    TuyaEntityCategory,
-    TuyaSensorDeviceClass,
-    TuyaSensorStateClass,
-    TuyaSwitchDeviceClass,
-)
-from .utils import parse_enum
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from .homeassistant import (
+        TuyaClimateHVACMode,
+        TuyaCoverDeviceClass,
+        TuyaEntityCategory,
+        TuyaSensorDeviceClass,
+        TuyaSensorStateClass,
+        TuyaSwitchDeviceClass,
+    )
+    from .utils import parse_enum
 
 __all__ = [
     "TuyaClimateHVACMode",
@@ -21,3 +26,16 @@ __all__ = [
     "TuyaSwitchDeviceClass",
     "parse_enum",
 ]
+
+__getattr__, __dir__ = lazy_attributes(
+    __name__,
+    {
+        "TuyaClimateHVACMode": ".homeassistant",
+        "TuyaCoverDeviceClass": ".homeassistant",
+        "TuyaEntityCategory": ".homeassistant",
+        "TuyaSensorDeviceClass": ".homeassistant",
+        "TuyaSensorStateClass": ".homeassistant",
+        "TuyaSwitchDeviceClass": ".homeassistant",
+        "parse_enum": ".utils",
+    },
+)
@@ -1,9 +1,124 @@
 """Parsers for RAW (base64-encoded bytes) values."""
 
-from dataclasses import dataclass
+from array import array
+from collections.abc import Iterable
+from dataclasses import dataclass, field
 import struct
 from typing import Self
 
+# 24-bit big-endian fields are unpacked as a high byte and a low short
+_ELECTRICITY_STRUCT = struct.Struct(">2xHBHBHBHBHB")
+_ELECTRICITY_LEGACY_STRUCT = struct.Struct(">HBHBH")
+
+type BytesLike = bytes | bytearray | memoryview
+
+type _ElectricityValues = tuple[
+    int, int, float, int | None, int | None, float | None
+]
+
+
+def _decode_electricity(data: BytesLike) -> _ElectricityValues | None:
+    """Decode electricity bytes, without copying the input.
+
+    Slices of a larger buffer can be decoded in place as `memoryview`.
+    """
+    # Format:
+    # - legacy: 8 bytes
+    # - v01: [ver=0x01][len=0x0F][data(15 bytes)]
+    # - v02: [ver=0x02][len=0x0F][data(15 bytes)][sign_bitmap(1 byte)]
+    # Data layout (big-endian):
+    # - voltage: 2B, unit 0.1 V
+    # - current: 3B, unit 0.001 A (i.e., mA)
+    # - active power: 3B, unit 0.001 kW (i.e., W)
+    # - reactive power: 3B, unit 0.001 kVar
+    # - apparent power: 3B, unit 0.001 kVA
+    # - power factor: 1B, unit 0.01
+    # Sign bitmap (v02 only, 1 bit means negative):
+    # - bit0 current
+    # - bit1 active power
+    # - bit2 reactive
+    # - bit3 power factor
+    length = len(data)
+
+    if (length == 17 and data[0] == 0x01 and data[1] == 0x0F) or (
+        length == 18 and data[0] == 0x02 and data[1] == 0x0F
+    ):
+        (
+            voltage,
+            current_high,
+            current_low,
+            power_high,
+            power_low,
+            reactive_high,
+            reactive_low,
+            apparent_high,
+            apparent_low,
+            power_factor_raw,
+        ) = _ELECTRICITY_STRUCT.unpack_from(data)
+        current = current_high << 16 | current_low
+        power = power_high << 16 | power_low
+        reactive_power = reactive_high << 16 | reactive_low
+        power_factor = power_factor_raw / 100.0
+
+        if length == 18 and (sign_bitmap := data[17]):
+            if sign_bitmap & 0x01:
+                current = -current
+            if sign_bitmap & 0x02:
+                power = -power
+            if sign_bitmap & 0x04:
+                reactive_power = -reactive_power
+            if sign_bitmap & 0x08:
+                power_factor = -power_factor
+
+        return (
+            current,
+            power,
+            voltage / 10.0,
+            reactive_power,
+            apparent_high << 16 | apparent_low,
+            power_factor,
+        )
+
+    if length >= 8:
+        voltage, current_high, current_low, power_high, power_low = (
+            _ELECTRICITY_LEGACY_STRUCT.unpack_from(data)
+        )
+        return (
+            current_high << 16 | current_low,
+            power_high << 16 | power_low,
+            voltage / 10.0,
+            None,
+            None,
+            None,
+        )
+
+    return None
+
+
+def _float_array() -> array[float]:
+    return array("d")
+
+
+@dataclass(kw_only=True)
+class ElectricityDataColumns:
+    """Columnar electricity values, one row per decoded frame.
+
+    Each column is an `array("d")`, which can be wrapped without copying,
+    for example with `numpy.frombuffer`. Unavailable values (and all values
+    of invalid frames) are stored as NaN.
+    """
+
+    current: array[float] = field(default_factory=_float_array)
+    power: array[float] = field(default_factory=_float_array)
+    voltage: array[float] = field(default_factory=_float_array)
+    reactive_power: array[float] = field(default_factory=_float_array)
+    apparent_power: array[float] = field(default_factory=_float_array)
+    power_factor: array[float] = field(default_factory=_float_array)
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(self.voltage)
+
 
 @dataclass(kw_only=True)
 class ElectricityData:
@@ -12,49 +127,65 @@ class ElectricityData:
     current: float
     power: float
     voltage: float
+    # Only available in v01/v02 formats
+    reactive_power: float | None = None
+    apparent_power: float | None = None
+    power_factor: float | None = None
 
     @classmethod
-    def from_bytes(cls, raw: bytes) -> Self | None:
+    def from_bytes(cls, raw: BytesLike) -> Self | None:
         """Parse bytes and return an ElectricityValue object."""
-        # Format:
-        # - legacy: 8 bytes
-        # - v01: [ver=0x01][len=0x0F][data(15 bytes)]
-        # - v02: [ver=0x02][len=0x0F][data(15 bytes)][sign_bitmap(1 byte)]
-        # Data layout (big-endian):
-        # - voltage: 2B, unit 0.1 V
-        # - current: 3B, unit 0.001 A (i.e., mA)
-        # - active power: 3B, unit 0.001 kW (i.e., W)
-        # - reactive power: 3B, unit 0.001 kVar
-        # - apparent power: 3B, unit 0.001 kVA
-        # - power factor: 1B, unit 0.01
-        # Sign bitmap (v02 only, 1 bit means negative):
-        # - bit0 current
-        # - bit1 active power
-        # - bit2 reactive
-        # - bit3 power factor
-
-        is_v1 = len(raw) == 17 and raw[0:2] == b"\x01\x0f"
-        is_v2 = len(raw) == 18 and raw[0:2] == b"\x02\x0f"
-        if is_v1 or is_v2:
-            data = raw[2:17]
-
-            voltage = struct.unpack(">H", data[0:2])[0] / 10.0
-            current = struct.unpack(">L", b"\x00" + data[2:5])[0]
-            power = struct.unpack(">L", b"\x00" + data[5:8])[0]
-
-            if is_v2:
-                sign_bitmap = raw[17]
-                if sign_bitmap & 0x01:
-                    current = -current
-                if sign_bitmap & 0x02:
-                    power = -power
-
-            return cls(current=current, power=power, voltage=voltage)
-
-        if len(raw) >= 8:
-            voltage = struct.unpack(">H", raw[0:2])[0] / 10.0
-            current = struct.unpack(">L", b"\x00" + raw[2:5])[0]
-            power = struct.unpack(">L", b"\x00" + raw[5:8])[0]
-            return cls(current=current, power=power, voltage=voltage)
-
-        return None
+        if (values := _decode_electricity(raw)) is None:
+            return None
+        (
+            current,
+            power,
+            voltage,
+            reactive_power,
+            apparent_power,
+            power_factor,
+        ) = values
+        return cls(
+            current=current,
+            power=power,
+            voltage=voltage,
+            reactive_power=reactive_power,
+            apparent_power=apparent_power,
+            power_factor=power_factor,
+        )
+
+    @staticmethod
+    def decode_many(frames: Iterable[BytesLike]) -> ElectricityDataColumns:
+        """Decode many frames into columns, without creating objects per frame."""
+        nan = float("nan")
+        columns = ElectricityDataColumns()
+        append_current = columns.current.append
+        append_power = columns.power.append
+        append_voltage = columns.voltage.append
+        append_reactive_power = columns.reactive_power.append
+        append_apparent_power = columns.apparent_power.append
+        append_power_factor = columns.power_factor.append
+        for frame in frames:
+            if (values := _decode_electricity(frame)) is None:
+                current = power = voltage = nan
+                reactive_power = apparent_power = power_factor = None
+            else:
+                (
+                    current,
+                    power,
+                    voltage,
+                    reactive_power,
+                    apparent_power,
+                    power_factor,
+                ) = values
+            append_current(current)
+            append_power(power)
+            append_voltage(voltage)
+            append_reactive_power(
+                nan if reactive_power is None else reactive_power
+            )
+            append_apparent_power(
+                nan if apparent_power is None else apparent_power
+            )
+            append_power_factor(nan if power_factor is None else power_factor)
+        return columns
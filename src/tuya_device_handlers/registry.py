@@ -2,33 +2,272 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterable, Iterator, Mapping
+import contextlib
+from contextvars import ContextVar
 import logging
-from typing import TYPE_CHECKING, Self
+import threading
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+from tuya_device_handlers._bounded import BoundedDict
 
 if TYPE_CHECKING:
+    import pathlib
+
     from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
     from tuya_device_handlers.builder import TuyaDeviceQuirk
 
 _LOGGER = logging.getLogger(__name__)
 
+type FileSignature = tuple[int, int, str]
+"""Signature of a quirk file: (mtime_ns, size, digest)."""
+
+WILDCARD = "*"
+
+RESOLUTION_CACHE_SIZE = 4096
+"""Maximum number of device resolutions kept in the cache."""
+
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+
+class ResolutionCacheInfo(NamedTuple):
+    """Hit/miss statistics of the resolution cache."""
+
+    hits: int
+    misses: int
+    currsize: int
+
+
+def _get_prefix(category: str, product_id: str) -> str | None:
+    """Get the product_id prefix of a wildcard rule, or None if exact.
+
+    Only a trailing wildcard is supported (`*` matches the whole category).
+    """
+    if WILDCARD in category:
+        raise ValueError(f"Wildcards are not supported in category {category}")
+    if WILDCARD not in product_id:
+        return None
+    prefix = product_id[:-1]
+    if product_id[-1] != WILDCARD or WILDCARD in prefix:
+        raise ValueError(
+            f"Wildcards are only supported at the end of product_id {product_id}"
+        )
+    return prefix
+
+
+class _PrefixTrie:
+    """Product_id prefix matcher, for the wildcard rules of a category."""
+
+    __slots__ = ("children", "quirk")
+
+    def __init__(self) -> None:
+        """Initialize the trie node."""
+        self.children: dict[str, _PrefixTrie] = {}
+        self.quirk: TuyaDeviceQuirk | None = None
+
+    @classmethod
+    def compile(
+        cls, category_quirks: Mapping[str, TuyaDeviceQuirk]
+    ) -> _PrefixTrie | None:
+        """Compile the wildcard rules, or return None if there are none."""
+        root: _PrefixTrie | None = None
+        for product_id, quirk in category_quirks.items():
+            if product_id[-1:] != WILDCARD:
+                continue
+            node = root = root or cls()
+            for char in product_id[:-1]:
+                if (child := node.children.get(char)) is None:
+                    child = node.children[char] = cls()
+                node = child
+            node.quirk = quirk
+        return root
+
+    def match(self, product_id: str) -> TuyaDeviceQuirk | None:
+        """Get the quirk of the longest matching prefix."""
+        node = self
+        quirk = self.quirk
+        for char in product_id:
+            if (child := node.children.get(char)) is None:
+                break
+            node = child
+            if node.quirk is not None:
+                quirk = node.quirk
+        return quirk
 
-class QuirksRegistry:
-    """Registry for Tuya quirks."""
 
-    instance: Self
+type _DeviceKey = tuple[str, str, str]
+
+type LazyLoader = Callable[[QuirksRegistry], None]
+"""Loader of a device type, called with the registry to register into."""
+
+_REGISTRATION_TARGET: ContextVar[QuirksRegistry | None] = ContextVar(
+    "_REGISTRATION_TARGET", default=None
+)
+
+
+class _RegistrySnapshot:
+    """Immutable state of the registry, published by writers.
+
+    The mappings must not be modified once published. The compiled prefix
+    tries and the resolution cache are filled on demand by readers.
+    """
+
+    __slots__ = ("lazy_loaders", "prefix_tries", "quirks", "resolution_cache")
+
+    def __init__(
+        self,
+        *,
+        quirks: Mapping[str, Mapping[str, TuyaDeviceQuirk]] = _EMPTY,
+        lazy_loaders: Mapping[str, Mapping[str, LazyLoader]] = _EMPTY,
+        prefix_tries: dict[str, _PrefixTrie | None] | None = None,
+    ) -> None:
+        """Initialize the snapshot."""
+        self.quirks = quirks
+        self.lazy_loaders = lazy_loaders
+        self.prefix_tries = {} if prefix_tries is None else prefix_tries
+        self.resolution_cache: BoundedDict[
+            _DeviceKey, TuyaDeviceQuirk | None
+        ] = BoundedDict(RESOLUTION_CACHE_SIZE)
+
+
+class _WriteBatch:
+    """Pending changes to a snapshot, published once by the writer.
+
+    Categories are copied on first modification, so that a batch of writes
+    copies each modified category once.
+    """
+
+    __slots__ = (
+        "changed",
+        "file_backups",
+        "lazy_loaders",
+        "modified_lazy_loaders",
+        "modified_quirks",
+        "quirks",
+        "snapshot",
+    )
+
+    def __init__(self, snapshot: _RegistrySnapshot) -> None:
+        """Initialize the batch."""
+        self.snapshot = snapshot
+        self.quirks = dict(snapshot.quirks)
+        self.lazy_loaders = dict(snapshot.lazy_loaders)
+        # Keyed by category: copies of the snapshot mappings
+        self.modified_quirks: dict[str, dict[str, TuyaDeviceQuirk]] = {}
+        self.modified_lazy_loaders: dict[str, dict[str, LazyLoader]] = {}
+        # Keyed by quirk file: (registrations, signature) before the batch
+        self.file_backups: dict[
+            pathlib.Path,
+            tuple[set[tuple[str, str]] | None, FileSignature | None],
+        ] = {}
+        self.changed = False
+
+    def get_quirks(self, category: str) -> dict[str, TuyaDeviceQuirk]:
+        """Get the quirks of a category, to modify them."""
+        self.changed = True
+        if (category_quirks := self.modified_quirks.get(category)) is None:
+            category_quirks = self.modified_quirks[category] = dict(
+                self.quirks.get(category, _EMPTY)
+            )
+            self.quirks[category] = category_quirks
+        return category_quirks
+
+    def get_lazy_loaders(self, category: str) -> dict[str, LazyLoader]:
+        """Get the lazy loaders of a category, to modify them."""
+        self.changed = True
+        if (loaders := self.modified_lazy_loaders.get(category)) is None:
+            loaders = self.modified_lazy_loaders[category] = dict(
+                self.lazy_loaders.get(category, _EMPTY)
+            )
+            self.lazy_loaders[category] = loaders
+        return loaders
+
+
+class QuirksRegistry:
+    """Registry for Tuya quirks.
 
-    _quirks: dict[str, dict[str, TuyaDeviceQuirk]]
+    Lookups read an immutable snapshot without locking. Writers copy the
+    categories they modify, and atomically publish a new snapshot. Use
+    `batch_writes` to publish many writes in a single snapshot.
+    """
 
-    def __new__(cls) -> Self:
-        """Create a new class."""
-        if not hasattr(cls, "instance"):
-            cls.instance = super().__new__(cls)
-        return cls.instance
+    _snapshot: _RegistrySnapshot
+    _write_lock: threading.RLock
+    _loader_lock: threading.RLock
+    _batch: _WriteBatch | None
+    _quirks_by_file: dict[pathlib.Path, set[tuple[str, str]]]
+    _file_signatures: dict[pathlib.Path, FileSignature]
+    _cache_hits: int
+    _cache_misses: int
 
     def __init__(self) -> None:
         """Initialize the registry."""
-        self._quirks = {}
+        self._snapshot = _RegistrySnapshot()
+        self._write_lock = threading.RLock()
+        self._loader_lock = threading.RLock()
+        self._batch = None
+        # Only accessed by writers
+        self._quirks_by_file = {}
+        self._file_signatures = {}
+        # Best-effort statistics, increments can be lost between threads
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def __contains__(self, device_type: object) -> bool:
+        """Return True if a quirk is registered for (category, product_id)."""
+        if not isinstance(device_type, tuple) or len(device_type) != 2:
+            return False
+        category, product_id = device_type
+        return product_id in self._snapshot.quirks.get(category, _EMPTY)
+
+    @contextlib.contextmanager
+    def _write(self) -> Iterator[_WriteBatch]:
+        """Modify the registry, within the write lock.
+
+        Changes are published on normal exit, unless a batch is already
+        pending, and discarded if an exception is raised. Compiled prefix
+        tries are kept for unmodified categories, and the resolution cache
+        starts empty.
+        """
+        with self._write_lock:
+            if (batch := self._batch) is not None:
+                yield batch
+                return
+            batch = self._batch = _WriteBatch(self._snapshot)
+            try:
+                yield batch
+            except BaseException:
+                self._batch = None
+                for quirk_file, (
+                    registrations,
+                    signature,
+                ) in batch.file_backups.items():
+                    _restore(self._quirks_by_file, quirk_file, registrations)
+                    _restore(self._file_signatures, quirk_file, signature)
+                raise
+            else:
+                self._batch = None
+                if batch.changed:
+                    prefix_tries = batch.snapshot.prefix_tries.copy()
+                    for category in batch.modified_quirks:
+                        prefix_tries.pop(category, None)
+                    self._snapshot = _RegistrySnapshot(
+                        quirks=batch.quirks,
+                        lazy_loaders=batch.lazy_loaders,
+                        prefix_tries=prefix_tries,
+                    )
+
+    @contextlib.contextmanager
+    def batch_writes(self) -> Iterator[Self]:
+        """Publish the writes made within the context in a single snapshot.
+
+        Other writers wait for the end of the context, lookups keep reading
+        the previous snapshot meanwhile.
+        """
+        with self._write():
+            yield self
 
     def register(
         self,
@@ -36,23 +275,247 @@ class QuirksRegistry:
         product_id: str,
         quirk: TuyaDeviceQuirk,
     ) -> None:
-        """Register a quirk for a specific device type."""
-        self._quirks.setdefault(category, {})[product_id] = quirk
+        """Register a quirk for a specific device type.
+
+        The product_id can end with a wildcard (e.g. `abc*`), or be a
+        wildcard (`*`) to match the whole category. Exact matches take
+        priority, then the longest prefix.
+        """
+        self.register_many([(category, product_id, quirk)])
+
+    def register_many(
+        self,
+        registrations: Iterable[tuple[str, str, TuyaDeviceQuirk]],
+        *,
+        keep_custom: bool = False,
+    ) -> None:
+        """Register quirks for several device types, in a single snapshot.
+
+        If `keep_custom` is set, quirks loaded from custom quirk files (with
+        a file signature) are not replaced.
+        """
+        if (
+            self is TUYA_QUIRKS_REGISTRY
+            and (target := _REGISTRATION_TARGET.get()) is not None
+            and target is not self
+        ):
+            target.register_many(registrations, keep_custom=keep_custom)
+            return
+        registrations = list(registrations)
+        for category, product_id, _quirk in registrations:
+            _get_prefix(category, product_id)
+
+        with self._write() as batch:
+            for category, product_id, quirk in registrations:
+                category_quirks = batch.get_quirks(category)
+                if (previous := category_quirks.get(product_id)) is not None:
+                    if keep_custom and previous.quirk_file in (
+                        self._file_signatures
+                    ):
+                        continue
+                    self._backup_quirk_file(previous.quirk_file)
+                    self._quirks_by_file.get(
+                        previous.quirk_file, set()
+                    ).discard((category, product_id))
+                category_quirks[product_id] = quirk
+                self._backup_quirk_file(quirk.quirk_file)
+                self._quirks_by_file.setdefault(quirk.quirk_file, set()).add(
+                    (category, product_id)
+                )
+                if product_id in batch.lazy_loaders.get(category, _EMPTY):
+                    del batch.get_lazy_loaders(category)[product_id]
+
+    def register_lazy(
+        self, category: str, product_id: str, loader: LazyLoader
+    ) -> None:
+        """Register a loader for a specific device type.
+
+        The loader is called on the first lookup of the device type, and is
+        expected to register the quirk.
+        """
+        with self._write() as batch:
+            batch.get_lazy_loaders(category)[product_id] = loader
+
+    def fork(self) -> Self:
+        """Create an independent registry, with the same registrations.
+
+        Snapshots are immutable, so the copy is cheap: both registries share
+        the current snapshot until one of them is modified.
+        """
+        registry = type(self)()
+        with self._write_lock:
+            snapshot = self._snapshot
+            registry._snapshot = _RegistrySnapshot(
+                quirks=snapshot.quirks,
+                lazy_loaders=snapshot.lazy_loaders,
+                prefix_tries=snapshot.prefix_tries.copy(),
+            )
+            registry._quirks_by_file = {
+                quirk_file: registrations.copy()
+                for quirk_file, registrations in self._quirks_by_file.items()
+            }
+            registry._file_signatures = self._file_signatures.copy()
+        return registry
+
+    @contextlib.contextmanager
+    def redirect_registrations(self) -> Iterator[Self]:
+        """Redirect registrations to this registry, within the context.
+
+        Quirk modules register into `TUYA_QUIRKS_REGISTRY`, this allows
+        loading them into another registry. Only registrations into
+        `TUYA_QUIRKS_REGISTRY` are redirected.
+        """
+        token = _REGISTRATION_TARGET.set(self)
+        try:
+            yield self
+        finally:
+            _REGISTRATION_TARGET.reset(token)
+
+    def _run_lazy_loader(self, category: str, product_id: str) -> None:
+        """Run the loader of a device type, if it was not already run.
+
+        Loaders run outside of the write lock (they import modules, which
+        register quirks), but only one loader runs at a time.
+        """
+        with self._loader_lock:
+            with self._write() as batch:
+                if product_id not in batch.lazy_loaders.get(category, _EMPTY):
+                    return
+                loader = batch.get_lazy_loaders(category).pop(product_id)
+            loader(self)
+
+    def iter_quirks(self) -> Iterator[tuple[str, str, TuyaDeviceQuirk]]:
+        """Iterate over the registered (category, product_id, quirk)."""
+        for category, category_quirks in self._snapshot.quirks.items():
+            for product_id, quirk in category_quirks.items():
+                yield category, product_id, quirk
 
     def get_quirk_for_device(
         self, device: CustomerDevice
     ) -> TuyaDeviceQuirk | None:
-        """Get the quirk for a specific device."""
-        return self._quirks.get(device.category, {}).get(device.product_id)
+        """Get the quirk for a specific device.
+
+        Results (including missing quirks) are cached per device, until the
+        registry is modified.
+        """
+        snapshot = self._snapshot
+        key: _DeviceKey = (device.id, device.category, device.product_id)
+        try:
+            quirk = snapshot.resolution_cache[key]
+        except KeyError:
+            self._cache_misses += 1
+            quirk = self._resolve(snapshot, key[1], key[2])
+            snapshot.resolution_cache[key] = quirk
+        else:
+            self._cache_hits += 1
+        return quirk
+
+    def _resolve(
+        self, snapshot: _RegistrySnapshot, category: str, product_id: str
+    ) -> TuyaDeviceQuirk | None:
+        """Resolve the quirk for a device type."""
+        if (
+            quirk := snapshot.quirks.get(category, _EMPTY).get(product_id)
+        ) is None and product_id in snapshot.lazy_loaders.get(category, _EMPTY):
+            self._run_lazy_loader(category, product_id)
+            snapshot = self._snapshot
+            quirk = snapshot.quirks.get(category, _EMPTY).get(product_id)
+        if quirk is None and (category_quirks := snapshot.quirks.get(category)):
+            try:
+                trie = snapshot.prefix_tries[category]
+            except KeyError:
+                trie = snapshot.prefix_tries[category] = _PrefixTrie.compile(
+                    category_quirks
+                )
+            if trie is not None:
+                quirk = trie.match(product_id)
+        return quirk
+
+    def get_cache_info(self) -> ResolutionCacheInfo:
+        """Return hit/miss statistics of the resolution cache."""
+        return ResolutionCacheInfo(
+            self._cache_hits,
+            self._cache_misses,
+            len(self._snapshot.resolution_cache),
+        )
+
+    def clear_cache(self) -> None:
+        """Clear the resolution cache and its statistics."""
+        self._snapshot.resolution_cache.clear()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    def get_quirk_files(self, root: str | None = None) -> list[pathlib.Path]:
+        """Get the files with registered quirks, optionally below `root`."""
+        with self._write_lock:
+            return [
+                quirk_file
+                for quirk_file in {
+                    *self._quirks_by_file,
+                    *self._file_signatures,
+                }
+                if root is None or quirk_file.is_relative_to(root)
+            ]
+
+    def get_file_signature(
+        self, quirk_file: pathlib.Path
+    ) -> FileSignature | None:
+        """Get the signature of a loaded quirk file."""
+        with self._write_lock:
+            return self._file_signatures.get(quirk_file)
+
+    def set_file_signature(
+        self, quirk_file: pathlib.Path, signature: FileSignature
+    ) -> None:
+        """Set the signature of a loaded quirk file."""
+        with self._write_lock:
+            self._backup_quirk_file(quirk_file)
+            self._file_signatures[quirk_file] = signature
+
+    def _backup_quirk_file(self, quirk_file: pathlib.Path) -> None:
+        """Save the state of a quirk file, if a batch is pending."""
+        if (batch := self._batch) is not None and (
+            quirk_file not in batch.file_backups
+        ):
+            registrations = self._quirks_by_file.get(quirk_file)
+            batch.file_backups[quirk_file] = (
+                None if registrations is None else registrations.copy(),
+                self._file_signatures.get(quirk_file),
+            )
+
+    def purge_quirk_files(self, quirk_files: Iterable[pathlib.Path]) -> None:
+        """Purge the quirks registered from files, in a single snapshot."""
+        with self._write() as batch:
+            for quirk_file in quirk_files:
+                self._backup_quirk_file(quirk_file)
+                self._file_signatures.pop(quirk_file, None)
+                for category, product_id in self._quirks_by_file.pop(
+                    quirk_file, ()
+                ):
+                    _LOGGER.debug("Removing stale custom quirk: %s", product_id)
+                    category_quirks = batch.get_quirks(category)
+                    if category_quirks[product_id].quirk_file == quirk_file:
+                        category_quirks.pop(product_id)
+
+    def purge_quirk_file(self, quirk_file: pathlib.Path) -> None:
+        """Purge the quirks registered from a file."""
+        self.purge_quirk_files([quirk_file])
 
     def purge_custom_quirks(self, custom_quirks_root: str) -> None:
         """Purge custom quirks from the registry."""
-        for category_quirks in self._quirks.values():
-            to_remove = []
-            for product_id, quirk in category_quirks.items():
-                if quirk.quirk_file.is_relative_to(custom_quirks_root):
-                    to_remove.append(product_id)
+        with self._write_lock:
+            self.purge_quirk_files(self.get_quirk_files(custom_quirks_root))
+
+
+def _restore[KeyT, ValueT](
+    mapping: dict[KeyT, ValueT], key: KeyT, value: ValueT | None
+) -> None:
+    """Restore an entry of a mapping, removing it if `value` is None."""
+    if value is None:
+        mapping.pop(key, None)
+    else:
+        mapping[key] = value
+
 
-            for product_id in to_remove:
-                _LOGGER.debug("Removing stale custom quirk: %s", product_id)
-                category_quirks.pop(product_id)
+TUYA_QUIRKS_REGISTRY = QuirksRegistry()
+"""Default registry, which quirks modules register into."""
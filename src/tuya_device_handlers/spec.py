@@ -0,0 +1,184 @@
+"""Device specification helpers for the Tuya integration."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from dataclasses import dataclass
+import hashlib
+from typing import TYPE_CHECKING, Any, NamedTuple, Self
+
+from ._bounded import BoundedDict
+from .const import DPType
+
+if TYPE_CHECKING:
+    from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+
+class DPDefinition(NamedTuple):
+    """Definition of a DP code, with its DPType already parsed."""
+
+    dptype: DPType | None
+    values: str
+
+    @classmethod
+    def from_sdk(cls, definition: Any | None) -> Self | None:
+        """Create from a `DeviceFunction` or `DeviceStatusRange` object."""
+        if not definition:
+            return None
+        return cls(DPType.try_parse(definition.type), definition.values)
+
+
+@dataclass(kw_only=True, frozen=True)
+class DPSpec:
+    """Specification of a single DP code.
+
+    Combines the `device.function` and `device.status_range` definitions.
+    """
+
+    dpcode: str
+    report_type: str | None
+    function: DPDefinition | None
+    status_range: DPDefinition | None
+
+    @classmethod
+    def from_device(cls, device: CustomerDevice, dpcode: str) -> Self | None:
+        """Create from the device specifications, if the DP code exists."""
+        function = DPDefinition.from_sdk(device.function.get(dpcode))
+        status_range = device.status_range.get(dpcode)
+        if function is None and not status_range:
+            return None
+        return cls(
+            dpcode=dpcode,
+            report_type=status_range.report_type if status_range else None,
+            function=function,
+            status_range=DPDefinition.from_sdk(status_range),
+        )
+
+    def definitions(
+        self, *, prefer_function: bool = False
+    ) -> tuple[DPDefinition | None, DPDefinition | None]:
+        """Return the definitions, in lookup order."""
+        if prefer_function:
+            return (self.function, self.status_range)
+        return (self.status_range, self.function)
+
+
+@dataclass(frozen=True)
+class DeviceSpecIndex:
+    """Index of all DP code specifications of a device.
+
+    Built once from `device.function` / `device.status_range`, it can be
+    passed to `find_dpcode` instead of the device, so that resolving many
+    wrappers for a device is a dictionary lookup per DP code.
+    """
+
+    specs: dict[str, DPSpec]
+
+    @classmethod
+    def from_device(cls, device: CustomerDevice) -> Self:
+        """Build the index from the device specifications."""
+        specs: dict[str, DPSpec] = {}
+        for dpcode in (*device.status_range, *device.function):
+            if dpcode not in specs and (
+                dp_spec := DPSpec.from_device(device, dpcode)
+            ):
+                specs[dpcode] = dp_spec
+        return cls(specs)
+
+    def get(self, dpcode: str) -> DPSpec | None:
+        """Return the specification of a DP code."""
+        return self.specs.get(dpcode)
+
+    @classmethod
+    def for_device(cls, device: CustomerDevice) -> DeviceSpecIndex:
+        """Return the index for the device, shared between identical specs."""
+        fingerprint = get_spec_fingerprint(device)
+        if (spec_index := _SPEC_INDEXES.get(fingerprint)) is None:
+            spec_index = _SPEC_INDEXES[fingerprint] = cls.from_device(device)
+        return spec_index
+
+
+SPEC_INDEX_CACHE_SIZE = 512
+"""Maximum number of DeviceSpecIndex objects shared between devices."""
+
+# Keyed by spec fingerprint
+_SPEC_INDEXES: BoundedDict[str, DeviceSpecIndex] = BoundedDict(
+    SPEC_INDEX_CACHE_SIZE
+)
+
+SPEC_FINGERPRINT_CACHE_SIZE = 4096
+"""Maximum number of device spec fingerprints kept in memory."""
+
+type _SpecKey = tuple[tuple[str, str, Any, Any, Any], ...]
+
+# Keyed by device ID: (spec key, fingerprint)
+_SPEC_FINGERPRINTS: BoundedDict[str, tuple[_SpecKey, str]] = BoundedDict(
+    SPEC_FINGERPRINT_CACHE_SIZE
+)
+
+
+def compute_spec_fingerprint(
+    function: Mapping[str, Any], status_range: Mapping[str, Any]
+) -> str:
+    """Compute a stable fingerprint of the device specifications.
+
+    The fingerprint covers the DP code, type, values and report type of each
+    definition, so that devices with identical specs share a fingerprint.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for source, definitions in (("f", function), ("s", status_range)):
+        for dpcode in sorted(definitions):
+            definition = definitions[dpcode]
+            digest.update(
+                repr(
+                    (
+                        source,
+                        dpcode,
+                        definition.type,
+                        definition.values,
+                        getattr(definition, "report_type", None),
+                    )
+                ).encode()
+            )
+    return digest.hexdigest()
+
+
+def _get_spec_key(
+    function: Mapping[str, Any], status_range: Mapping[str, Any]
+) -> _SpecKey:
+    """Return the definition values covered by the fingerprint.
+
+    Cheaper to build and compare than the fingerprint is to compute, and
+    holds no reference to the definitions themselves.
+    """
+    return tuple(
+        (
+            source,
+            dpcode,
+            definition.type,
+            definition.values,
+            getattr(definition, "report_type", None),
+        )
+        for source, definitions in (("f", function), ("s", status_range))
+        for dpcode, definition in definitions.items()
+    )
+
+
+def get_spec_fingerprint(device: CustomerDevice) -> str:
+    """Return the spec fingerprint of the device.
+
+    The fingerprint is memoized per device, and recomputed when any
+    definition of `function` or `status_range` changed (including in
+    place).
+    """
+    spec_key = _get_spec_key(device.function, device.status_range)
+    if (cached := _SPEC_FINGERPRINTS.get(device.id)) and cached[0] == spec_key:
+        return cached[1]
+    fingerprint = compute_spec_fingerprint(device.function, device.status_range)
+    _SPEC_FINGERPRINTS[device.id] = (spec_key, fingerprint)
+    return fingerprint
+
+
+def forget_spec_fingerprint(device_id: str) -> None:
+    """Forget the memoized spec fingerprint of a device."""
+    _SPEC_FINGERPRINTS.pop(device_id, None)
@@ -2,21 +2,43 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+import functools
 import json
-from typing import TYPE_CHECKING, Any, ClassVar, Self, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, Self, cast
 
 from .const import DPType
+from .spec import DeviceSpecIndex, DPSpec
 
 if TYPE_CHECKING:
     from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
 
-@dataclass(kw_only=True)
+INDEX_CACHE_SIZE = 1024
+"""Maximum number of enum range / bitmap label indexes kept in the cache."""
+
+
+@functools.lru_cache(maxsize=INDEX_CACHE_SIZE)
+def _index(values: tuple[str, ...]) -> Mapping[str, int]:
+    """Index the ordinal of each value, keeping the first of duplicates.
+
+    Shared by all type informations with the same values.
+    """
+    index: dict[str, int] = {}
+    for ordinal, value in enumerate(values):
+        index.setdefault(value, ordinal)
+    return MappingProxyType(index)
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
 class TypeInformation:
     """Type information.
 
     As provided by the SDK, from `device.function` / `device.status_range`.
+    Instances are immutable and slotted, as they are shared between devices
+    through the parse cache.
     """
 
     _DPTYPE: ClassVar[DPType]
@@ -33,54 +55,86 @@ class TypeInformation:
     @classmethod
     def find_dpcode(
         cls,
-        device: CustomerDevice,
+        device: CustomerDevice | DeviceSpecIndex,
         dpcodes: str | tuple[str, ...] | None,
         *,
         prefer_function: bool = False,
     ) -> Self | None:
-        """Find type information for a matching DP code available for this device."""
+        """Find type information for a matching DP code available for this device.
+
+        A prebuilt `DeviceSpecIndex` can be given instead of the device.
+        """
         if dpcodes is None:
             return None
 
         if not isinstance(dpcodes, tuple):
             dpcodes = (dpcodes,)
 
-        lookup_tuple = (
-            (device.function, device.status_range)
-            if prefer_function
-            else (device.status_range, device.function)
-        )
-
         for dpcode in dpcodes:
-            report_type = (
-                status_range.report_type
-                if (status_range := device.status_range.get(dpcode))
-                else None
-            )
-            for device_specs in lookup_tuple:
+            if (
+                dp_spec := device.get(dpcode)
+                if isinstance(device, DeviceSpecIndex)
+                else DPSpec.from_device(device, dpcode)
+            ) is None:
+                continue
+            for definition in dp_spec.definitions(
+                prefer_function=prefer_function
+            ):
                 if (
-                    (current_definition := device_specs.get(dpcode))
-                    and DPType.try_parse(current_definition.type) is cls._DPTYPE
+                    definition
+                    and definition.dptype is cls._DPTYPE
                     and (
-                        type_information := cls._from_json(
-                            dpcode=dpcode,
-                            type_data=current_definition.values,
-                            report_type=report_type,
+                        type_information := _parse_type_information(
+                            cls,  # type: ignore[arg-type]
+                            dpcode,
+                            definition.values,
+                            dp_spec.report_type,
                         )
                     )
                 ):
-                    return type_information
+                    return cast(Self, type_information)
 
         return None
 
 
-@dataclass(kw_only=True)
+class BitmapDecode(NamedTuple):
+    """Decoded bitmap value."""
+
+    active_labels: frozenset[str]
+    changed_mask: int
+    """Bits which changed from the previous value (all labels if unknown)."""
+
+
+@dataclass(kw_only=True, frozen=True, slots=True)
 class BitmapTypeInformation(TypeInformation):
     """Bitmap type information."""
 
     _DPTYPE = DPType.BITMAP
 
-    label: list[str]
+    label: tuple[str, ...]
+
+    @property
+    def label_index(self) -> Mapping[str, int]:
+        """Bit of each label, shared by all identical labels."""
+        return _index(self.label)
+
+    def get_bit(self, label: str) -> int | None:
+        """Return the bit of a label, or None if unknown."""
+        return _index(self.label).get(label)
+
+    def decode(self, value: int, previous: int | None = None) -> BitmapDecode:
+        """Decode the active labels of a value, in a single pass."""
+        labels = self.label
+        label_mask = (1 << len(labels)) - 1
+        active_labels = frozenset(
+            labels[bit]
+            for bit in range((value & label_mask).bit_length())
+            if value >> bit & 1
+        )
+        return BitmapDecode(
+            active_labels,
+            label_mask if previous is None else (value ^ previous) & label_mask,
+        )
 
     @classmethod
     def _from_json(
@@ -92,24 +146,37 @@ class BitmapTypeInformation(TypeInformation):
         return cls(
             dpcode=dpcode,
             type_data=type_data,
-            label=parsed["label"],
+            label=tuple(parsed["label"]),
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class BooleanTypeInformation(TypeInformation):
     """Boolean type information."""
 
     _DPTYPE = DPType.BOOLEAN
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class EnumTypeInformation(TypeInformation):
     """Enum type information."""
 
     _DPTYPE = DPType.ENUM
 
-    range: list[str]
+    range: tuple[str, ...]
+
+    @property
+    def range_index(self) -> Mapping[str, int]:
+        """Ordinal of each value, shared by all identical ranges."""
+        return _index(self.range)
+
+    def get_ordinal(self, value: Any) -> int | None:
+        """Return the ordinal of a value, or None if out of range."""
+        try:
+            return _index(self.range).get(value)
+        except TypeError:
+            # Unhashable values are out of range
+            return None
 
     @classmethod
     def _from_json(
@@ -121,11 +188,11 @@ class EnumTypeInformation(TypeInformation):
         return cls(
             dpcode=dpcode,
             type_data=type_data,
-            **cast(dict[str, list[str]], parsed),
+            range=tuple(cast(dict[str, list[str]], parsed)["range"]),
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class IntegerTypeInformation(TypeInformation):
     """Integer type information."""
 
@@ -166,22 +233,49 @@ class IntegerTypeInformation(TypeInformation):
         )
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class JsonTypeInformation(TypeInformation):
     """Json type information."""
 
     _DPTYPE = DPType.JSON
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class RawTypeInformation(TypeInformation):
     """Raw type information."""
 
     _DPTYPE = DPType.RAW
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, frozen=True, slots=True)
 class StringTypeInformation(TypeInformation):
     """String type information."""
 
     _DPTYPE = DPType.STRING
+
+
+TYPE_INFORMATION_CACHE_SIZE = 2048
+"""Maximum number of parsed type information objects kept in the cache."""
+
+
+@functools.lru_cache(maxsize=TYPE_INFORMATION_CACHE_SIZE)
+def _parse_type_information(
+    type_information_class: type[TypeInformation],
+    dpcode: str,
+    type_data: str,
+    report_type: str | None,
+) -> TypeInformation | None:
+    """Parse type information, sharing the result between identical specs."""
+    return type_information_class._from_json(
+        dpcode=dpcode, type_data=type_data, report_type=report_type
+    )
+
+
+def get_type_information_cache_info() -> functools._CacheInfo:
+    """Return hit/miss statistics of the type information cache."""
+    return _parse_type_information.cache_info()
+
+
+def clear_type_information_cache() -> None:
+    """Clear the type information cache."""
+    _parse_type_information.cache_clear()
@@ -5,9 +5,13 @@ from typing import Any
 import pytest
 from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
 
+from tuya_device_handlers.device_wrapper import BITMAP_DECODE_CACHE
 from tuya_device_handlers.device_wrapper.binary_sensor import (
     DPCodeBitmapBitWrapper,
 )
+from tuya_device_handlers.type_information import BitmapTypeInformation
+
+from .. import send_device_update
 
 
 @pytest.mark.parametrize(
@@ -51,3 +55,42 @@ def test_bitmapbit_device_status(
 
     assert wrapper
     assert wrapper.read_device_status(mock_device) == expected_device_status
+
+    # The specialized reader is equivalent
+    wrapper.initialize(mock_device)
+    assert wrapper.read_device_status(mock_device) == expected_device_status
+
+
+def test_bitmapbit_skip_update(mock_device: CustomerDevice) -> None:
+    """Test bit wrappers only update when their bit flipped."""
+    type_information = BitmapTypeInformation(
+        dpcode="demo_bitmap", type_data="{}", label=("a", "b", "c")
+    )
+    wrappers = [
+        DPCodeBitmapBitWrapper("demo_bitmap", type_information, bit)
+        for bit in range(3)
+    ]
+    mock_device.status["demo_bitmap"] = 0b001
+    for wrapper in wrappers:
+        wrapper.initialize(mock_device)
+
+    def _updated_bits(value: Any) -> list[int]:
+        send_device_update(mock_device, {"demo_bitmap": value})
+        return [
+            bit
+            for bit, wrapper in enumerate(wrappers)
+            if not wrapper.skip_update(mock_device, ["demo_bitmap"])
+        ]
+
+    BITMAP_DECODE_CACHE.clear()
+    assert _updated_bits(0b110) == [0, 1, 2]
+    # The change is decoded once for all wrappers
+    assert (BITMAP_DECODE_CACHE.hits, BITMAP_DECODE_CACHE.misses) == (2, 1)
+    assert _updated_bits(0b100) == [1]
+    assert _updated_bits(0b100) == []
+    assert _updated_bits(None) == [0, 1, 2]
+    assert _updated_bits(None) == []
+    assert _updated_bits(0b100) == [0, 1, 2]
+
+    # Other DP codes are skipped
+    assert wrappers[0].skip_update(mock_device, ["demo_boolean"]) is True
@@ -0,0 +1,155 @@
+"""Test DecodeCache"""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+from tuya_device_handlers.device_wrapper import (
+    ELECTRICITY_DECODE_CACHE,
+    JSON_DECODE_CACHE,
+    DecodeCache,
+)
+from tuya_device_handlers.device_wrapper.common import DPCodeJsonWrapper
+from tuya_device_handlers.device_wrapper.sensor import (
+    ElectricityApparentPowerRawWrapper,
+    ElectricityCurrentJsonWrapper,
+    ElectricityCurrentRawWrapper,
+    ElectricityPowerFactorRawWrapper,
+    ElectricityPowerJsonWrapper,
+    ElectricityPowerRawWrapper,
+    ElectricityReactivePowerRawWrapper,
+    ElectricityVoltageJsonWrapper,
+    ElectricityVoltageRawWrapper,
+)
+from tuya_device_handlers.raw_data_model import ElectricityData
+
+
+def test_decode_cache() -> None:
+    """Test DecodeCache.get_or_decode."""
+    cache = DecodeCache[int](maxsize=2)
+    decoder = Mock(side_effect=int)
+
+    assert cache.get_or_decode("device_1", "dpcode", "1", decoder) == 1
+    assert cache.get_or_decode("device_1", "dpcode", "1", decoder) == 1
+    assert decoder.call_count == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Raw value changed
+    assert cache.get_or_decode("device_1", "dpcode", "2", decoder) == 2
+    assert decoder.call_count == 2
+    assert len(cache) == 1
+
+    # Bounded
+    assert cache.get_or_decode("device_2", "dpcode", "3", decoder) == 3
+    assert cache.get_or_decode("device_3", "dpcode", "4", decoder) == 4
+    assert len(cache) == 2
+    assert cache.get_or_decode("device_1", "dpcode", "2", decoder) == 2
+    assert decoder.call_count == 5
+
+    # Errors are not cached
+    with pytest.raises(ValueError, match="invalid literal"):
+        cache.get_or_decode("device_3", "dpcode", "invalid", decoder)
+    assert cache.get_or_decode("device_3", "dpcode", "4", decoder) == 4
+    assert decoder.call_count == 6
+
+    cache.forget_device("device_3")
+    assert len(cache) == 1
+    cache.clear()
+    assert len(cache) == 0
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_shared_json_decode(mock_device: CustomerDevice) -> None:
+    """Test JSON wrappers share a single parse per status change."""
+    JSON_DECODE_CACHE.clear()
+    mock_device.status["demo_json"] = (
+        '{"electricCurrent": 599.552, "power": 6.912, "voltage": 52.7}'
+    )
+    wrappers = [
+        ElectricityCurrentJsonWrapper.find_dpcode(mock_device, "demo_json"),
+        ElectricityPowerJsonWrapper.find_dpcode(mock_device, "demo_json"),
+        ElectricityVoltageJsonWrapper.find_dpcode(mock_device, "demo_json"),
+    ]
+
+    with patch.object(json, "loads", wraps=json.loads) as mock_loads:
+        assert [
+            wrapper.read_device_status(mock_device)
+            for wrapper in wrappers
+            if wrapper
+        ] == [599.552, 6.912, 52.7]
+        assert mock_loads.call_count == 1
+
+        mock_device.status["demo_json"] = (
+            '{"electricCurrent": 1.0, "power": 2.0, "voltage": 3.0}'
+        )
+        assert [
+            wrapper.read_device_status(mock_device)
+            for wrapper in wrappers
+            if wrapper
+        ] == [1.0, 2.0, 3.0]
+        assert mock_loads.call_count == 2
+
+
+def test_json_value_not_shared(mock_device: CustomerDevice) -> None:
+    """Test modifying a decoded JSON value does not affect the cache."""
+    JSON_DECODE_CACHE.clear()
+    mock_device.status["demo_json"] = '{"power": 6.912, "data": {"a": 1}}'
+    wrapper = DPCodeJsonWrapper.find_dpcode(mock_device, "demo_json")
+    power_wrapper = ElectricityPowerJsonWrapper.find_dpcode(
+        mock_device, "demo_json"
+    )
+    assert wrapper
+    assert power_wrapper
+
+    status = wrapper.read_device_status(mock_device)
+    assert status == {"power": 6.912, "data": {"a": 1}}
+    status["power"] = 0
+    status["data"]["a"] = 2
+    raw_value = mock_device.status["demo_json"]
+    status = wrapper.read_raw_value(mock_device, raw_value)
+    assert status == {"power": 6.912, "data": {"a": 1}}
+    status.clear()
+
+    assert wrapper.read_device_status(mock_device) == {
+        "power": 6.912,
+        "data": {"a": 1},
+    }
+    assert power_wrapper.read_device_status(mock_device) == 6.912
+    assert (JSON_DECODE_CACHE.hits, JSON_DECODE_CACHE.misses) == (3, 1)
+
+
+def test_shared_raw_decode(mock_device: CustomerDevice) -> None:
+    """Test RAW electricity wrappers share a single decode per status change."""
+    ELECTRICITY_DECODE_CACHE.clear()
+    mock_device.status["demo_raw"] = "Ag8IgAAD6AAnEAANrAAw1FAP"
+    wrappers = [
+        wrapper_type.find_dpcode(mock_device, "demo_raw")
+        for wrapper_type in (
+            ElectricityCurrentRawWrapper,
+            ElectricityPowerRawWrapper,
+            ElectricityVoltageRawWrapper,
+            ElectricityReactivePowerRawWrapper,
+            ElectricityApparentPowerRawWrapper,
+            ElectricityPowerFactorRawWrapper,
+        )
+    ]
+
+    with patch.object(
+        ElectricityData, "from_bytes", wraps=ElectricityData.from_bytes
+    ) as mock_from_bytes:
+        assert [
+            wrapper.read_device_status(mock_device)
+            for wrapper in wrappers
+            if wrapper
+        ] == [-1000, -10000, 217.6, -3500, 12500, -0.8]
+        assert mock_from_bytes.call_count == 1
+
+        mock_device.status["demo_raw"] = "CIAAA+gAJxA="
+        assert [
+            wrapper.read_device_status(mock_device)
+            for wrapper in wrappers
+            if wrapper
+        ] == [1000, 10000, 217.6, None, None, None]
+        assert mock_from_bytes.call_count == 2
@@ -2,7 +2,6 @@
 
 import base64
 from typing import Any
-from unittest.mock import patch
 
 import pytest
 from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
@@ -67,6 +66,10 @@ def test_read_device_status(
     assert wrapper
     assert wrapper.read_device_status(mock_device) == expected_device_status
 
+    # The specialized reader is equivalent
+    wrapper.initialize(mock_device)
+    assert wrapper.read_device_status(mock_device) == expected_device_status
+
     # All wrappers return None if status is None
     mock_device.status[dpcode] = None
     assert wrapper.read_device_status(mock_device) is None
@@ -83,32 +86,34 @@ def test_read_device_status(
             DPCodeBooleanWrapper,
             "demo_boolean",
             "hot",
-            "boolean_out_range|demo_boolean|hot",
+            ("boolean_out_range", "demo_boolean", "hot"),
         ),
         (
             DPCodeEnumWrapper,
             "demo_enum",
             "hot",
-            "enum_out_range|demo_enum|hot",
+            ("enum_out_range", "demo_enum", "hot"),
         ),
         (
             DPCodeIntegerWrapper,
             "demo_integer",
             1230,
-            "integer_out_range|demo_integer|1230",
+            ("integer_out_range", "demo_integer", 1230),
         ),
     ],
 )
-@patch.dict(DEVICE_WARNINGS, {}, clear=True)
+@pytest.mark.parametrize("initialize", [False, True])
 def test_read_invalid_device_status(
     dpcode: str,
     wrapper_type: type[DPCodeTypeInformationWrapper],  # type: ignore [type-arg]
     status: Any,
-    warning_key: str,
+    warning_key: tuple[str, str, Any],
+    initialize: bool,
     mock_device: CustomerDevice,
     caplog: pytest.LogCaptureFixture,
 ) -> None:
     """Test read_device_status."""
+    DEVICE_WARNINGS.clear()
     mock_device.status[dpcode] = status
     wrapper = wrapper_type.find_dpcode(mock_device, dpcode)
 
@@ -118,6 +123,9 @@ def test_read_invalid_device_status(
     assert expected_log not in caplog.text
 
     assert wrapper
+    if initialize:
+        wrapper.initialize(mock_device)
+        assert wrapper.raw_value_reader is not None
     assert wrapper.read_device_status(mock_device) is None
     assert (dev_warnings := DEVICE_WARNINGS.get(mock_device.id))
     assert warning_key in dev_warnings  # warning added
@@ -127,6 +135,7 @@ def test_read_invalid_device_status(
     assert wrapper.read_device_status(mock_device) is None
     assert len(dev_warnings) == 1  # no added warning
     assert expected_log not in caplog.text  # no second log entry
+    assert DEVICE_WARNINGS.suppressed_count(mock_device.id) == 1
 
 
 @pytest.mark.parametrize(
@@ -195,6 +204,13 @@ def test_enum_details(mock_device: CustomerDevice) -> None:
     assert wrapper
     assert wrapper.options == ["scene", "customize_scene", "colour"]
 
+    # Options are not shared with other wrappers
+    wrapper.options.append("other")
+    other_wrapper = DPCodeEnumWrapper.find_dpcode(mock_device, "demo_enum")
+    assert other_wrapper
+    assert other_wrapper.options == ["scene", "customize_scene", "colour"]
+    assert wrapper.type_information is other_wrapper.type_information
+
 
 def test_integer_details(mock_device: CustomerDevice) -> None:
     """Test scale_value/scale_value_back."""
@@ -222,3 +238,67 @@ def test_skip_update(mock_device: CustomerDevice) -> None:
     assert wrapper.skip_update(mock_device, None) is True
     assert wrapper.skip_update(mock_device, ["a", "b", "c"]) is True
     assert wrapper.skip_update(mock_device, ["a", "demo_integer", "c"]) is False
+
+
+class _HalfIntegerWrapper(DPCodeIntegerWrapper):
+    """Wrapper overriding read_raw_value, without a specialized reader."""
+
+    def read_raw_value(
+        self, device: CustomerDevice, raw_value: Any
+    ) -> float | None:
+        if (value := super().read_raw_value(device, raw_value)) is None:
+            return None
+        return value / 2
+
+
+def _is_specialized(wrapper: DPCodeTypeInformationWrapper[Any]) -> bool:
+    return wrapper.raw_value_reader is not None
+
+
+def test_specialized_reader(mock_device: CustomerDevice) -> None:
+    """Test the specialized reader compiled by initialize."""
+    wrapper = DPCodeIntegerWrapper.find_dpcode(mock_device, "demo_integer")
+    assert wrapper
+    assert not _is_specialized(wrapper)
+
+    wrapper.initialize(mock_device)
+    assert _is_specialized(wrapper)
+    assert wrapper.read_device_status(mock_device) == 12.3
+
+    # Opt-out
+    wrapper.specialize_reader = False
+    wrapper.initialize(mock_device)
+    assert not _is_specialized(wrapper)
+    assert wrapper.read_device_status(mock_device) == 12.3
+
+    # Subclasses overriding read_raw_value only are not specialized
+    half_wrapper = _HalfIntegerWrapper.find_dpcode(mock_device, "demo_integer")
+    assert half_wrapper
+    half_wrapper.initialize(mock_device)
+    assert not _is_specialized(half_wrapper)
+    assert half_wrapper.read_device_status(mock_device) == 6.15
+
+
+def test_enum_ordinal(mock_device: CustomerDevice) -> None:
+    """Test DPCodeEnumWrapper ordinal accessors."""
+    wrapper = DPCodeEnumWrapper.find_dpcode(mock_device, "demo_enum")
+    other_wrapper = DPCodeEnumWrapper.find_dpcode(mock_device, "demo_enum")
+
+    assert wrapper
+    assert other_wrapper
+    # The index is shared through the type information
+    assert (
+        wrapper.type_information.range_index
+        is other_wrapper.type_information.range_index
+    )
+    assert wrapper.read_ordinal(mock_device) == 1
+    assert wrapper.get_ordinal_update_commands(mock_device, 2) == [
+        {"code": "demo_enum", "value": "colour"}
+    ]
+    with pytest.raises(SetValueOutOfRangeError):
+        wrapper.get_ordinal_update_commands(mock_device, 3)
+
+    mock_device.status["demo_enum"] = "hot"
+    assert wrapper.read_ordinal(mock_device) is None
+    mock_device.status.pop("demo_enum")
+    assert wrapper.read_ordinal(mock_device) is None
@@ -0,0 +1,81 @@
+"""Test StatusReader"""
+
+from typing import Any
+
+from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+from tuya_device_handlers.device_wrapper import (
+    JSON_DECODE_CACHE,
+    DeviceWrapper,
+    StatusReader,
+    read_all,
+)
+from tuya_device_handlers.device_wrapper.binary_sensor import (
+    DPCodeBitmapBitWrapper,
+)
+from tuya_device_handlers.device_wrapper.common import (
+    DPCodeBooleanWrapper,
+    DPCodeEnumWrapper,
+    DPCodeIntegerWrapper,
+    DPCodeJsonWrapper,
+    DPCodeRawWrapper,
+    DPCodeStringWrapper,
+)
+from tuya_device_handlers.device_wrapper.sensor import DeltaIntegerWrapper
+
+
+class _ConstantWrapper(DeviceWrapper[str]):
+    """Wrapper without DP code."""
+
+    def read_device_status(self, device: CustomerDevice) -> str | None:
+        return "constant"
+
+
+def test_read_all(mock_device: CustomerDevice) -> None:
+    """Test StatusReader.read_all."""
+    wrappers: dict[str, DeviceWrapper[Any] | None] = {
+        "bitmap_bit": DPCodeBitmapBitWrapper.find_dpcode(
+            mock_device, "demo_bitmap", bitmap_key="motor_fault"
+        ),
+        "boolean": DPCodeBooleanWrapper.find_dpcode(
+            mock_device, "demo_boolean"
+        ),
+        "enum": DPCodeEnumWrapper.find_dpcode(mock_device, "demo_enum"),
+        "integer": DPCodeIntegerWrapper.find_dpcode(
+            mock_device, "demo_integer"
+        ),
+        "other_integer": DPCodeIntegerWrapper.find_dpcode(
+            mock_device, "demo_integer"
+        ),
+        "json": DPCodeJsonWrapper.find_dpcode(mock_device, "demo_json"),
+        "other_json": DPCodeJsonWrapper.find_dpcode(mock_device, "demo_json"),
+        "raw": DPCodeRawWrapper.find_dpcode(mock_device, "demo_raw"),
+        "string": DPCodeStringWrapper.find_dpcode(mock_device, "demo_string"),
+        "delta": DeltaIntegerWrapper.find_dpcode(
+            mock_device, "demo_integer_sum"
+        ),
+        "constant": _ConstantWrapper(),
+    }
+    assert all(wrappers.values())
+    checked_wrappers: dict[str, DeviceWrapper[Any]] = {
+        key: wrapper for key, wrapper in wrappers.items() if wrapper
+    }
+    expected = {
+        key: wrapper.read_device_status(mock_device)
+        for key, wrapper in checked_wrappers.items()
+    }
+
+    JSON_DECODE_CACHE.clear()
+    values = read_all(mock_device, checked_wrappers)
+    assert values == expected
+    assert list(values) == list(checked_wrappers)
+    # Both JSON wrappers share a single decode
+    assert (JSON_DECODE_CACHE.hits, JSON_DECODE_CACHE.misses) == (1, 1)
+
+    # Missing DP codes are read as None
+    reader = StatusReader(checked_wrappers)
+    mock_device.status = {}
+    assert reader.read_all(mock_device) == {
+        key: wrapper.read_device_status(mock_device)
+        for key, wrapper in checked_wrappers.items()
+    }
@@ -0,0 +1,131 @@
+"""Test UpdateRouter"""
+
+from typing import Any
+
+from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+from tuya_device_handlers.device_wrapper import DeviceWrapper, UpdateRouter
+from tuya_device_handlers.device_wrapper.common import (
+    DPCodeBooleanWrapper,
+    DPCodeEnumWrapper,
+    DPCodeIntegerWrapper,
+)
+from tuya_device_handlers.device_wrapper.sensor import DeltaIntegerWrapper
+
+from .. import send_device_update
+
+
+class _AlwaysUpdateWrapper(DeviceWrapper[str]):
+    """Wrapper without DP code, which never skips updates."""
+
+    def skip_update(
+        self,
+        device: CustomerDevice,
+        updated_status_properties: list[str] | None,
+        dp_timestamps: dict[str, int] | None = None,
+    ) -> bool:
+        return False
+
+
+def test_update_router(mock_device: CustomerDevice) -> None:
+    """Test UpdateRouter.get_updated_wrappers."""
+    integer_wrapper = DPCodeIntegerWrapper.find_dpcode(
+        mock_device, "demo_integer"
+    )
+    other_integer_wrapper = DPCodeIntegerWrapper.find_dpcode(
+        mock_device, "demo_integer"
+    )
+    enum_wrapper = DPCodeEnumWrapper.find_dpcode(mock_device, "demo_enum")
+    boolean_wrapper = DPCodeBooleanWrapper.find_dpcode(
+        mock_device, "demo_boolean"
+    )
+    delta_wrapper = DeltaIntegerWrapper.find_dpcode(
+        mock_device, "demo_integer_sum"
+    )
+    always_wrapper = _AlwaysUpdateWrapper()
+    wrappers: list[DeviceWrapper[Any]] = [
+        integer_wrapper,  # type: ignore[list-item]
+        other_integer_wrapper,  # type: ignore[list-item]
+        enum_wrapper,  # type: ignore[list-item]
+        boolean_wrapper,  # type: ignore[list-item]
+        delta_wrapper,  # type: ignore[list-item]
+        DeviceWrapper[str](),
+        always_wrapper,
+    ]
+    router = UpdateRouter(wrappers)
+
+    def _expected(
+        updated_status_properties: list[str] | None,
+        dp_timestamps: dict[str, int] | None = None,
+    ) -> list[DeviceWrapper[Any]]:
+        return [
+            wrapper
+            for wrapper in wrappers
+            if wrapper is not delta_wrapper
+            and not wrapper.skip_update(
+                mock_device, updated_status_properties, dp_timestamps
+            )
+        ]
+
+    # The first full refresh updates every DP code, later ones only the
+    # changed DP codes
+    assert router.get_updated_wrappers(mock_device, None) == [
+        boolean_wrapper,
+        enum_wrapper,
+        integer_wrapper,
+        other_integer_wrapper,
+        always_wrapper,
+    ]
+    assert router.get_updated_wrappers(mock_device, None) == [always_wrapper]
+    mock_device.status["demo_enum"] = "colour"
+    assert router.get_updated_wrappers(mock_device, None) == [
+        enum_wrapper,
+        always_wrapper,
+    ]
+    assert router.get_updated_wrappers(mock_device, []) == [always_wrapper]
+    assert router.get_updated_wrappers(
+        mock_device, ["demo_integer", "demo_enum", "demo_integer", "unknown"]
+    ) == _expected(["demo_integer", "demo_enum", "demo_integer", "unknown"])
+    assert router.get_updated_wrappers(mock_device, ["demo_integer"]) == [
+        integer_wrapper,
+        other_integer_wrapper,
+        always_wrapper,
+    ]
+
+    # Delta wrapper is only updated with a new timestamp
+    send_device_update(mock_device, {"demo_integer_sum": 100})
+    assert router.get_updated_wrappers(
+        mock_device, ["demo_integer_sum"], {"demo_integer_sum": 1}
+    ) == [delta_wrapper, always_wrapper]
+    assert router.get_updated_wrappers(
+        mock_device, ["demo_integer_sum"], {"demo_integer_sum": 1}
+    ) == [always_wrapper]
+    assert router.get_updated_wrappers(mock_device, ["demo_integer_sum"]) == [
+        always_wrapper
+    ]
+    assert delta_wrapper
+    assert delta_wrapper.read_device_status(mock_device) == 10
+
+    # Incremental updates are included in the snapshot
+    send_device_update(mock_device, {"demo_boolean": False})
+    assert router.get_updated_wrappers(mock_device, ["demo_boolean"]) == [
+        boolean_wrapper,
+        always_wrapper,
+    ]
+    assert router.get_updated_wrappers(mock_device, None) == [always_wrapper]
+
+
+def test_update_router_initialize(mock_device: CustomerDevice) -> None:
+    """Test the first full refresh of an initialized router."""
+    enum_wrapper = DPCodeEnumWrapper.find_dpcode(mock_device, "demo_enum")
+    boolean_wrapper = DPCodeBooleanWrapper.find_dpcode(
+        mock_device, "demo_boolean"
+    )
+    assert enum_wrapper
+    assert boolean_wrapper
+    router = UpdateRouter([enum_wrapper, boolean_wrapper])
+    router.initialize(mock_device)
+    assert router.get_updated_wrappers(mock_device, None) == []
+
+    mock_device.status["demo_enum"] = "colour"
+    assert router.get_updated_wrappers(mock_device, None) == [enum_wrapper]
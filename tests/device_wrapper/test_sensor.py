@@ -12,10 +12,13 @@ from tuya_device_handlers.device_wrapper.common import (
 )
 from tuya_device_handlers.device_wrapper.sensor import (
     DeltaIntegerWrapper,
+    ElectricityApparentPowerRawWrapper,
     ElectricityCurrentJsonWrapper,
     ElectricityCurrentRawWrapper,
+    ElectricityPowerFactorRawWrapper,
     ElectricityPowerJsonWrapper,
     ElectricityPowerRawWrapper,
+    ElectricityReactivePowerRawWrapper,
     ElectricityVoltageJsonWrapper,
     ElectricityVoltageRawWrapper,
     WindDirectionEnumWrapper,
@@ -100,6 +103,24 @@ def _snapshot_sensor(
             "{}",
             "Ag8JJQAASAAACAAAAAAACGME",
         ),
+        (
+            ElectricityReactivePowerRawWrapper,
+            "demo_raw",
+            "{}",
+            "Ag8IgAAD6AAnEAANrAAw1FAP",
+        ),
+        (
+            ElectricityApparentPowerRawWrapper,
+            "demo_raw",
+            "{}",
+            "Ag8IgAAD6AAnEAANrAAw1FAP",
+        ),
+        (
+            ElectricityPowerFactorRawWrapper,
+            "demo_raw",
+            "{}",
+            "Ag8IgAAD6AAnEAANrAAw1FAP",
+        ),
     ],
 )
 def test_sensor_wrapper(
@@ -118,6 +139,12 @@ def test_sensor_wrapper(
     assert wrapper
     _snapshot_sensor(wrapper, mock_device, snapshot)
 
+    # The specialized reader is equivalent
+    state = wrapper.read_device_status(mock_device)
+    wrapper.initialize(mock_device)
+    assert wrapper.raw_value_reader is not None
+    assert wrapper.read_device_status(mock_device) == state
+
 
 @pytest.mark.parametrize(
     ("wrapper_type", "dpcode", "status_range", "status"),
@@ -170,6 +197,25 @@ def test_sensor_wrapper(
             "{}",
             "",
         ),
+        (
+            ElectricityReactivePowerRawWrapper,
+            "demo_raw",
+            "{}",
+            "",
+        ),
+        (
+            ElectricityApparentPowerRawWrapper,
+            "demo_raw",
+            "{}",
+            "",
+        ),
+        (
+            ElectricityPowerFactorRawWrapper,
+            "demo_raw",
+            "{}",
+            # Legacy format
+            "CIAAA+gAJxA=",
+        ),
     ],
 )
 def test_sensor_invalid_value(
@@ -186,6 +232,8 @@ def test_sensor_invalid_value(
 
     assert wrapper
     assert wrapper.read_device_status(mock_device) is None
+    wrapper.initialize(mock_device)
+    assert wrapper.read_device_status(mock_device) is None
 
     # All wrappers return None if status is None
     mock_device.status[dpcode] = None
@@ -0,0 +1,54 @@
+"""Test StatusSnapshot"""
+
+from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+from tuya_device_handlers.device_wrapper import (
+    StatusChange,
+    StatusSnapshot,
+    diff_status,
+)
+
+
+def test_diff_status() -> None:
+    """Test diff_status."""
+    previous = {"a": 1, "b": "x", "c": True}
+
+    assert diff_status(previous, dict(previous)) == {}
+    assert diff_status(previous, {"a": 2, "b": "x", "c": True, "d": 0}) == {
+        "a": StatusChange(1, 2),
+        "d": StatusChange(None, 0),
+    }
+    assert diff_status(previous, {"a": 1, "d": 0}) == {
+        "b": StatusChange("x", None),
+        "c": StatusChange(True, None),
+        "d": StatusChange(None, 0),
+    }
+
+
+def test_status_snapshot(mock_device: CustomerDevice) -> None:
+    """Test StatusSnapshot."""
+    snapshot = StatusSnapshot()
+
+    # Incremental updates are ignored until the first snapshot
+    snapshot.update(mock_device, ["demo_boolean"])
+    assert mock_device.id not in snapshot
+
+    assert set(snapshot.diff(mock_device)) == set(mock_device.status)
+    assert mock_device.id in snapshot
+    assert snapshot.diff(mock_device) == {}
+
+    mock_device.status["demo_boolean"] = False
+    mock_device.status["demo_integer"] = 1
+    snapshot.update(mock_device, ["demo_boolean"])
+    assert snapshot.diff(mock_device) == {"demo_integer": StatusChange(123, 1)}
+
+    del mock_device.status["demo_string"]
+    snapshot.update(mock_device, ["demo_string"])
+    assert snapshot.diff(mock_device) == {}
+
+    snapshot.forget_device(mock_device.id)
+    assert mock_device.id not in snapshot
+
+    snapshot.take(mock_device)
+    assert mock_device.id in snapshot
+    assert snapshot.diff(mock_device) == {}
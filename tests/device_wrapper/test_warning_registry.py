@@ -0,0 +1,68 @@
+"""Test DeviceWarningRegistry"""
+
+import time
+
+import pytest
+
+from tuya_device_handlers.device_wrapper import DeviceWarningRegistry
+
+
+def test_warning_registry() -> None:
+    """Test DeviceWarningRegistry."""
+    registry = DeviceWarningRegistry(max_warnings_per_device=2)
+
+    assert registry.get("device_1") is None
+    assert registry.should_log("device_1", ("kind", "dpcode", 1)) is True
+    assert registry.should_log("device_1", ("kind", "dpcode", 1)) is False
+    assert registry.should_log("device_2", ("kind", "dpcode", 1)) is True
+    assert "device_1" in registry
+    assert len(registry) == 2
+
+    # Least recently seen warning is evicted
+    assert registry.should_log("device_1", ("kind", "dpcode", 2)) is True
+    assert registry.should_log("device_1", ("kind", "dpcode", 1)) is False
+    assert registry.should_log("device_1", ("kind", "dpcode", 3)) is True
+    assert list(registry.get("device_1") or ()) == [
+        ("kind", "dpcode", 1),
+        ("kind", "dpcode", 3),
+    ]
+    assert registry.should_log("device_1", ("kind", "dpcode", 2)) is True
+
+    # Unhashable raw values
+    assert registry.should_log("device_1", ("kind", "dpcode", [1])) is True
+    assert registry.should_log("device_1", ("kind", "dpcode", [1])) is False
+
+    assert registry.suppressed_count("device_1") == 3
+    assert registry.suppressed_count("device_2") == 0
+    assert registry.suppressed_count() == 3
+
+    registry.forget_device("device_1")
+    assert "device_1" not in registry
+    assert registry.suppressed_count() == 0
+    assert registry.should_log("device_1", ("kind", "dpcode", 1)) is True
+
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_warning_registry_rate_limit(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test new warnings are rate limited per device and warning kind."""
+    now = 1000.0
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+    registry = DeviceWarningRegistry(
+        max_warnings_per_device=2, max_logs_per_kind=3, log_interval=60
+    )
+
+    # Cycling through more values than the device keeps
+    assert [
+        registry.should_log("device_1", ("kind", "dpcode", value))
+        for value in range(5)
+    ] == [True, True, True, False, False]
+    assert registry.suppressed_count("device_1") == 2
+
+    # Other kinds and devices have their own limit
+    assert registry.should_log("device_1", ("kind", "other_dpcode", 0)) is True
+    assert registry.should_log("device_2", ("kind", "dpcode", 0)) is True
+
+    now += 60
+    assert registry.should_log("device_1", ("kind", "dpcode", 5)) is True
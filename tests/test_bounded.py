@@ -0,0 +1,22 @@
+"""Test bounded mappings"""
+
+from tuya_device_handlers._bounded import BoundedDict
+
+
+def test_bounded_dict() -> None:
+    """Test BoundedDict evicts the oldest entries first."""
+    bounded = BoundedDict[str, int](2)
+    bounded["a"] = 1
+    bounded["b"] = 2
+    # Updating an existing key does not evict
+    bounded["a"] = 3
+    assert bounded == {"a": 3, "b": 2}
+
+    bounded["c"] = 4
+    assert list(bounded) == ["b", "c"]
+
+    # Re-inserted keys are the most recent
+    del bounded["b"]
+    bounded["b"] = 5
+    bounded["d"] = 6
+    assert bounded == {"b": 5, "d": 6}
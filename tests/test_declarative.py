@@ -0,0 +1,167 @@
+"""Test declarative quirks"""
+
+import json
+import os
+import pathlib
+from typing import Any
+
+import pytest
+from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+from tuya_device_handlers.builder import declarative
+from tuya_device_handlers.device_wrapper.binary_sensor import (
+    DPCodeBitmapBitWrapper,
+)
+from tuya_device_handlers.device_wrapper.common import DPCodeIntegerWrapper
+from tuya_device_handlers.devices import (
+    DECLARATIVE_CACHE_FILE,
+    register_tuya_quirks,
+)
+from tuya_device_handlers.helpers import (
+    TuyaEntityCategory,
+    TuyaSensorDeviceClass,
+    TuyaSensorStateClass,
+)
+from tuya_device_handlers.registry import QuirksRegistry
+
+QUIRK_DATA: list[Any] = [
+    [
+        {"applies_to": {"category": "declarative", "product_id": "product_id"}},
+        {"add_dpid_boolean": {"dpid": 1, "dpcode": "demo_boolean"}},
+        {
+            "add_sensor": {
+                "key": "demo_integer",
+                "dp_type": {
+                    "wrapper": "DPCodeIntegerWrapper",
+                    "dpcode": ["missing", "demo_integer"],
+                },
+                "device_class": "temperature",
+                "state_class": "measurement",
+                "entity_category": "diagnostic",
+            }
+        },
+        {
+            "add_sensor": {
+                "key": "demo_bitmap",
+                "dp_type": {
+                    "wrapper": "DPCodeBitmapBitWrapper",
+                    "dpcode": "demo_bitmap",
+                    "bitmap_key": "motor_fault",
+                },
+            }
+        },
+    ]
+]
+
+
+def test_create_quirks(mock_device: CustomerDevice) -> None:
+    """Test quirks are created from declarative data."""
+    quirk_file = pathlib.Path("quirks.json")
+    (quirk,) = declarative.create_quirks(QUIRK_DATA, quirk_file)
+
+    assert quirk.quirk_file == quirk_file
+    assert quirk.datapoint_definitions[1].dpcode == "demo_boolean"
+    integer_definition, bitmap_definition = quirk.sensor_definitions
+    assert integer_definition.device_class is TuyaSensorDeviceClass.TEMPERATURE
+    assert integer_definition.state_class is TuyaSensorStateClass.MEASUREMENT
+    assert integer_definition.entity_category is TuyaEntityCategory.DIAGNOSTIC
+
+    wrapper = integer_definition.dp_type(mock_device)
+    assert isinstance(wrapper, DPCodeIntegerWrapper)
+    assert wrapper.dpcode == "demo_integer"
+    assert isinstance(
+        bitmap_definition.dp_type(mock_device), DPCodeBitmapBitWrapper
+    )
+
+
+@pytest.mark.parametrize(
+    ("step", "match"),
+    [
+        ({"register": {}}, "Unknown quirk step"),
+        (
+            {
+                "add_sensor": {
+                    "key": "key",
+                    "dp_type": {"wrapper": "Missing", "dpcode": "demo"},
+                }
+            },
+            "Unknown wrapper reference",
+        ),
+    ],
+)
+def test_create_quirks_invalid(step: dict[str, Any], match: str) -> None:
+    """Test invalid declarative data is rejected."""
+    with pytest.raises(ValueError, match=match):
+        declarative.create_quirks([[step]], pathlib.Path("quirks.json"))
+
+
+def test_register_declarative_quirks(tmp_path: pathlib.Path) -> None:
+    """Test declarative quirks are loaded from the compiled cache."""
+    custom_path = tmp_path / "custom"
+    custom_path.mkdir()
+    quirks_file = custom_path / "quirks.json"
+    quirks_file.write_text(json.dumps(QUIRK_DATA))
+    cache_dir = tmp_path / "cache"
+
+    registry = QuirksRegistry()
+    register_tuya_quirks(
+        str(custom_path), registry=registry, cache_dir=str(cache_dir)
+    )
+    assert ("declarative", "product_id") in registry
+    assert (cache_dir / DECLARATIVE_CACHE_FILE).is_file()
+
+    # Unchanged files are loaded from the compiled cache
+    cache_file = cache_dir / DECLARATIVE_CACHE_FILE
+    compiled = declarative._load_compiled(cache_file)
+    _signature, data = compiled[str(quirks_file)]
+    data[0][0]["applies_to"]["category"] = "compiled"
+    declarative._write_compiled(cache_file, compiled)
+    registry = QuirksRegistry()
+    register_tuya_quirks(
+        str(custom_path), registry=registry, cache_dir=str(cache_dir)
+    )
+    assert ("compiled", "product_id") in registry
+
+    # Deleted files have their quirks removed
+    quirks_file.unlink()
+    register_tuya_quirks(
+        str(custom_path), registry=registry, cache_dir=str(cache_dir)
+    )
+    assert ("compiled", "product_id") not in registry
+
+
+def test_reload_declarative_quirks(tmp_path: pathlib.Path) -> None:
+    """Test declarative quirks are only re-created if their content changed."""
+    quirks_file = tmp_path / "quirks.json"
+    quirks_file.write_text(json.dumps(QUIRK_DATA))
+    cache_file = tmp_path / "cache" / DECLARATIVE_CACHE_FILE
+    registry = QuirksRegistry()
+    assert declarative.register_declarative_quirks(
+        registry, tmp_path, cache_file
+    ) == ({quirks_file}, True)
+    assert ("declarative", "product_id") in registry
+
+    # Unchanged files are not re-created, even if touched
+    stat = quirks_file.stat()
+    os.utime(quirks_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert declarative.register_declarative_quirks(
+        registry, tmp_path, cache_file
+    ) == ({quirks_file}, False)
+    signature = registry.get_file_signature(quirks_file)
+    assert signature is not None
+    assert signature[0] == stat.st_mtime_ns + 10**9
+    compiled = declarative._load_compiled(cache_file)
+    assert compiled[str(quirks_file)][0] == signature
+
+    # Changed files are re-created, even with the same size
+    quirks_file.write_text(
+        json.dumps(QUIRK_DATA).replace(
+            '"product_id": "product_id"', '"product_id": "product_xx"'
+        )
+    )
+    assert quirks_file.stat().st_size == stat.st_size
+    assert declarative.register_declarative_quirks(
+        registry, tmp_path, cache_file
+    ) == ({quirks_file}, True)
+    assert ("declarative", "product_id") not in registry
+    assert ("declarative", "product_xx") in registry
@@ -0,0 +1,98 @@
+"""Test import time"""
+
+import subprocess
+import sys
+
+import pytest
+
+# Generous, only meant to catch large regressions on slow CI runners
+IMPORT_TIME_THRESHOLD_US = 250_000
+
+QUIRK_IMPORTS = (
+    "from tuya_device_handlers import TUYA_QUIRKS_REGISTRY;"
+    "from tuya_device_handlers.builder import TuyaDeviceQuirk;"
+    "from tuya_device_handlers.device_wrapper.common import"
+    " DPCodeBooleanWrapper"
+)
+
+
+def _get_imported_modules(code: str) -> set[str]:
+    """Get the modules imported by running code in a fresh interpreter."""
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys; before = set(sys.modules);"
+            f"{code};"
+            "print(*sorted(set(sys.modules) - before))",
+        ],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize(
+    ("code", "deferred_modules"),
+    [
+        (
+            "import tuya_device_handlers",
+            {
+                "tuya_device_handlers.registry",
+                "tuya_device_handlers.builder",
+                "tuya_device_handlers.device_wrapper",
+                "tuya_device_handlers.helpers",
+            },
+        ),
+        (
+            "import tuya_device_handlers.builder",
+            {
+                "tuya_device_handlers.builder.base_quirk",
+                "tuya_device_handlers.device_wrapper",
+            },
+        ),
+        (
+            "import tuya_device_handlers.devices",
+            {
+                "asyncio",
+                "hashlib",
+                "json",
+                "marshal",
+                "tempfile",
+                "tuya_device_handlers.builder.declarative",
+            },
+        ),
+        (
+            QUIRK_IMPORTS,
+            {
+                "base64",
+                "tuya_device_handlers.helpers.homeassistant",
+                "tuya_device_handlers.device_wrapper.router",
+            },
+        ),
+    ],
+)
+def test_deferred_imports(code: str, deferred_modules: set[str]) -> None:
+    """Test heavy modules are only imported on first use."""
+    assert not _get_imported_modules(code) & deferred_modules
+
+
+def test_import_time() -> None:
+    """Test the import time of a quirks module stays within budget."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", QUIRK_IMPORTS],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    # Format: "import time: self [us] | cumulative | imported package"
+    total = sum(
+        int(cumulative)
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+        and (parts := line.removeprefix("import time:").split("|"))
+        and (cumulative := parts[1].strip()).isdigit()
+        and parts[2].startswith(" tuya_device_handlers")
+    )
+    assert 0 < total < IMPORT_TIME_THRESHOLD_US
@@ -0,0 +1,189 @@
+"""Test DeviceProfile"""
+
+import copy
+import dataclasses
+from unittest.mock import Mock
+
+import pytest
+from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+from tuya_device_handlers.builder import TuyaDeviceQuirk, base_quirk
+from tuya_device_handlers.device_wrapper.common import (
+    DPCodeBooleanWrapper,
+    DPCodeEnumWrapper,
+    DPCodeIntegerWrapper,
+)
+from tuya_device_handlers.device_wrapper.sensor import DeltaIntegerWrapper
+
+
+def _create_quirk(generator_mock: Mock) -> TuyaDeviceQuirk:
+    """Create a quirk with a tracked generator."""
+
+    def _integer_generator(
+        device: CustomerDevice,
+    ) -> DPCodeIntegerWrapper | None:
+        generator_mock(device)
+        return DPCodeIntegerWrapper.find_dpcode(device, "demo_integer")
+
+    return (
+        TuyaDeviceQuirk()
+        .applies_to(category="demo", product_id="product_id")
+        .add_sensor(key="demo_integer", dp_type=_integer_generator)
+        .add_sensor(
+            key="demo_integer_sum",
+            dp_type=lambda device: DeltaIntegerWrapper.find_dpcode(
+                device, "demo_integer_sum"
+            ),
+        )
+        .add_select(
+            key="demo_enum",
+            dp_type=lambda device: DPCodeEnumWrapper.find_dpcode(
+                device, "demo_enum", prefer_function=True
+            ),
+            translation_key="demo_enum",
+            translation_string="Demo enum",
+        )
+        .add_switch(
+            key="demo_boolean",
+            dp_type=lambda device: DPCodeBooleanWrapper.find_dpcode(
+                device, "demo_boolean", prefer_function=True
+            ),
+        )
+        .add_cover(
+            key="demo_cover",
+            translation_key="demo_cover",
+            translation_string="Demo cover",
+            get_position_dp_type=lambda device: (
+                DPCodeIntegerWrapper.find_dpcode(device, "demo_integer")
+            ),
+        )
+    )
+
+
+def test_compile(mock_device: CustomerDevice) -> None:
+    """Test TuyaDeviceQuirk.compile."""
+    generator_mock = Mock()
+    quirk = _create_quirk(generator_mock)
+
+    profile = quirk.compile(mock_device)
+
+    assert profile.climate == ()
+    assert [item.definition for item in profile.sensor] == (
+        quirk.sensor_definitions
+    )
+    assert isinstance(
+        profile.sensor[0].wrappers["dp_type"], DPCodeIntegerWrapper
+    )
+    assert isinstance(
+        profile.sensor[1].wrappers["dp_type"], DeltaIntegerWrapper
+    )
+    assert isinstance(profile.select[0].wrappers["dp_type"], DPCodeEnumWrapper)
+    assert isinstance(
+        profile.switch[0].wrappers["dp_type"], DPCodeBooleanWrapper
+    )
+    assert profile.cover[0].wrappers == {
+        "get_state_dp_type": None,
+        "set_state_dp_type": None,
+        "get_position_dp_type": profile.cover[0].wrappers[
+            "get_position_dp_type"
+        ],
+        "set_position_dp_type": None,
+    }
+    assert isinstance(
+        profile.cover[0].wrappers["get_position_dp_type"], DPCodeIntegerWrapper
+    )
+    generator_mock.assert_called_once_with(mock_device)
+
+
+def test_compile_cached(mock_device: CustomerDevice) -> None:
+    """Test TuyaDeviceQuirk.compile is cached per spec fingerprint."""
+    generator_mock = Mock()
+    quirk = _create_quirk(generator_mock)
+
+    other_device = copy.copy(mock_device)
+    other_device.id = "other_device_id"
+    other_device.status = {"demo_integer_sum": 10}
+
+    first = quirk.compile(mock_device)
+    second = quirk.compile(other_device)
+    generator_mock.assert_called_once_with(mock_device)
+
+    # Wrappers are shared by definition, but not between devices
+    first_wrapper = first.sensor[1].wrappers["dp_type"]
+    second_wrapper = second.sensor[1].wrappers["dp_type"]
+    assert isinstance(first_wrapper, DeltaIntegerWrapper)
+    assert isinstance(second_wrapper, DeltaIntegerWrapper)
+    assert first_wrapper is not second_wrapper
+    assert first_wrapper.type_information is second_wrapper.type_information
+
+    # Per-device state is not shared
+    assert (
+        second_wrapper.skip_update(
+            other_device, ["demo_integer_sum"], {"demo_integer_sum": 1}
+        )
+        is False
+    )
+    assert second_wrapper.read_device_status(other_device) == 1
+    assert first_wrapper.read_device_status(mock_device) == 0
+
+    # Mutable wrapper state is not shared
+    first_enum_wrapper = first.select[0].wrappers["dp_type"]
+    second_enum_wrapper = second.select[0].wrappers["dp_type"]
+    assert isinstance(first_enum_wrapper, DPCodeEnumWrapper)
+    assert isinstance(second_enum_wrapper, DPCodeEnumWrapper)
+    first_enum_wrapper.options.append("other")
+    assert "other" not in second_enum_wrapper.options
+    third_enum_wrapper = (
+        quirk.compile(other_device).select[0].wrappers["dp_type"]
+    )
+    assert isinstance(third_enum_wrapper, DPCodeEnumWrapper)
+    assert "other" not in third_enum_wrapper.options
+
+    # Adding a definition resets the cache
+    quirk.add_sensor(
+        key="demo_integer_2",
+        dp_type=lambda device: DPCodeIntegerWrapper.find_dpcode(
+            device, "demo_integer"
+        ),
+    )
+    assert len(quirk.compile(mock_device).sensor) == 3
+    assert generator_mock.call_count == 2
+
+    # Wrappers are read-only
+    with pytest.raises(TypeError):
+        first.sensor[0].wrappers["dp_type"] = None  # type: ignore[index]
+
+
+def test_compile_cache_size(
+    mock_device: CustomerDevice, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the profiles of a quirk are bounded, oldest first."""
+    monkeypatch.setattr(base_quirk, "PROFILE_CACHE_SIZE", 2)
+    generator_mock = Mock()
+    quirk = _create_quirk(generator_mock)
+    for value in ("first", "second", "third"):
+        mock_device.function["demo_integer"].values = value
+        quirk.compile(mock_device)
+    assert generator_mock.call_count == 3
+    quirk.compile(mock_device)
+    assert generator_mock.call_count == 3
+
+    # Oldest profile was evicted
+    mock_device.function["demo_integer"].values = "first"
+    quirk.compile(mock_device)
+    assert generator_mock.call_count == 4
+
+
+def test_definitions_slots() -> None:
+    """Test definitions are slotted and frozen."""
+    quirk = _create_quirk(Mock()).add_dpid_boolean(dpid=1, dpcode="switch")
+
+    sensor_definition = quirk.sensor_definitions[0]
+    assert not hasattr(sensor_definition, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        sensor_definition.key = "other"  # type: ignore[misc]
+
+    datapoint_definition = quirk.datapoint_definitions[1]
+    assert not hasattr(datapoint_definition, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        datapoint_definition.dpcode = "other"  # type: ignore[misc]
@@ -2,6 +2,7 @@
 
 import base64
 import dataclasses
+import math
 
 import pytest
 from syrupy.assertion import SnapshotAssertion
@@ -41,3 +42,37 @@ def test_electricity_data(
 
     asdict = None if raw_data is None else dataclasses.asdict(raw_data)
     assert asdict == snapshot
+
+
+def test_electricity_data_decode_many() -> None:
+    """Test ElectricityData.decode_many."""
+    frames = [
+        base64.b64decode(base64_string)
+        for base64_string in (
+            "Ag8JJQAASAAACAAAAAAACGME",
+            "CIsAK8MACWo=",
+            "",
+            "AQ8IgAAD6AAnEAANrAAw1FA=",
+        )
+    ]
+    # Frames can be decoded in place from a larger buffer
+    buffer = memoryview(b"".join(frames))
+    offsets = [0]
+    for frame in frames:
+        offsets.append(offsets[-1] + len(frame))
+    views = [
+        buffer[start:end]
+        for start, end in zip(offsets[:-1], offsets[1:], strict=True)
+    ]
+
+    columns = ElectricityData.decode_many(views)
+
+    assert len(columns) == len(frames)
+    for index, frame in enumerate(frames):
+        expected = ElectricityData.from_bytes(frame)
+        for field in dataclasses.fields(ElectricityData):
+            value = getattr(columns, field.name)[index]
+            if expected is None or getattr(expected, field.name) is None:
+                assert math.isnan(value)
+            else:
+                assert value == getattr(expected, field.name)
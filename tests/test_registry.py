@@ -0,0 +1,570 @@
+"""Test QuirksRegistry"""
+
+from collections.abc import Iterator
+import importlib.util
+import json
+import logging
+import marshal
+import os
+import pathlib
+import sys
+import threading
+from unittest.mock import Mock
+
+import pytest
+from tuya_sharing import CustomerDevice  # type: ignore[import-untyped]
+
+from tuya_device_handlers import (
+    TUYA_QUIRKS_REGISTRY,
+    devices,
+    registry as registry_module,
+)
+from tuya_device_handlers.builder import TuyaDeviceQuirk
+from tuya_device_handlers.registry import QuirksRegistry
+
+
+@pytest.fixture
+def registry() -> QuirksRegistry:
+    """Fresh registry, so that tests do not modify the default one."""
+    return QuirksRegistry()
+
+
+@pytest.fixture
+def default_registry() -> Iterator[QuirksRegistry]:
+    """Default registry, restored after the test."""
+    saved = TUYA_QUIRKS_REGISTRY.fork()
+    yield TUYA_QUIRKS_REGISTRY
+    TUYA_QUIRKS_REGISTRY._snapshot = saved._snapshot
+    TUYA_QUIRKS_REGISTRY._quirks_by_file = saved._quirks_by_file
+    TUYA_QUIRKS_REGISTRY._file_signatures = saved._file_signatures
+
+
+def test_manifest_up_to_date() -> None:
+    """Test the quirks manifest matches the quirks modules."""
+    assert devices._load_manifest() == devices.generate_manifest()
+
+
+def test_register_lazy(
+    registry: QuirksRegistry, mock_device: CustomerDevice
+) -> None:
+    """Test the lazy loader is only called on first lookup."""
+    mock_device.category = "lazy_category"
+    quirk = TuyaDeviceQuirk()
+    loader = Mock(
+        side_effect=lambda registry: registry.register(
+            "lazy_category", "product_id", quirk
+        )
+    )
+    registry.register_lazy("lazy_category", "product_id", loader)
+    assert ("lazy_category", "product_id") not in registry
+    loader.assert_not_called()
+
+    assert registry.get_quirk_for_device(mock_device) is quirk
+    assert registry.get_quirk_for_device(mock_device) is quirk
+    assert ("lazy_category", "product_id") in registry
+    loader.assert_called_once_with(registry)
+
+
+def test_stale_manifest(
+    registry: QuirksRegistry,
+    mock_device: CustomerDevice,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test a stale manifest falls back to loading all quirks modules."""
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "modules": devices._get_quirks_modules(),
+                "quirks": {
+                    "stale_category": {
+                        "product_id": "tuya_device_handlers.devices.missing"
+                    }
+                },
+            }
+        )
+    )
+    monkeypatch.setattr(devices, "MANIFEST_PATH", manifest_path)
+    import_quirks_modules = Mock(wraps=devices._import_quirks_modules)
+    monkeypatch.setattr(
+        devices, "_import_quirks_modules", import_quirks_modules
+    )
+
+    devices.register_tuya_quirks(registry=registry)
+    import_quirks_modules.assert_not_called()
+
+    mock_device.category = "stale_category"
+    with caplog.at_level(logging.WARNING):
+        assert registry.get_quirk_for_device(mock_device) is None
+    assert "Quirks manifest is stale" in caplog.text
+    assert import_quirks_modules.call_count == 2
+    import_quirks_modules.assert_called_with(
+        devices._get_quirks_modules(), registry
+    )
+
+    # Loader is only called once
+    assert registry.get_quirk_for_device(mock_device) is None
+    assert import_quirks_modules.call_count == 2
+
+
+_CUSTOM_QUIRK = """
+from tuya_device_handlers import TUYA_QUIRKS_REGISTRY
+from tuya_device_handlers.builder import TuyaDeviceQuirk
+from tuya_device_handlers.registry import QuirksRegistry
+
+(
+    TuyaDeviceQuirk()
+    .applies_to(category="{category}", product_id="product_id")
+    .register(TUYA_QUIRKS_REGISTRY)
+)
+"""
+
+
+def _get_registry_quirk(
+    registry: QuirksRegistry, category: str
+) -> TuyaDeviceQuirk | None:
+    device = Mock(category=category, product_id="product_id")
+    return registry.get_quirk_for_device(device)
+
+
+def test_reload_custom_quirks(
+    registry: QuirksRegistry, tmp_path: pathlib.Path
+) -> None:
+    """Test only changed custom quirk files are reloaded."""
+    first_file = tmp_path / "custom_reload_first.py"
+    second_file = tmp_path / "custom_reload_second.py"
+    first_file.write_text(_CUSTOM_QUIRK.format(category="custom_first"))
+    second_file.write_text(_CUSTOM_QUIRK.format(category="custom_second"))
+
+    devices.register_tuya_quirks(str(tmp_path), registry=registry)
+    first_quirk = _get_registry_quirk(registry, "custom_first")
+    second_quirk = _get_registry_quirk(registry, "custom_second")
+    assert first_quirk is not None
+    assert first_quirk.quirk_file == first_file
+    assert second_quirk is not None
+
+    # Unchanged files are not executed again, even if touched
+    devices.register_tuya_quirks(str(tmp_path), registry=registry)
+    assert _get_registry_quirk(registry, "custom_first") is first_quirk
+    assert _get_registry_quirk(registry, "custom_second") is second_quirk
+    stat = first_file.stat()
+    os.utime(first_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    devices.register_tuya_quirks(str(tmp_path), registry=registry)
+    assert _get_registry_quirk(registry, "custom_first") is first_quirk
+    signature = registry.get_file_signature(first_file)
+    assert signature is not None
+    assert signature[0] == stat.st_mtime_ns + 10**9
+
+    # Changed files are executed again, and their stale quirks removed
+    first_file.write_text(_CUSTOM_QUIRK.format(category="custom_renamed"))
+    devices.register_tuya_quirks(str(tmp_path), registry=registry)
+    assert _get_registry_quirk(registry, "custom_first") is None
+    assert _get_registry_quirk(registry, "custom_renamed") is not None
+    assert _get_registry_quirk(registry, "custom_second") is second_quirk
+
+    # Deleted files have their quirks removed
+    second_file.unlink()
+    devices.register_tuya_quirks(str(tmp_path), registry=registry)
+    assert _get_registry_quirk(registry, "custom_second") is None
+    assert _get_registry_quirk(registry, "custom_renamed") is not None
+
+    registry.purge_custom_quirks(str(tmp_path))
+    assert _get_registry_quirk(registry, "custom_renamed") is None
+    assert registry.get_quirk_files(str(tmp_path)) == []
+
+
+def test_wildcard_rules(registry: QuirksRegistry) -> None:
+    """Test exact matches take priority over the longest prefix."""
+    category_quirk = TuyaDeviceQuirk()
+    short_quirk = TuyaDeviceQuirk()
+    long_quirk = TuyaDeviceQuirk()
+    exact_quirk = TuyaDeviceQuirk()
+    registry.register("wildcard", "*", category_quirk)
+    registry.register("wildcard", "abc*", short_quirk)
+    assert _get_registry_quirk(registry, "wildcard") is category_quirk
+
+    def _get_product_quirk(product_id: str) -> TuyaDeviceQuirk | None:
+        device = Mock(category="wildcard", product_id=product_id)
+        return registry.get_quirk_for_device(device)
+
+    assert _get_product_quirk("abcdef") is short_quirk
+
+    # Registering a rule invalidates the compiled matcher
+    registry.register("wildcard", "abcd*", long_quirk)
+    registry.register("wildcard", "abcdef", exact_quirk)
+    assert _get_product_quirk("abcdef") is exact_quirk
+    assert _get_product_quirk("abcdeg") is long_quirk
+    assert _get_product_quirk("abcx") is short_quirk
+    assert _get_product_quirk("ab") is category_quirk
+    assert _get_product_quirk("") is category_quirk
+    assert ("wildcard", "abc*") in registry
+
+
+@pytest.mark.parametrize(
+    ("category", "product_id"),
+    [("*", "product_id"), ("wildcard", "a*c"), ("wildcard", "**")],
+)
+def test_wildcard_rules_invalid(
+    registry: QuirksRegistry, category: str, product_id: str
+) -> None:
+    """Test unsupported wildcard rules are rejected."""
+    with pytest.raises(ValueError, match="Wildcards are"):
+        registry.register(category, product_id, TuyaDeviceQuirk())
+
+
+def test_resolution_cache(registry: QuirksRegistry) -> None:
+    """Test resolutions are cached per device, including missing quirks."""
+    registry.clear_cache()
+    device = Mock(id="cached_id", category="cached", product_id="product_id")
+
+    assert registry.get_quirk_for_device(device) is None
+    assert registry.get_quirk_for_device(device) is None
+    assert registry.get_cache_info() == (1, 1, 1)
+
+    # Registering a quirk invalidates the cache
+    quirk = TuyaDeviceQuirk()
+    registry.register("cached", "product_id", quirk)
+    assert registry.get_cache_info() == (1, 1, 0)
+    assert registry.get_quirk_for_device(device) is quirk
+    assert registry.get_quirk_for_device(device) is quirk
+    assert registry.get_cache_info() == (2, 2, 1)
+
+    # Purging a quirk file invalidates the cache
+    registry.purge_quirk_file(quirk.quirk_file)
+    assert registry.get_quirk_for_device(device) is None
+
+    registry.clear_cache()
+    assert registry.get_cache_info() == (0, 0, 0)
+
+
+def test_resolution_cache_eviction(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the oldest resolutions are evicted from a full cache."""
+    monkeypatch.setattr(registry_module, "RESOLUTION_CACHE_SIZE", 2)
+    registry = QuirksRegistry()
+    mock_devices = [
+        Mock(id=f"evicted_{index}", category="evicted", product_id="product")
+        for index in range(3)
+    ]
+    for device in mock_devices:
+        assert registry.get_quirk_for_device(device) is None
+    assert registry.get_cache_info() == (0, 3, 2)
+
+    # Only the oldest entry was evicted
+    assert registry.get_quirk_for_device(mock_devices[2]) is None
+    assert registry.get_quirk_for_device(mock_devices[1]) is None
+    assert registry.get_cache_info() == (2, 3, 2)
+
+
+def test_batch_writes() -> None:
+    """Test writes within a batch are published in a single snapshot."""
+    registry = QuirksRegistry()
+    quirk = TuyaDeviceQuirk()
+    loader = Mock()
+    with registry.batch_writes():
+        registry.register("batch", "product_1", quirk)
+        registry.register("batch", "product_2", quirk)
+        registry.register_lazy("batch", "lazy", loader)
+        assert ("batch", "product_1") not in registry
+    assert ("batch", "product_1") in registry
+    assert ("batch", "product_2") in registry
+
+    with registry.batch_writes():
+        registry.purge_quirk_file(quirk.quirk_file)
+        registry.register("batch", "product_3", quirk)
+        assert ("batch", "product_1") in registry
+    assert ("batch", "product_1") not in registry
+    assert ("batch", "product_3") in registry
+    assert _get_registry_quirk(registry, "batch") is None
+    loader.assert_not_called()
+
+
+def test_batch_writes_error() -> None:
+    """Test writes within a batch are discarded if an exception is raised."""
+    registry = QuirksRegistry()
+    quirk = TuyaDeviceQuirk()
+    registry.register("batch", "product_1", quirk)
+    registry.set_file_signature(quirk.quirk_file, (1, 2, "digest"))
+
+    def _failing_batch() -> None:
+        with registry.batch_writes():
+            registry.purge_quirk_file(quirk.quirk_file)
+            registry.register("batch", "product_2", quirk)
+            registry.set_file_signature(quirk.quirk_file, (3, 4, "other"))
+            raise RuntimeError("Boom")
+
+    with pytest.raises(RuntimeError, match="Boom"):
+        _failing_batch()
+    assert ("batch", "product_1") in registry
+    assert ("batch", "product_2") not in registry
+    assert registry.get_file_signature(quirk.quirk_file) == (1, 2, "digest")
+
+    registry.purge_quirk_file(quirk.quirk_file)
+    assert ("batch", "product_1") not in registry
+    assert registry.get_quirk_files() == []
+
+
+def test_concurrent_purge(registry: QuirksRegistry) -> None:
+    """Test readers never see a partially purged quirk file."""
+    quirk = TuyaDeviceQuirk()
+    registrations = [
+        ("concurrent", f"product_{index}", quirk) for index in range(50)
+    ]
+    registry.register_many(registrations)
+    stop = threading.Event()
+
+    def _mutate() -> None:
+        while not stop.is_set():
+            registry.purge_quirk_file(quirk.quirk_file)
+            registry.register_many(registrations)
+
+    writer = threading.Thread(target=_mutate)
+    writer.start()
+    try:
+        for _ in range(200):
+            registered = [
+                product_id
+                for _category, product_id, registered_quirk in (
+                    registry.iter_quirks()
+                )
+                if registered_quirk is quirk
+            ]
+            assert len(registered) in (0, 50)
+    finally:
+        stop.set()
+        writer.join()
+
+
+def test_independent_registries(
+    default_registry: QuirksRegistry, tmp_path: pathlib.Path
+) -> None:
+    """Test registries are independent, and can be forked."""
+    quirk = TuyaDeviceQuirk()
+    default_registry.register("default_only", "product_id", quirk)
+
+    registry = QuirksRegistry()
+    assert ("default_only", "product_id") in default_registry
+    assert ("default_only", "product_id") not in registry
+
+    # Custom quirks are loaded into the target registry
+    custom_file = tmp_path / "custom_tenant.py"
+    custom_file.write_text(_CUSTOM_QUIRK.format(category="tenant"))
+    devices.register_tuya_quirks(str(tmp_path), registry=registry)
+    assert ("tenant", "product_id") in registry
+    assert ("tenant", "product_id") not in default_registry
+
+    # Forks share the registrations, but not further changes
+    fork = registry.fork()
+    fork.register("fork_only", "product_id", quirk)
+    assert ("tenant", "product_id") in fork
+    assert ("fork_only", "product_id") not in registry
+    fork.purge_custom_quirks(str(tmp_path))
+    assert ("tenant", "product_id") not in fork
+    assert ("tenant", "product_id") in registry
+
+
+_BUILTIN_QUIRK = """
+from tuya_device_handlers import TUYA_QUIRKS_REGISTRY
+from tuya_device_handlers.builder import TuyaDeviceQuirk
+
+(
+    TuyaDeviceQuirk()
+    .applies_to(category="builtin", product_id="overridden")
+    .applies_to(category="builtin", product_id="product_id")
+    .register(TUYA_QUIRKS_REGISTRY)
+)
+"""
+
+
+def test_builtin_quirks_keep_custom_quirks(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: pathlib.Path
+) -> None:
+    """Test built-in quirks are loaded into the target registry only.
+
+    Custom quirks overriding a built-in quirk are never replaced by it.
+    """
+    modules_path = tmp_path / "modules"
+    modules_path.mkdir()
+    (modules_path / "builtin_quirks_module.py").write_text(_BUILTIN_QUIRK)
+    monkeypatch.syspath_prepend(str(modules_path))
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "modules": ["builtin_quirks_module"],
+                "quirks": {
+                    "builtin": {
+                        "overridden": "builtin_quirks_module",
+                        "product_id": "builtin_quirks_module",
+                    }
+                },
+            }
+        )
+    )
+    monkeypatch.setattr(devices, "MANIFEST_PATH", manifest_path)
+    monkeypatch.setattr(
+        devices, "_get_quirks_modules", lambda: ["builtin_quirks_module"]
+    )
+    custom_path = tmp_path / "custom"
+    custom_path.mkdir()
+    custom_file = custom_path / "custom_override.py"
+    custom_file.write_text(
+        _CUSTOM_QUIRK.format(category="builtin").replace(
+            '"product_id"', '"overridden"'
+        )
+    )
+
+    registry = QuirksRegistry()
+    devices.register_tuya_quirks(str(custom_path), registry=registry)
+    builtin_quirk = _get_registry_quirk(registry, "builtin")
+    assert builtin_quirk is not None
+    assert builtin_quirk.quirk_file == modules_path / "builtin_quirks_module.py"
+    device = Mock(category="builtin", product_id="overridden")
+    custom_quirk = registry.get_quirk_for_device(device)
+    assert custom_quirk is not None
+    assert custom_quirk.quirk_file == custom_file
+    assert ("builtin", "product_id") not in TUYA_QUIRKS_REGISTRY
+
+    # Built-in quirks modules are only loaded once per registry
+    devices.register_tuya_quirks(str(custom_path), registry=registry)
+    assert registry.get_quirk_for_device(device) is custom_quirk
+    assert _get_registry_quirk(registry, "builtin") is builtin_quirk
+
+
+@pytest.mark.asyncio
+async def test_async_register_tuya_quirks(tmp_path: pathlib.Path) -> None:
+    """Test custom quirks are loaded from the executor, with progress."""
+    for category in ("async_first", "async_second"):
+        (tmp_path / f"custom_{category}.py").write_text(
+            _CUSTOM_QUIRK.format(category=category)
+        )
+    registry = QuirksRegistry()
+    progress_callback = Mock()
+
+    await devices.async_register_tuya_quirks(
+        str(tmp_path), registry=registry, progress_callback=progress_callback
+    )
+
+    assert ("async_first", "product_id") in registry
+    assert ("async_second", "product_id") in registry
+    assert [call.args for call in progress_callback.call_args_list] == [
+        (1, 2),
+        (2, 2),
+    ]
+
+
+_ASYNC_BUILTIN_QUIRK = """
+from tuya_device_handlers import TUYA_QUIRKS_REGISTRY
+from tuya_device_handlers.builder import TuyaDeviceQuirk
+
+(
+    TuyaDeviceQuirk()
+    .applies_to(category="async_builtin", product_id="{product_id}")
+    .register(TUYA_QUIRKS_REGISTRY)
+)
+"""
+
+
+@pytest.mark.asyncio
+async def test_async_register_builtin_quirks(
+    registry: QuirksRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test built-in quirks modules are imported in executor chunks."""
+    modnames = [f"async_builtin_{index}" for index in range(3)]
+    for modname in modnames:
+        (tmp_path / f"{modname}.py").write_text(
+            _ASYNC_BUILTIN_QUIRK.format(product_id=modname)
+        )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.setattr(devices, "_get_quirks_modules", lambda: modnames)
+    monkeypatch.setattr(devices, "QUIRKS_MODULES_CHUNK_SIZE", 2)
+    import_threads: list[int] = []
+    import_quirks_modules = devices._import_quirks_modules
+
+    def _import_in_thread(
+        chunk: list[str], target_registry: QuirksRegistry
+    ) -> None:
+        import_threads.append(threading.get_ident())
+        import_quirks_modules(chunk, target_registry)
+
+    monkeypatch.setattr(devices, "_import_quirks_modules", _import_in_thread)
+    progress_callback = Mock()
+
+    await devices.async_register_tuya_quirks(
+        registry=registry, progress_callback=progress_callback
+    )
+
+    # Loaded before any lookup, outside of the event loop
+    for modname in modnames:
+        assert ("async_builtin", modname) in registry
+    assert len(import_threads) == 2
+    assert threading.get_ident() not in import_threads
+    assert [call.args for call in progress_callback.call_args_list] == [
+        (1, 2),
+        (2, 2),
+    ]
+
+
+def test_bytecode_cache(tmp_path: pathlib.Path) -> None:
+    """Test compiled custom quirks are cached, and reused."""
+    custom_path = tmp_path / "custom"
+    custom_path.mkdir()
+    custom_file = custom_path / "custom_cached.py"
+    custom_file.write_text(_CUSTOM_QUIRK.format(category="cached_first"))
+    cache_dir = tmp_path / "cache"
+
+    registry = QuirksRegistry()
+    devices.register_tuya_quirks(
+        str(custom_path), registry=registry, cache_dir=str(cache_dir)
+    )
+    quirk = _get_registry_quirk(registry, "cached_first")
+    assert quirk is not None
+    assert quirk.quirk_file == custom_file
+    (cache_file,) = cache_dir.iterdir()
+    assert cache_file.name.startswith("custom_cached.")
+    assert cache_file.name.endswith(
+        f".{importlib.util.MAGIC_NUMBER.hex()}-opt{sys.flags.optimize}.bin"
+    )
+
+    # Cached code is used on subsequent starts
+    cache_file.write_bytes(
+        marshal.dumps(
+            compile(
+                _CUSTOM_QUIRK.format(category="cached_second"),
+                str(custom_file),
+                "exec",
+            )
+        )
+    )
+    registry = QuirksRegistry()
+    devices.register_tuya_quirks(
+        str(custom_path), registry=registry, cache_dir=str(cache_dir)
+    )
+    assert _get_registry_quirk(registry, "cached_first") is None
+    assert _get_registry_quirk(registry, "cached_second") is not None
+
+    # Stale entries are replaced, invalid entries are ignored
+    submodule_cache_file = cache_dir / cache_file.name.replace(
+        "custom_cached.", "custom_cached.submodule.", 1
+    )
+    submodule_cache_file.write_bytes(b"submodule")
+    custom_file.write_text(_CUSTOM_QUIRK.format(category="cached_third"))
+    registry = QuirksRegistry()
+    devices.register_tuya_quirks(
+        str(custom_path), registry=registry, cache_dir=str(cache_dir)
+    )
+    assert _get_registry_quirk(registry, "cached_third") is not None
+    # Entries of other modules are kept
+    assert submodule_cache_file.exists()
+    submodule_cache_file.unlink()
+    (new_cache_file,) = cache_dir.iterdir()
+    assert new_cache_file != cache_file
+    new_cache_file.write_bytes(b"invalid")
+    registry = QuirksRegistry()
+    devices.register_tuya_quirks(
+        str(custom_path), registry=registry, cache_dir=str(cache_dir)
+    )
+    assert _get_registry_quirk(registry, "cached_third") is not None
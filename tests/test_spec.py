@@ -0,0 +1,177 @@
+"""Test device specification helpers"""
+
+from unittest.mock import Mock
+
+import pytest
+from tuya_sharing import (  # type: ignore[import-untyped]
+    CustomerDevice,
+    DeviceFunction,
+    DeviceStatusRange,
+)
+
+from tuya_device_handlers import spec
+from tuya_device_handlers._bounded import BoundedDict
+from tuya_device_handlers.const import DPType
+from tuya_device_handlers.device_wrapper.binary_sensor import (
+    DPCodeBitmapBitWrapper,
+)
+from tuya_device_handlers.device_wrapper.common import DPCodeIntegerWrapper
+from tuya_device_handlers.spec import (
+    DeviceSpecIndex,
+    DPDefinition,
+    forget_spec_fingerprint,
+    get_spec_fingerprint,
+)
+from tuya_device_handlers.type_information import (
+    BitmapTypeInformation,
+    BooleanTypeInformation,
+    EnumTypeInformation,
+    IntegerTypeInformation,
+    JsonTypeInformation,
+    RawTypeInformation,
+    StringTypeInformation,
+    TypeInformation,
+)
+
+
+def test_device_spec_index(mock_device: CustomerDevice) -> None:
+    """Test DeviceSpecIndex.from_device."""
+    spec_index = DeviceSpecIndex.from_device(mock_device)
+
+    assert set(spec_index.specs) == set(mock_device.function) | set(
+        mock_device.status_range
+    )
+    assert spec_index.get("invalid") is None
+
+    assert (dp_spec := spec_index.get("demo_integer_sum"))
+    assert dp_spec.report_type == "sum"
+    assert dp_spec.status_range == DPDefinition(
+        DPType.INTEGER,
+        '{"unit": "%","min": 0,"max": 1000,"scale": 1,"step": 1}',
+    )
+
+    # Function only
+    assert (dp_spec := spec_index.get("demo_enum_missing_values"))
+    assert dp_spec.report_type is None
+    assert dp_spec.status_range is None
+    assert dp_spec.function == DPDefinition(DPType.ENUM, "{}")
+
+
+@pytest.mark.parametrize(
+    ("type_information_type", "dpcode"),
+    [
+        (BitmapTypeInformation, "demo_bitmap"),
+        (BooleanTypeInformation, "demo_boolean"),
+        (EnumTypeInformation, "demo_enum"),
+        (IntegerTypeInformation, "demo_integer"),
+        (IntegerTypeInformation, "demo_integer_sum"),
+        (JsonTypeInformation, "demo_json"),
+        (RawTypeInformation, "demo_raw"),
+        (StringTypeInformation, "demo_string"),
+        (IntegerTypeInformation, ("invalid", "demo_integer")),
+        (EnumTypeInformation, "demo_enum_missing_values"),
+        (BooleanTypeInformation, "demo_integer"),
+        (StringTypeInformation, "invalid"),
+        (StringTypeInformation, None),
+    ],
+)
+def test_find_dpcode_with_index(
+    type_information_type: type[TypeInformation],
+    dpcode: str | tuple[str, ...] | None,
+    mock_device: CustomerDevice,
+) -> None:
+    """Test find_dpcode gives the same result with a DeviceSpecIndex."""
+    spec_index = DeviceSpecIndex.from_device(mock_device)
+
+    assert type_information_type.find_dpcode(
+        spec_index, dpcode
+    ) == type_information_type.find_dpcode(mock_device, dpcode)
+
+
+def test_find_dpcode_prefer_function(mock_device: CustomerDevice) -> None:
+    """Test find_dpcode with prefer_function and a DeviceSpecIndex."""
+    mock_device.function["demo_integer"] = DeviceFunction(
+        code="demo_integer",
+        type="Integer",
+        values='{"unit": "%","min": 0,"max": 100,"scale": 0,"step": 1}',
+    )
+    spec_index = DeviceSpecIndex.from_device(mock_device)
+
+    wrapper = DPCodeIntegerWrapper.find_dpcode(spec_index, "demo_integer")
+    assert wrapper
+    assert wrapper.type_information.max == 1000
+
+    wrapper = DPCodeIntegerWrapper.find_dpcode(
+        spec_index, "demo_integer", prefer_function=True
+    )
+    assert wrapper
+    assert wrapper.type_information.max == 100
+
+
+def test_bitmapbit_with_index(mock_device: CustomerDevice) -> None:
+    """Test DPCodeBitmapBitWrapper.find_dpcode with a DeviceSpecIndex."""
+    spec_index = DeviceSpecIndex.from_device(mock_device)
+
+    wrapper = DPCodeBitmapBitWrapper.find_dpcode(
+        spec_index, "demo_bitmap", bitmap_key="motor_fault"
+    )
+    assert wrapper
+    assert wrapper.read_device_status(mock_device) is True
+
+
+def test_spec_fingerprint(mock_device: CustomerDevice) -> None:
+    """Test get_spec_fingerprint."""
+    fingerprint = get_spec_fingerprint(mock_device)
+    assert get_spec_fingerprint(mock_device) == fingerprint
+
+    # Identical specs, different device and insertion order
+    other_device = Mock(spec=CustomerDevice)
+    other_device.id = "other_device_id"
+    other_device.function = dict(reversed(mock_device.function.items()))
+    other_device.status_range = dict(mock_device.status_range)
+    assert get_spec_fingerprint(other_device) == fingerprint
+    assert DeviceSpecIndex.for_device(
+        other_device
+    ) is DeviceSpecIndex.for_device(mock_device)
+
+    # Replacing the spec dictionary invalidates the fingerprint
+    other_device.status_range = {
+        **mock_device.status_range,
+        "demo_integer": DeviceStatusRange(
+            code="demo_integer",
+            type="Integer",
+            values='{"unit": "%","min": 0,"max": 1000,"scale": 1,"step": 1}',
+            report_type="sum",
+        ),
+    }
+    assert get_spec_fingerprint(other_device) != fingerprint
+    assert DeviceSpecIndex.for_device(
+        other_device
+    ) is not DeviceSpecIndex.for_device(mock_device)
+
+    # Adding a definition invalidates the fingerprint
+    mock_device.function["new_dpcode"] = DeviceFunction(
+        code="new_dpcode", type="Boolean", values="{}"
+    )
+    assert (new_fingerprint := get_spec_fingerprint(mock_device)) != fingerprint
+
+    # In-place changes invalidate the fingerprint
+    mock_device.function["new_dpcode"].type = "Integer"
+    assert (in_place_fingerprint := get_spec_fingerprint(mock_device)) not in (
+        fingerprint,
+        new_fingerprint,
+    )
+    forget_spec_fingerprint(mock_device.id)
+    assert get_spec_fingerprint(mock_device) == in_place_fingerprint
+
+
+def test_spec_fingerprint_cache_size(
+    mock_device: CustomerDevice, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the memoized fingerprints are bounded, oldest first."""
+    monkeypatch.setattr(spec, "_SPEC_FINGERPRINTS", BoundedDict(2))
+    device_ids = ["first_id", "second_id", "third_id"]
+    for device_id in device_ids:
+        mock_device.id = device_id
+        get_spec_fingerprint(mock_device)
+    assert list(spec._SPEC_FINGERPRINTS) == device_ids[1:]
@@ -1,6 +1,8 @@
 """Test TypeInformation classes"""
 
+import copy
 import dataclasses
+import pickle
 
 import pytest
 from syrupy.assertion import SnapshotAssertion
@@ -15,6 +17,8 @@ from tuya_device_handlers.type_information import (
     RawTypeInformation,
     StringTypeInformation,
     TypeInformation,
+    clear_type_information_cache,
+    get_type_information_cache_info,
 )
 
 
@@ -83,3 +87,128 @@ def test_integer_scaling(mock_device: CustomerDevice) -> None:
     assert type_information.scale == 1
     assert type_information.scale_value(150) == 15
     assert type_information.scale_value_back(15) == 150
+
+
+def test_type_information_cache(mock_device: CustomerDevice) -> None:
+    """Test that parsed type information is shared through the cache."""
+    clear_type_information_cache()
+
+    first = IntegerTypeInformation.find_dpcode(mock_device, "demo_integer")
+    second = IntegerTypeInformation.find_dpcode(mock_device, "demo_integer")
+    assert first is not None
+    assert first is second
+    assert get_type_information_cache_info().hits == 1
+    assert get_type_information_cache_info().misses == 1
+
+    # Same spec string, but a different dpcode or report type
+    other = IntegerTypeInformation.find_dpcode(mock_device, "demo_integer_sum")
+    assert other is not None
+    assert other is not first
+    assert other.report_type == "sum"
+    assert get_type_information_cache_info().misses == 2
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.scale = 2  # type: ignore[misc]
+
+    clear_type_information_cache()
+    assert get_type_information_cache_info().currsize == 0
+    assert (
+        IntegerTypeInformation.find_dpcode(mock_device, "demo_integer")
+        is not first
+    )
+
+
+def test_type_information_slots(mock_device: CustomerDevice) -> None:
+    """Test type information instances are slotted."""
+    type_information = IntegerTypeInformation.find_dpcode(
+        mock_device, "demo_integer"
+    )
+
+    assert type_information
+    assert not hasattr(type_information, "__dict__")
+
+
+def test_type_information_immutable(mock_device: CustomerDevice) -> None:
+    """Test shared type information cannot be modified through wrappers."""
+    enum_information = EnumTypeInformation.find_dpcode(mock_device, "demo_enum")
+    bitmap_information = BitmapTypeInformation.find_dpcode(
+        mock_device, "demo_bitmap"
+    )
+
+    assert enum_information
+    assert bitmap_information
+    assert isinstance(enum_information.range, tuple)
+    assert isinstance(bitmap_information.label, tuple)
+    assert hash(enum_information) == hash(
+        EnumTypeInformation.find_dpcode(mock_device, "demo_enum")
+    )
+    assert hash(bitmap_information)
+
+
+def test_enum_index() -> None:
+    """Test EnumTypeInformation ordinals."""
+    type_information = EnumTypeInformation(
+        dpcode="demo_enum", type_data="{}", range=("a", "b", "a", "c")
+    )
+
+    assert type_information.range_index == {"a": 0, "b": 1, "c": 3}
+    # The index is not part of the serialized fields
+    assert dataclasses.asdict(type_information) == {
+        "dpcode": "demo_enum",
+        "type_data": "{}",
+        "range": ("a", "b", "a", "c"),
+    }
+    assert type_information.get_ordinal("c") == 3
+    assert type_information.get_ordinal("d") is None
+    assert type_information.get_ordinal(["a"]) is None
+    # The index is not part of the comparison
+    assert type_information == EnumTypeInformation(
+        dpcode="demo_enum", type_data="{}", range=("a", "b", "a", "c")
+    )
+
+
+def test_bitmap_index() -> None:
+    """Test BitmapTypeInformation bits."""
+    type_information = BitmapTypeInformation(
+        dpcode="demo_bitmap", type_data="{}", label=("fault", "overheat")
+    )
+
+    assert type_information.get_bit("overheat") == 1
+    assert type_information.get_bit("unknown") is None
+
+
+def test_index_copy() -> None:
+    """Test copied and unpickled type informations keep their index."""
+    enum_information = EnumTypeInformation(
+        dpcode="demo_enum", type_data="{}", range=("a", "b")
+    )
+    bitmap_information = BitmapTypeInformation(
+        dpcode="demo_bitmap", type_data="{}", label=("fault", "overheat")
+    )
+    for copy_function in (copy.copy, copy.deepcopy, _pickle_copy):
+        assert copy_function(enum_information).get_ordinal("b") == 1
+        assert copy_function(bitmap_information).get_bit("overheat") == 1
+    # Identical ranges share their index
+    assert (
+        copy.deepcopy(enum_information).range_index
+        is enum_information.range_index
+    )
+
+
+def _pickle_copy[T](value: T) -> T:
+    return pickle.loads(pickle.dumps(value))  # type: ignore[no-any-return]
+
+
+def test_bitmap_decode() -> None:
+    """Test BitmapTypeInformation.decode."""
+    type_information = BitmapTypeInformation(
+        dpcode="demo_bitmap", type_data="{}", label=("a", "b", "c")
+    )
+
+    assert type_information.decode(0b101) == (frozenset({"a", "c"}), 0b111)
+    assert type_information.decode(0b101, 0b100) == (
+        frozenset({"a", "c"}),
+        0b001,
+    )
+    # Unlabelled bits are ignored
+    assert type_information.decode(0b1010, 0b0000) == (frozenset({"b"}), 0b010)